@@ -0,0 +1,290 @@
+"""
+Parser benchmark suite.
+
+Generates realistic Indonesian daily-report documents (every date format
+normalize_date handles, every time-block style, action plans, proof URLs and
+Google Docs UI noise) and measures throughput of parse_google_doc_text,
+normalize_date, normalize_time and plan_sync at 1k / 10k / 100k entries,
+plus the offline calendar HTML parser on calendar_dump.html.
+
+Usage:
+    python bench_parser.py                      # compare against bench_baseline.json
+    python bench_parser.py --sizes 1000 10000   # subset of sizes
+    python bench_parser.py --update-baseline    # store the current numbers as baseline
+
+Exits with code 1 if any measurement is slower than its baseline by more
+than the tolerance. Baselines are machine-specific: regenerate them when
+benchmarking on a different computer.
+"""
+
+import gc
+import os
+import sys
+import json
+import time
+import random
+import argparse
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from doc_parser import parse_google_doc_text
+from utils import normalize_date, normalize_time
+from calendar_parser import existing_entries_from_html
+from planner import plan_sync
+from entry import ExistingSlot
+
+CALENDAR_DUMP = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'calendar_dump.html')
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench_baseline.json')
+DEFAULT_SIZES = (1000, 10000, 100000)
+DEFAULT_TOLERANCE = 0.30
+# Short cases are repeated until this much time was measured, so a few ms of noise cannot fail the gate
+DEFAULT_MIN_TIME = 0.2
+# Cases faster than this per run are reported but not gated: scheduler noise exceeds the tolerance there
+MIN_GATED_RUN_TIME = 0.010
+
+MONTHS_ID = ['Januari', 'Februari', 'Maret', 'April', 'Mei', 'Juni', 'Juli',
+             'Agustus', 'September', 'Oktober', 'November', 'Desember']
+MONTHS_ID_SHORT = ['Jan', 'Feb', 'Mar', 'Apr', 'Mei', 'Jun', 'Jul', 'Agu', 'Sep', 'Okt', 'Nov', 'Des']
+MONTHS_EN = ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+             'August', 'September', 'October', 'November', 'December']
+
+# Every header shape normalize_date understands
+DATE_FORMATS = [
+    lambda d: f"{d.day} {MONTHS_ID[d.month - 1]} {d.year}",           # 2 Februari 2026
+    lambda d: f"{d.day:02d} {MONTHS_ID_SHORT[d.month - 1]} {d.year}",  # 02 Feb 2026
+    lambda d: f"{d.day} {MONTHS_EN[d.month - 1]} {d.year}",           # 2 February 2026
+    lambda d: d.isoformat(),                                          # 2026-02-02
+    lambda d: f"{d.year}/{d.month:02d}/{d.day:02d}",                  # 2026/02/02
+    lambda d: f"{d.day:02d}/{d.month:02d}/{d.year}",                  # 02/02/2026
+    lambda d: f"{d.day}-{d.month}-{d.year}",                          # 2-2-2026
+    lambda d: f"{d.day} {d.month} {d.year}",                          # 2 2 2026
+]
+
+# Every time-block style (start, end in minutes)
+TIME_FORMATS = [
+    lambda s, e: f"{s // 60:02d}{s % 60:02d} - {e // 60:02d}{e % 60:02d} :",     # 0730 - 1300 :
+    lambda s, e: f"{s // 60:02d}.{s % 60:02d}–{e // 60:02d}.{e % 60:02d}",       # 07.30–13.00
+    lambda s, e: f"{s // 60:02d}:{s % 60:02d} - {e // 60:02d}:{e % 60:02d}:",    # 07:30 - 13:00:
+    lambda s, e: f"{s // 60}:{s % 60:02d}-{e // 60}:{e % 60:02d}",               # 7:30-13:00
+    lambda s, e: f"{s // 60}{s % 60:02d} — {e // 60}{e % 60:02d} :",             # 730 — 1300 :
+]
+
+ACTIVITIES = [
+    "Meeting dan Penyetaraan Desain EKerjasama", "Coding dan local development",
+    "Presentasi progress ke Kesra", "Pengerjaan koreksi flow dan UI UX",
+    "Belajar perpajakan dan penggunaan coretax", "Apel fisik pagi hari senin",
+    "Meeting pembahasan ISO surveilance", "Pelanjutan pembuatan aplikasi",
+]
+DESCRIPTIONS = [
+    "Diskusi kebutuhan dengan tim", "Perbaikan bug pada modul laporan",
+    "Sinkronisasi data dengan server", "Penyusunan dokumen teknis",
+]
+
+EDITOR_PREFIX = (
+    "Laporan EKinerja Harian  Bulan Februari Tahun 2026\n"
+    "Minta akses edit\n \nBagikan\nLogin\nFileEditTampilanAlatBantuan\nTab dokumen\n"
+    "Laporan EKinerja Harian\n"
+)
+EDITOR_SUFFIX = (
+    "Aktifkan dukungan pembaca layar\n"
+    "Untuk mengaktifkan dukungan pembaca layar, tekan Ctrl+Alt+Z. "
+    "Untuk mempelajari pintasan keyboard, tekan Ctrl+garis miring.\n"
+    "Banner disembunyikan \n"
+)
+NOISE_LINES = ["Bagikan", "Minta akses edit", "Tab dokumen"]
+
+# Day slots: (start, end) minutes for 1-4 entries per day
+DAY_SLOTS = [
+    [(450, 960)],
+    [(450, 780), (780, 960)],
+    [(450, 780), (780, 900), (900, 960)],
+    [(450, 510), (510, 780), (780, 900), (900, 960)],
+]
+
+
+def generate_doc(n_entries: int, seed: int = 0, start: date = date(2025, 1, 1),
+                 editor_chrome: bool = True) -> str:
+    """
+    Builds a synthetic daily-report document with exactly n_entries time blocks
+    spread over consecutive weekdays.
+    """
+    rng = random.Random(seed)
+    parts = [EDITOR_PREFIX] if editor_chrome else []
+    day = start
+    produced = 0
+
+    while produced < n_entries:
+        while day.weekday() >= 5:
+            day += timedelta(days=1)
+
+        slots = rng.choice(DAY_SLOTS)[:n_entries - produced]
+        parts.append(rng.choice(DATE_FORMATS)(day) + "\n")
+
+        for s, e in slots:
+            lines = [rng.choice(TIME_FORMATS)(s, e) + " " + rng.choice(ACTIVITIES)]
+            style = rng.randrange(4)
+            if rng.random() < 0.5:
+                lines.append(rng.choice(DESCRIPTIONS))
+            if rng.random() < 0.3:
+                lines.append(f"https://drive.google.com/file/d/{rng.getrandbits(64):x}/view")
+            if style == 0:
+                lines[-1] += f" {rng.randint(1, 9)}"          # Trailing digit
+            elif style == 1:
+                lines.append(str(rng.randint(1, 9)))          # Standalone digit line
+            elif style == 2:
+                lines.append(f"Rencana Aksi: {rng.randint(1, 9)}")
+            elif rng.random() < 0.05:
+                # Noise never follows a digit: "1\nBagikan\n2026" reads as a date header
+                lines.append(rng.choice(NOISE_LINES))
+            parts.append("\n".join(lines) + "\n")
+
+        produced += len(slots)
+        day += timedelta(days=1)
+
+    if editor_chrome:
+        parts.append(EDITOR_SUFFIX)
+    return "".join(parts)
+
+
+def _best_time(func, repeat: int, min_time: float = DEFAULT_MIN_TIME) -> float:
+    """
+    Best single-run time over at least `repeat` runs and at least `min_time` seconds in total.
+    The garbage collector is paused while timing (as timeit does); its pauses were the main noise.
+    """
+    best = float('inf')
+    total = 0.0
+    runs = 0
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        while runs < repeat or total < min_time:
+            t0 = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - t0
+            best = min(best, elapsed)
+            total += elapsed
+            runs += 1
+            gc.collect()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best
+
+
+def run_benchmarks(sizes, repeat: int = 3, min_time: float = DEFAULT_MIN_TIME):
+    """Returns ({benchmark: {size: items_per_second}}, {benchmark: {size: best seconds per run}})."""
+    results, timings = {}, {}
+
+    def measure(name, key, items, func):
+        elapsed = _best_time(func, repeat, min_time)
+        timings.setdefault(name, {})[key] = elapsed
+        results.setdefault(name, {})[key] = items / elapsed
+
+    for size in sizes:
+        doc = generate_doc(size, seed=size)
+        entries = parse_google_doc_text(doc)
+        if len(entries) != size:
+            raise RuntimeError(f"Generator/parser mismatch: expected {size} entries, parsed {len(entries)}")
+
+        date_strs = [e.date_raw for e in entries]
+        time_strs = []
+        for e in entries:
+            time_strs.append(f"{e.start_min // 60}{e.start_min % 60:02d}")
+            time_strs.append(e.end_time.replace(':', '.'))
+
+        # Clear the memo caches so every run measures cold + warm lookups alike
+        def bench_dates():
+            normalize_date.cache_clear()
+            for d in date_strs:
+                normalize_date(d)
+
+        def bench_times():
+            normalize_time.cache_clear()
+            for t in time_strs:
+                normalize_time(t)
+
+        key = str(size)
+        measure('parse_google_doc_text', key, size, lambda: parse_google_doc_text(doc))
+        measure('normalize_date', key, len(date_strs), bench_dates)
+        measure('normalize_time', key, len(time_strs), bench_times)
+
+        # Every other entry is already on the calendar; the window covers the whole document
+        existing = {}
+        for e in entries[::2]:
+            existing.setdefault(e.date, []).append(ExistingSlot(e.start_min, e.end_min))
+        window = (entries[0].date, entries[-1].date)
+        measure('plan_sync', key, size, lambda: plan_sync(entries, existing, window))
+
+    if os.path.exists(CALENDAR_DUMP):
+        with open(CALENDAR_DUMP, 'r', encoding='utf-8') as f:
+            html = f.read()
+        pages = 20
+        measure('parse_calendar_html', 'calendar_dump', pages,
+                lambda: [existing_entries_from_html(html) for _ in range(pages)])
+
+    return results, timings
+
+
+def compare_to_baseline(results: dict, baseline: dict, tolerance: float, timings: dict = None) -> list:
+    """
+    Returns a list of regression messages (empty if all measurements are within tolerance).
+    With timings, cases under MIN_GATED_RUN_TIME per run are left out.
+    """
+    regressions = []
+    for name, by_size in results.items():
+        for size, value in by_size.items():
+            if timings is not None and timings[name][size] < MIN_GATED_RUN_TIME:
+                continue
+            expected = baseline.get(name, {}).get(size)
+            if expected and value < expected * (1 - tolerance):
+                regressions.append(f"{name} @ {size}: {value:,.0f}/s < baseline {expected:,.0f}/s "
+                                   f"(-{(1 - value / expected) * 100:.0f}%)")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Doc parser benchmarks")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--min-time', type=float, default=DEFAULT_MIN_TIME,
+                        help="Minimum measured seconds per case (short cases are repeated)")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed slowdown vs baseline (0.30 = 30%%)")
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    parser.add_argument('--update-baseline', action='store_true')
+    args = parser.parse_args(argv)
+
+    results, timings = run_benchmarks(args.sizes, args.repeat, args.min_time)
+    for name, by_size in results.items():
+        for size, value in by_size.items():
+            label = f"{int(size):>7,} entries" if size.isdigit() else f"{size:>15}"
+            gated = "" if timings[name][size] >= MIN_GATED_RUN_TIME else "  (not gated)"
+            print(f"{name:<24} {label}  {value:>14,.0f} items/s{gated}")
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, 'r') as f:
+                baseline = json.load(f)
+        for name, by_size in results.items():
+            baseline.setdefault(name, {}).update({k: round(v) for k, v in by_size.items()})
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=4, sort_keys=True)
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline found. Run with --update-baseline first.")
+        return 0
+
+    with open(args.baseline, 'r') as f:
+        baseline = json.load(f)
+    regressions = compare_to_baseline(results, baseline, args.tolerance, timings)
+    for message in regressions:
+        print(f"REGRESSION: {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
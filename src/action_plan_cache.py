@@ -0,0 +1,70 @@
+"""
+Rencana Aksi option list per SKP period (year + triwulan).
+The dropdown is read once per session and remembered in action_plans.json so entries can
+be resolved (number or text) while planning, before the browser opens the form.
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+from json_store import load_json, save_json
+
+ACTION_PLAN_FILE = 'action_plans.json'
+ACTION_PLAN_CACHE_VERSION = 1
+
+
+def period_key(period: Tuple[str, str]) -> str:
+    """('2026', 'TRIWULAN I') -> '2026 TRIWULAN I'"""
+    return f"{period[0]} {period[1]}"
+
+
+def resolve_action_plan(value: str, options: List[str]) -> Optional[int]:
+    """
+    Zero-based option index for a doc action plan, or None if it cannot be selected.
+    Digits are 1-based option numbers; text matches the first option containing it (case-insensitive).
+    """
+    value = (value or '').strip()
+    if not value:
+        return None
+    if value.isdigit():
+        idx = int(value) - 1
+        return idx if 0 <= idx < len(options) else None
+    lowered = value.lower()
+    for idx, option in enumerate(options):
+        if lowered in option.lower():
+            return idx
+    return None
+
+
+class ActionPlanCache:
+    def __init__(self, path: str = ACTION_PLAN_FILE):
+        self.path = path
+        self.periods: Dict[str, Dict] = {}  # period key -> {'options': [...], 'read_at': epoch}
+        self._dirty = False
+
+    def get(self, period: Tuple[str, str]) -> Optional[List[str]]:
+        """Options remembered for the period, or None if it was never read."""
+        record = self.periods.get(period_key(period))
+        return list(record['options']) if record else None
+
+    def put(self, period: Tuple[str, str], options: List[str]):
+        key = period_key(period)
+        record = self.periods.get(key)
+        if record and record['options'] == options:
+            return
+        self.periods[key] = {'options': list(options), 'read_at': time.time()}
+        self._dirty = True
+
+    def load(self):
+        """Loads remembered option lists. A missing or corrupt file yields an empty cache."""
+        periods = load_json(self.path, ACTION_PLAN_CACHE_VERSION, "Action plan cache",
+                            lambda data: {key: {'options': list(rec['options']), 'read_at': rec.get('read_at', 0)}
+                                          for key, rec in data.get('periods', {}).items()})
+        self.periods = periods or {}
+
+    def save(self):
+        """Writes the cache to disk if an option list changed."""
+        if not self._dirty:
+            return
+        if save_json(self.path, ACTION_PLAN_CACHE_VERSION, "Action plan cache", {'periods': self.periods},
+                     indent=2, ensure_ascii=False):
+            self._dirty = False
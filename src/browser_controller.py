@@ -1,4 +1,6 @@
-from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
+from doc_source import build_export_url, clean_export_text
+from utils import get_skp_period
+from session_store import SessionStore
 import time
 import os
 import sys
@@ -12,6 +14,11 @@ class BrowserController:
         self.context = None
         self.page_doc = None  # Tab for Google Doc
         self.page_app = None  # Tab for Web App
+        self.calendar_url = None  # Set once the calendar page is reached (used by ensure_calendar_page)
+        # Encrypted storage_state of the last login; lets a still-valid session skip SSO/OTP
+        self.session_store = SessionStore(max_age_hours=config.get('session_max_age_hours', 12))
+        self.session_restored = False
+        self.session_valid = False
         
         # CRITICAL: Force Playwright to use a persistent local folder for browsers.
         # This ensures both the "install" command and the "launch" command look in the same place.
@@ -91,12 +98,22 @@ class BrowserController:
     def launch_browser(self, retry=True):
         """Launches the browser and opens two tabs."""
         try:
+            # Imported here so the module (and its export/session helpers) loads without Playwright
+            from playwright.sync_api import sync_playwright
             self.playwright = sync_playwright().start()
             headless = self.config.get('browser_headless', False)
             self.logger.log(f"Membuka browser (Headless: {headless})...")
             
             self.browser = self.playwright.chromium.launch(headless=headless)
-            self.context = self.browser.new_context()
+            state = None
+            if self.config.get('remember_session', True):
+                state = self.session_store.load(self.config.get('username', ''))
+            if state:
+                self.logger.log("Memuat sesi login tersimpan...")
+                self.context = self.browser.new_context(storage_state=state)
+            else:
+                self.context = self.browser.new_context()
+            self.session_restored = bool(state)
             
             # Open Tab 1: Web App
             self.page_app = self.context.new_page()
@@ -119,6 +136,9 @@ class BrowserController:
     def close_browser(self):
         """Closes the browser and cleanup."""
         if self.context:
+            # Keep the refreshed cookies of a valid session for the next run
+            if self.session_valid and self.session_store.available:
+                self.save_session()
             self.context.close()
         if self.browser:
             self.browser.close()
@@ -268,12 +288,53 @@ class BrowserController:
                 self.logger.log("ℹ️ Kredensial tidak diberikan. Silakan login manual.")
                 
             # 2FA Pause Logic (Handles validation of success for both Manual and Auto)
-            self.handler_2fa()
+            if self.handler_2fa():
+                self.session_valid = True
+                self.save_session()
 
         except Exception as e:
             self.logger.log(f"❌ Error spesifik login: {str(e)}")
             return # Stop if critical failure
 
+    def probe_session(self) -> bool:
+        """
+        Checks a restored session with one navigation to the portal: valid if it is not
+        sent to SSO/login and the welcome text appears. Stale cookies are cleared otherwise.
+        """
+        if not self.page_app or not self.session_restored:
+            return False
+        self.logger.log("Memeriksa sesi login tersimpan...")
+        try:
+            self.page_app.bring_to_front()
+            self.page_app.goto(self.config.get('web_app_url'), wait_until='domcontentloaded')
+            url = self.page_app.url
+            if 'sso-siasn' not in url and 'login' not in url:
+                self.page_app.wait_for_selector("text=Selamat Datang", timeout=5000)
+                self.logger.log("✅ Sesi masih berlaku, login dilewati.")
+                self.session_valid = True
+                return True
+        except Exception:
+            pass
+        self.logger.log("ℹ️ Sesi tersimpan kedaluwarsa, login ulang...")
+        try:
+            self.context.clear_cookies()
+        except Exception:
+            pass
+        return False
+
+    def save_session(self):
+        """Stores the context's storage_state encrypted at rest (remember_session)."""
+        if not self.context or not self.config.get('remember_session', True):
+            return
+        if not self.session_store.available:
+            self.logger.log("ℹ️ Sesi tidak disimpan: enkripsi (DPAPI) hanya tersedia di Windows.")
+            return
+        try:
+            if self.session_store.save(self.config.get('username', ''), self.context.storage_state()):
+                self.logger.log("🔐 Sesi login disimpan (terenkripsi).")
+        except Exception as e:
+            self.logger.log(f"⚠️ Gagal menyimpan sesi: {e}")
+
     def navigate_to_dashboard(self):
         """
         Navigates to the Kinerja/SKP page from ASN Digital portal.
@@ -423,16 +484,8 @@ class BrowserController:
         
         current_url = self.page_app.url
         
-        # Helper to detect current Year and Quarter
-        import datetime
-        now = datetime.datetime.now()
-        current_year = str(now.year)
-        # Determine Triwulan (Quarter)
-        month = now.month
-        if 1 <= month <= 3: qtr = "TRIWULAN I"
-        elif 4 <= month <= 6: qtr = "TRIWULAN II"
-        elif 7 <= month <= 9: qtr = "TRIWULAN III"
-        else: qtr = "TRIWULAN IV"
+        # Detect current Year and Quarter (Triwulan)
+        current_year, qtr = get_skp_period()
         
         self.logger.log(f"Periode Target: Tahun {current_year}, {qtr}")
 
@@ -561,6 +614,7 @@ class BrowserController:
             if "progress" in self.page_app.url or self.page_app.is_visible("text=Total Jam Progress") or self.page_app.is_visible("text=Hari Ini"):
                 self.logger.log("✅ Berhasil mencapai Halaman Kalender!")
                 self.logger.log(f"URL Kalender: {self.page_app.url}")
+                self.calendar_url = self.page_app.url
                 return True
             else:
                 self.logger.log("❌ Tidak dapat mengkonfirmasi halaman Kalender.")
@@ -569,6 +623,29 @@ class BrowserController:
         except:
             return False
 
+    def ensure_calendar_page(self) -> bool:
+        """
+        Recovery check between retries: True if the calendar is still shown, otherwise
+        reloads the remembered calendar URL, or repeats navigate_to_calendar.
+        """
+        page = self.page_app
+        if not page or page.is_closed():
+            return False
+        try:
+            if page.locator(".vuecal").count() > 0 and page.is_visible("button.btn-success:has-text('Tambah Progress Harian')"):
+                return True
+        except Exception:
+            pass
+        self.logger.log("↩️ Kembali ke Halaman Kalender...")
+        if self.calendar_url:
+            try:
+                page.goto(self.calendar_url, wait_until='domcontentloaded')
+                page.wait_for_selector(".vuecal__body .vuecal__cell", timeout=15000)
+                return True
+            except Exception as e:
+                self.logger.log(f"⚠️ Gagal memuat ulang kalender: {e}")
+        return self.navigate_to_calendar()
+
     def handler_2fa(self):
         """Waits for user to handle 2FA."""
         self.logger.log("⏸️  DIJEDA: Silakan selesaikan 2FA secara manual di browser.")
@@ -613,6 +690,38 @@ class BrowserController:
             self.logger.log(f"❌ Error saat menunggu 2FA: {str(e)}")
             return False
 
+    def fetch_doc_export(self, url: str) -> str:
+        """
+        Downloads the Google Doc as plain text via its /export?format=txt endpoint.
+        The request goes through the browser context, so its cookies apply.
+        Returns "" if the export is not available (caller falls back to rendering the doc).
+        """
+        if not self.context:
+            return ""
+        
+        export_url = build_export_url(url)
+        if not export_url:
+            self.logger.log("⚠️ Link bukan Google Doc standar, memakai mode render...")
+            return ""
+        
+        self.logger.log("Mengunduh teks Google Doc via export...")
+        try:
+            response = self.context.request.get(export_url, timeout=60000)
+            content_type = response.headers.get('content-type', '')
+            
+            # Private docs answer with an HTML login page instead of text
+            if not response.ok or 'text/plain' not in content_type:
+                self.logger.log(f"⚠️ Export tidak tersedia (HTTP {response.status}, {content_type or '-'}). Memakai mode render...")
+                return ""
+            
+            content = clean_export_text(response.text())
+            self.logger.log(f"✓ Diekstrak {len(content)} karakter (export)")
+            return content
+            
+        except Exception as e:
+            self.logger.log(f"⚠️ Export Doc gagal: {str(e)}. Memakai mode render...")
+            return ""
+
     def get_doc_text(self) -> str:
         """Extracts text content from the Google Doc tab."""
         if not self.page_doc:
@@ -0,0 +1,315 @@
+"""
+Browser-independent parsing of the portal's vue-cal week view.
+The scanner extracts a week snapshot from the page (or parse_calendar_html
+builds it from an HTML string such as page.content() or calendar_dump.html):
+    {'title': 'Februari 2026',
+     'headers': ['Senin 2', ...],
+     'cells': [{'disabled': False, 'events': ['Meeting\\n07:30 - 13:00', ...]}, ...]}
+and build_existing_entries turns it into {date: [ExistingSlot, ...]}.
+"""
+
+import re
+from datetime import date, datetime, timedelta
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, Optional, Tuple
+from entry import ExistingSlot
+
+EVENT_TIME_RE = re.compile(r'(\d{1,2}[:\.]\d{2})\s*-\s*(\d{1,2}[:\.]\d{2})')
+
+INDO_MONTHS = {
+    'januari': 1, 'februari': 2, 'maret': 3, 'april': 4,
+    'mei': 5, 'juni': 6, 'juli': 7, 'agustus': 8,
+    'september': 9, 'oktober': 10, 'november': 11, 'desember': 12
+}
+
+_YEAR_RE = re.compile(r'\d{4}')
+
+
+def parse_month_year(text: str) -> Tuple[int, int]:
+    """
+    'Minggu 6 (Februari 2026)' / 'Februari 2026' -> (2, 2026).
+    Falls back to the current month/year when either part is missing.
+    """
+    text = text.lower()
+    found_month = 0
+    found_year = datetime.now().year  # Use current year as default
+
+    for m_name, m_val in INDO_MONTHS.items():
+        if m_name in text:
+            found_month = m_val
+            break
+
+    y_match = _YEAR_RE.search(text)
+    if y_match:
+        found_year = int(y_match.group(0))
+
+    if found_month == 0:
+        found_month = datetime.now().month
+
+    return found_month, found_year
+
+
+def parse_event_text(ev_text: str) -> ExistingSlot:
+    """'Activity Title\\n07:30 - 13:00' -> ExistingSlot(07:30-13:00); unreadable times -> unknown slot."""
+    time_match = EVENT_TIME_RE.search(ev_text)
+    if time_match:
+        return ExistingSlot.from_times(time_match.group(1), time_match.group(2))
+    return ExistingSlot.unknown()
+
+
+def build_existing_entries(snapshot: Dict, log: Optional[Callable[[str], None]] = None) -> Dict[str, List[ExistingSlot]]:
+    """
+    Maps a week snapshot to {ISO date: [ExistingSlot, ...]}.
+    Disabled cells become a single holiday slot; empty cells are left out.
+    """
+    log = log or (lambda msg: None)
+    headers = snapshot.get('headers') or []
+    cells = snapshot.get('cells') or []
+    existing_data = {}
+
+    if len(headers) != len(cells):
+        log(f"⚠️ Mismatch: {len(headers)} headers vs {len(cells)} cells. Attempting to match first {min(len(headers), len(cells))}...")
+
+    current_month, current_year = parse_month_year(snapshot.get('title') or '')
+
+    for header_text, cell in zip(headers, cells):
+        # Parse day from "Senin 2"
+        day_match = [s for s in header_text.split() if s.isdigit()]
+        if not day_match:
+            continue
+        date_str = f"{current_year}-{current_month:02d}-{int(day_match[0]):02d}"
+
+        # Holiday/disabled detection: red full-day block
+        if cell.get('disabled'):
+            log(f"  🔴 Libur/Disabled: {date_str}")
+            existing_data[date_str] = [ExistingSlot.holiday()]
+            continue
+
+        events = cell.get('events') or []
+        if not events:
+            log(f"  . Slot kosong: {date_str}")
+            continue
+
+        log(f"  > Ditemukan {len(events)} entri pada {date_str}")
+        slots = existing_data[date_str] = []
+        for ev_text in events:
+            slot = parse_event_text(ev_text)
+            slots.append(slot)
+            if slot.kind == ExistingSlot.UNKNOWN:
+                log(f"    - Ditemukan event tapi tidak bisa parsing waktu: {ev_text[:20]}...")
+            else:
+                log(f"    - Ditemukan waktu: {slot.start} - {slot.end}")
+
+    return existing_data
+
+
+def week_offsets(start_date: str, end_date: str, today: date) -> List[int]:
+    """
+    Weeks (Monday-based) overlapping start_date..end_date, as offsets from today's week:
+    0 first, then walking backwards, then forwards. Order of the dates does not matter.
+    """
+    start, end = sorted((date.fromisoformat(start_date), date.fromisoformat(end_date)))
+    current_monday = today - timedelta(days=today.weekday())
+    offsets = set()
+    monday = start - timedelta(days=start.weekday())
+    while monday <= end:
+        offsets.add((monday - current_monday).days // 7)
+        monday += timedelta(days=7)
+    return sorted(offsets, key=lambda w: (w > 0, abs(w)))
+
+
+# --- Offline HTML parsing ---
+
+_VOID_TAGS = frozenset(('area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+                        'link', 'meta', 'param', 'source', 'track', 'wbr'))
+
+
+class _VueCalHTMLParser(HTMLParser):
+    """
+    Collects the week snapshot from vue-cal markup. Element text is gathered
+    like innerText closely enough for parsing: text nodes joined by spaces
+    ("Senin Sen S 2", "Meeting 07:30 - 13:00").
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = None
+        self.headers = []
+        self.cells = []
+        self._stack = []        # (tag, classes, capture kind or None)
+        self._open = {}         # class name -> number of open elements carrying it
+        self._capture = None    # text parts of the element being captured
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _VOID_TAGS:
+            return
+        classes = ()
+        for name, value in attrs:
+            if name == 'class' and value:
+                classes = value.split()
+                break
+
+        kind = None
+        if self._capture is None and classes:
+            if 'vuecal__title' in classes and self._open.get('vuecal__title-bar') and self.title is None:
+                kind = 'title'
+            elif 'weekday-label' in classes and self._open.get('vuecal__heading'):
+                kind = 'header'
+            elif 'vuecal__event' in classes and self._open.get('vuecal__cell') and self.cells:
+                kind = 'event'
+            elif 'vuecal__cell' in classes and self._open.get('vuecal__body'):
+                self.cells.append({'disabled': 'vuecal__cell--disabled' in classes, 'events': []})
+            if kind:
+                self._capture = []
+
+        for cls in classes:
+            self._open[cls] = self._open.get(cls, 0) + 1
+        self._stack.append((tag, classes, kind))
+
+    def handle_endtag(self, tag):
+        if tag in _VOID_TAGS:
+            return
+        # Tolerate unclosed children: pop up to the matching tag
+        for depth in range(len(self._stack) - 1, -1, -1):
+            if self._stack[depth][0] == tag:
+                while len(self._stack) > depth:
+                    self._pop()
+                return
+
+    def handle_data(self, data):
+        if self._capture is not None:
+            self._capture.append(data)
+
+    def _pop(self):
+        tag, classes, kind = self._stack.pop()
+        for cls in classes:
+            self._open[cls] -= 1
+        if kind is None:
+            return
+        text = ' '.join(' '.join(self._capture).split())
+        self._capture = None
+        if kind == 'title':
+            self.title = text
+        elif kind == 'header':
+            self.headers.append(text)
+        else:
+            cell = self.cells[-1]
+            if not cell['disabled']:
+                cell['events'].append(text)
+
+
+def parse_calendar_html(html: str) -> Dict:
+    """Builds a week snapshot from vue-cal HTML (page.content() or a saved dump) without a browser."""
+    parser = _VueCalHTMLParser()
+    parser.feed(html)
+    parser.close()
+    return {'title': parser.title or '', 'headers': parser.headers, 'cells': parser.cells}
+
+
+def existing_entries_from_html(html: str, log: Optional[Callable[[str], None]] = None) -> Dict[str, List[ExistingSlot]]:
+    """One-call offline scan: HTML string -> {ISO date: [ExistingSlot, ...]}."""
+    return build_existing_entries(parse_calendar_html(html), log)
+
+
+# --- Portal XHR payloads ---
+# The portal fills vue-cal from a JSON endpoint; decoding it gives exact times without DOM scraping.
+
+_START_KEYS = ('start', 'start_date', 'startDate', 'start_time', 'mulai', 'jam_mulai', 'waktu_mulai')
+_END_KEYS = ('end', 'end_date', 'endDate', 'end_time', 'selesai', 'jam_selesai', 'waktu_selesai')
+_DATE_KEYS = ('date', 'tanggal', 'tgl')
+_HOLIDAY_KEYS = ('holiday', 'is_holiday', 'libur', 'is_libur')
+_LIST_KEYS = ('data', 'events', 'items', 'result', 'results')
+
+_ISO_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+_CLOCK_RE = re.compile(r'(?:^|[T\s])(\d{1,2}[:\.]\d{2})')
+
+
+def _first_value(record: Dict, keys) -> str:
+    for key in keys:
+        value = record.get(key)
+        if value:
+            return str(value)
+    return ''
+
+
+def _find_event_list(payload, depth: int = 0):
+    """Returns the first list of objects in the payload ({'data': [...]}, {'data': {'events': [...]}}, [...])."""
+    if isinstance(payload, list):
+        return payload if all(isinstance(item, dict) for item in payload) else None
+    if isinstance(payload, dict) and depth < 3:
+        for key in _LIST_KEYS:
+            if key in payload:
+                found = _find_event_list(payload[key], depth + 1)
+                if found is not None:
+                    return found
+    return None
+
+
+def decode_event_record(record: Dict) -> Optional[Tuple[str, ExistingSlot]]:
+    """
+    One API event -> (ISO date, ExistingSlot).
+    Accepts vue-cal style {'start': '2026-02-02 07:30', 'end': '2026-02-02 13:00'} as well as
+    separate date/time fields ({'tanggal': ..., 'jam_mulai': '07:30', ...}). Returns None if no date is found.
+    """
+    start_raw = _first_value(record, _START_KEYS)
+    end_raw = _first_value(record, _END_KEYS)
+    date_match = _ISO_DATE_RE.search(start_raw) or _ISO_DATE_RE.search(_first_value(record, _DATE_KEYS))
+    if not date_match:
+        return None
+
+    css_class = str(record.get('class') or '').lower()
+    if any(record.get(key) for key in _HOLIDAY_KEYS) or 'libur' in css_class or 'holiday' in css_class:
+        return date_match.group(1), ExistingSlot.holiday()
+
+    start_match = _CLOCK_RE.search(start_raw)
+    end_match = _CLOCK_RE.search(end_raw)
+    if start_match and end_match:
+        return date_match.group(1), ExistingSlot.from_times(start_match.group(1), end_match.group(1))
+    return date_match.group(1), ExistingSlot.unknown()
+
+
+def decode_calendar_payload(payload, allow_empty: bool = False) -> Optional[Dict[str, List[ExistingSlot]]]:
+    """
+    Decodes a calendar JSON payload into {ISO date: [ExistingSlot, ...]}.
+    Returns None if the payload does not look like an event list (no record carries a date);
+    an empty list only counts as a calendar response when allow_empty is set.
+    """
+    records = _find_event_list(payload)
+    if records is None or (not records and not allow_empty):
+        return None
+
+    existing_data = {}
+    for record in records:
+        decoded = decode_event_record(record)
+        if decoded:
+            existing_data.setdefault(decoded[0], []).append(decoded[1])
+    if records and not existing_data:
+        return None
+    return existing_data
+
+
+class CalendarResponseCollector:
+    """
+    Accumulates existing entries from calendar JSON responses seen while the
+    scanner navigates. Without url_pattern, any JSON response that decodes to
+    dated events is accepted.
+    """
+
+    def __init__(self, url_pattern: Optional[str] = None):
+        self.url_re = re.compile(url_pattern) if url_pattern else None
+        self.entries = {}
+        self.responses = 0
+
+    def wants(self, url: str, content_type: str) -> bool:
+        if 'json' not in (content_type or ''):
+            return False
+        return self.url_re is None or bool(self.url_re.search(url))
+
+    def add_payload(self, payload) -> bool:
+        """Merges one decoded response. A later response replaces earlier slots of the same date."""
+        decoded = decode_calendar_payload(payload, allow_empty=self.url_re is not None)
+        if decoded is None:
+            return False
+        self.entries.update(decoded)
+        self.responses += 1
+        return True
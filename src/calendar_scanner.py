@@ -1,157 +1,394 @@
 from playwright.sync_api import Page
-from datetime import datetime
 from utils import Logger
-import re
+from calendar_parser import (build_existing_entries, parse_calendar_html, parse_month_year,
+                             week_offsets, CalendarResponseCollector)
+from datetime import date, timedelta
 import time
 
+# Week snapshot in a single round-trip; event time parsing stays in Python
+WEEK_SNAPSHOT_JS = """() => {
+    const title = document.querySelector('.vuecal__title-bar .vuecal__title');
+    return {
+        title: title ? title.innerText : '',
+        headers: Array.from(document.querySelectorAll('.vuecal__heading .weekday-label'), el => el.innerText),
+        cells: Array.from(document.querySelectorAll('.vuecal__body .vuecal__cell'), cell => ({
+            disabled: cell.classList.contains('vuecal__cell--disabled'),
+            events: cell.classList.contains('vuecal__cell--disabled') ? [] :
+                Array.from(cell.querySelectorAll('.vuecal__event'), ev => ev.innerText),
+        })),
+    };
+}"""
+
+# Title + first weekday label; changes whenever the displayed week changes
+WEEK_SIGNATURE_JS = """() => {
+    const title = document.querySelector('.vuecal__title-bar .vuecal__title');
+    const heading = document.querySelector('.vuecal__heading .weekday-label');
+    return (title ? title.innerText : '') + '|' + (heading ? heading.innerText : '');
+}"""
+WEEK_CHANGED_JS = "(old) => (" + WEEK_SIGNATURE_JS + ")() !== old"
+
+# Same snapshot shape as WEEK_SNAPSHOT_JS, restricted to the column whose heading shows `day`
+DAY_SNAPSHOT_JS = """(day) => {
+    const title = document.querySelector('.vuecal__title-bar .vuecal__title');
+    const headers = Array.from(document.querySelectorAll('.vuecal__heading .weekday-label'));
+    const cells = document.querySelectorAll('.vuecal__body .vuecal__cell');
+    const i = headers.findIndex(el => el.innerText.split(/\\s+/).includes(String(day)));
+    if (i < 0 || i >= cells.length) return null;
+    const cell = cells[i];
+    const disabled = cell.classList.contains('vuecal__cell--disabled');
+    return {
+        title: title ? title.innerText : '',
+        headers: [headers[i].innerText],
+        cells: [{disabled: disabled,
+                 events: disabled ? [] : Array.from(cell.querySelectorAll('.vuecal__event'), ev => ev.innerText)}],
+    };
+}"""
+
+# Resolves once the week body has had no DOM mutation for quietMs (events drawn), or after maxMs
+CELLS_SETTLED_JS = """([quietMs, maxMs]) => new Promise(resolve => {
+    const body = document.querySelector('.vuecal__body');
+    if (!body) { resolve(false); return; }
+    let timer;
+    const finish = (settled) => { observer.disconnect(); clearTimeout(timer); clearTimeout(cap); resolve(settled); };
+    const observer = new MutationObserver(() => { clearTimeout(timer); timer = setTimeout(() => finish(true), quietMs); });
+    observer.observe(body, {childList: true, subtree: true, characterData: true, attributes: true});
+    timer = setTimeout(() => finish(true), quietMs);
+    const cap = setTimeout(() => finish(false), maxMs);
+})"""
+
+# Upper bound for the week's data request after a click (DOM mode / XHR mode)
+DOM_DATA_WAIT_MS = 1000
+XHR_DATA_WAIT_MS = 5000
+WEEK_CHANGE_TIMEOUT_MS = 5000
+# Re-render: the week body must stay unchanged this long after the data arrived
+CELLS_QUIET_MS = 150
+CELLS_SETTLE_MAX_MS = 3000
+# A submitted entry appears after the portal refreshes the week; re-read the day until then
+VERIFY_TIMEOUT_MS = 5000
+VERIFY_POLL_MS = 250
+
 class CalendarScanner:
-    def __init__(self, page: Page, logger: Logger):
+    def __init__(self, page: Page, logger: Logger, scan_mode: str = 'dom', api_url_pattern: str = None):
         self.page = page
         self.logger = logger
+        # 'dom' scrapes the rendered week; 'xhr' decodes the portal's calendar JSON responses.
+        # Without a URL pattern any dated JSON (notifications, history) could pass as calendar data.
+        if scan_mode == 'xhr' and not api_url_pattern:
+            self.logger.log("⚠️ calendar_scan_mode 'xhr' butuh calendar_api_pattern. Memakai mode DOM.")
+            scan_mode = 'dom'
+        self.scan_mode = scan_mode
+        self.collector = CalendarResponseCollector(api_url_pattern) if scan_mode == 'xhr' else None
+        self._pending_responses = []
+        self.last_scan_ok = False  # False when the last get_existing_entries hit an error (result not cacheable)
+        self.week_from_api = True  # Whether the last week navigation brought a calendar API response
+        self.unscanned_dates = set()  # ISO dates of weeks the last scan_range could not read
+
+    # --- XHR mode ---
+    def start_response_capture(self):
+        """Subscribes to page responses. Call before navigate_to_calendar so the first load is captured."""
+        if self.collector is not None:
+            self.page.on('response', self._on_response)
+
+    def stop_response_capture(self):
+        if self.collector is not None:
+            try:
+                self.page.remove_listener('response', self._on_response)
+            except Exception:
+                pass
+
+    def _is_calendar_response(self, response) -> bool:
+        if response.request.resource_type not in ('xhr', 'fetch'):
+            return False
+        return self.collector.wants(response.url, response.headers.get('content-type', ''))
+
+    def _on_response(self, response):
+        # Only queue here; bodies are read later from the scanning thread
+        try:
+            if self._is_calendar_response(response):
+                self._pending_responses.append(response)
+        except Exception:
+            pass
+
+    def _drain_responses(self):
+        pending, self._pending_responses = self._pending_responses, []
+        for response in pending:
+            try:
+                if self.collector.add_payload(response.json()):
+                    self.logger.log(f"  📡 Data kalender dari API: {response.url}")
+            except Exception as e:
+                self.logger.log(f"⚠️ Respons kalender tidak bisa dibaca: {e}")
+
+    def _is_data_response(self, response) -> bool:
+        return response.request.resource_type in ('xhr', 'fetch')
+
+    def _week_signature(self) -> str:
+        try:
+            return self.page.evaluate(WEEK_SIGNATURE_JS)
+        except Exception:
+            return ''
+
+    def _click_week_button(self, selector: str) -> bool:
+        """
+        Clicks a week navigation button, then waits for the week's data response body, for the
+        title/heading text to change and for the week cells to stop re-rendering, instead of
+        sleeping a fixed time. The title alone changes on click, before the events are drawn.
+        Returns False if the displayed week did not change (nothing may be scanned or cached then).
+        week_from_api is False in XHR mode when no calendar response arrived (read the DOM instead).
+        """
+        signature = self._week_signature()
+        got_response = True
+        if self.collector is not None:
+            predicate, timeout = self._is_calendar_response, XHR_DATA_WAIT_MS
+        else:
+            predicate, timeout = self._is_data_response, DOM_DATA_WAIT_MS
+        try:
+            with self.page.expect_response(predicate, timeout=timeout) as info:
+                self.page.locator(selector).click()
+            # Headers are not enough: the events are only rendered once the body is read
+            info.value.finished()
+        except Exception:
+            if self.collector is not None:
+                self.logger.log("  ⚠️ Tidak ada respons API setelah navigasi minggu")
+                got_response = False
+
+        try:
+            self.page.wait_for_function(WEEK_CHANGED_JS, arg=signature, timeout=WEEK_CHANGE_TIMEOUT_MS)
+        except Exception:
+            self.logger.log("  ⚠️ Judul minggu tidak berubah setelah navigasi")
+            return False
+        self._wait_cells_settled()
+        self.week_from_api = got_response
+        return True
 
-    def get_existing_entries(self, silent=False) -> dict:
+    def _wait_cells_settled(self):
+        """Waits until the week body has stopped changing (events of the new week drawn)."""
+        try:
+            if not self.page.evaluate(CELLS_SETTLED_JS, [CELLS_QUIET_MS, CELLS_SETTLE_MAX_MS]):
+                self.logger.log("  ⚠️ Sel kalender masih berubah, memindai apa adanya")
+        except Exception:
+            pass
+
+    def get_existing_entries(self, silent=False, use_api=True) -> dict:
         """
         Scans the generic Week View to find existing events with time ranges.
-        Returns a dictionary mapping dates to list of time ranges:
+        Returns a dictionary mapping dates to list of ExistingSlot time ranges:
         {
-            '2026-02-06': [ {'start': '07:30', 'end': '13:00'}, ... ] 
+            '2026-02-06': [ ExistingSlot(07:30-13:00), ... ]
         }
         """
         if not silent:
             self.logger.log("Memindai kalender untuk entri yang ada...")
         existing_data = {}
+
+        self.last_scan_ok = False
+
+        if self.collector is not None and use_api:
+            self._drain_responses()
+            if self.collector.responses:
+                self.last_scan_ok = True
+                return dict(self.collector.entries)
+            self.logger.log("⚠️ Belum ada respons API kalender, memindai DOM...")
         
         try:
-            # 1. capture Headers to map Column Index -> Date
             self.page.wait_for_selector(".weekday-label", timeout=5000)
-            headers = self.page.locator(".vuecal__heading .weekday-label").all_inner_texts()
-            
-            # 2. Capture Check Cells for Events
-            cells = self.page.locator(".vuecal__body .vuecal__cell").all()
-            
-            if len(headers) != len(cells):
-                self.logger.log(f"⚠️ Mismatch: {len(headers)} headers vs {len(cells)} cells. Attempting to match first {min(len(headers), len(cells))}...")
-            
-            # Helper to parse "Senin 2" -> Date
-            month_year_text = self.page.locator(".vuecal__title-bar .vuecal__title").inner_text()
-            current_month, current_year = self._parse_month_year(month_year_text)
-            
-            for i, header_text in enumerate(headers):
-                if i >= len(cells): break
-                
-                # Parse day from "Senin 2"
-                day_match = [s for s in header_text.split() if s.isdigit()]
-                if not day_match: continue
-                day = int(day_match[0])
-                
-                # Construct Date String (ISO)
-                date_str = f"{current_year}-{current_month:02d}-{day:02d}"
-                
-                # Check for events in this cell
-                cell = cells[i]
-                
-                # Holiday/disabled detection: red full-day block
-                cell_classes = cell.get_attribute('class') or ''
-                if 'vuecal__cell--disabled' in cell_classes:
-                    self.logger.log(f"  🔴 Libur/Disabled: {date_str}")
-                    existing_data[date_str] = [{'start': 'HOLIDAY', 'end': 'HOLIDAY'}]
-                    continue
-                
-                events = cell.locator(".vuecal__event").all()
-                
-                if not events:
-                    self.logger.log(f"  . Slot kosong: {date_str}")
-                    continue
-                
-                # Parse events
-                self.logger.log(f"  > Ditemukan {len(events)} entri pada {date_str}")
-                existing_data[date_str] = []
-                
-                for ev in events:
-                    # Extract text content. Expecting format "07:30 - 13:00"
-                    # Usually spans multiple lines. "Activity Title \n 07:30 - 13:00"
-                    ev_text = ev.inner_text()
-                    
-                    # Regex for HH:MM - HH:MM
-                    time_match = re.search(r'(\d{1,2}[:\.]\d{2})\s*-\s*(\d{1,2}[:\.]\d{2})', ev_text)
-                    if time_match:
-                        s_time = time_match.group(1).replace('.', ':') # normalize
-                        e_time = time_match.group(2).replace('.', ':')
-                        existing_data[date_str].append({'start': s_time, 'end': e_time})
-                        self.logger.log(f"    - Ditemukan waktu: {s_time} - {e_time}")
-                    else:
-                        self.logger.log(f"    - Ditemukan event tapi tidak bisa parsing waktu: {ev_text[:20]}...")
-                        # Assume full day checking? Or assume collision?
-                        # Probably safest to mark simple presence if time fails
-                        existing_data[date_str].append({'start': '?', 'end': '?'})
+            snapshot = self._snapshot_evaluate() or self._snapshot_html() or self._snapshot_locators()
+            existing_data = build_existing_entries(snapshot, self.logger.log)
+            self.last_scan_ok = True
 
         except Exception as e:
             self.logger.log(f"⚠️ Pemindaian kalender gagal: {e}")
             
         return existing_data
 
-    def scan_with_previous_week(self) -> dict:
+    def _snapshot_evaluate(self):
+        """
+        Reads title, headers, disabled flags and event texts in ONE page.evaluate round-trip.
+        Returns None if the script fails or returns something unexpected.
+        """
+        try:
+            snapshot = self.page.evaluate(WEEK_SNAPSHOT_JS)
+        except Exception as e:
+            self.logger.log(f"⚠️ Ekstraksi cepat gagal, memakai locator: {e}")
+            return None
+        if not isinstance(snapshot, dict) or not isinstance(snapshot.get('headers'), list) \
+                or not isinstance(snapshot.get('cells'), list):
+            self.logger.log("⚠️ Ekstraksi cepat tidak valid, memakai locator")
+            return None
+        return snapshot
+
+    def _snapshot_html(self):
+        """
+        Fallback: one page.content() call parsed in-process with calendar_parser.
+        Returns None if the markup yields no headers.
+        """
+        try:
+            snapshot = parse_calendar_html(self.page.content())
+        except Exception as e:
+            self.logger.log(f"⚠️ Parsing HTML kalender gagal, memakai locator: {e}")
+            return None
+        return snapshot if snapshot['headers'] else None
+
+    def _snapshot_locators(self) -> dict:
+        """Fallback: builds the same snapshot with per-element locator calls (one round-trip each)."""
+        headers = self.page.locator(".vuecal__heading .weekday-label").all_inner_texts()
+        title = self.page.locator(".vuecal__title-bar .vuecal__title").inner_text()
+        cells = []
+        for cell in self.page.locator(".vuecal__body .vuecal__cell").all():
+            cell_classes = cell.get_attribute('class') or ''
+            if 'vuecal__cell--disabled' in cell_classes:
+                cells.append({'disabled': True, 'events': []})
+                continue
+            events = [ev.inner_text() for ev in cell.locator(".vuecal__event").all()]
+            cells.append({'disabled': False, 'events': events})
+        return {'title': title, 'headers': headers, 'cells': cells}
+
+    def scan_range(self, start_date: str, end_date: str, cache=None, use_api=True) -> dict:
         """
-        Scans BOTH current week AND previous week for existing entries.
-        This ensures Friday entries are detected when running on Monday.
+        Scans only the calendar weeks overlapping start_date..end_date (ISO dates).
+        Expects the calendar on today's week and returns it there afterwards;
+        the current week needs no navigation at all. Weeks still fresh in the
+        optional CalendarScanCache are neither visited nor scanned.
+        If a week cannot be opened the range stops there; the dates of every week left
+        unread are put in unscanned_dates. use_api=False reads the DOM even in XHR mode.
         """
-        self.logger.log("Memindai kalender (minggu ini + sebelumnya)...")
+        today = date.today()
+        current_monday = today - timedelta(days=today.weekday())
+        offsets = week_offsets(start_date, end_date, today)
+        self.logger.log(f"Memindai kalender {start_date} s/d {end_date} ({len(offsets)} minggu)...")
         existing = {}
-        
-        # 1. Scan current week first
-        current_week_entries = self.get_existing_entries(silent=True)
-        existing.update(current_week_entries)
-        
-        # 2. Navigate to previous week
-        self.logger.log("⏪ Navigasi ke minggu sebelumnya...")
+        unread = set(offsets)
+        position = 0
         try:
-            prev_btn = self.page.locator("button.vuecal__arrow--prev")
-            prev_btn.click()
-            time.sleep(1)  # Reduced from 1.5s
-            
-            # 3. Scan previous week
-            prev_week_entries = self.get_existing_entries(silent=True)
-            existing.update(prev_week_entries)
-            
-            # 4. Return to current week (today)
-            self.logger.log("⏩ Kembali ke minggu ini...")
-            today_btn = self.page.locator("button.vuecal__today-btn")
-            today_btn.click()
-            time.sleep(1)  # Reduced from 1.5s
-            
+            for offset in offsets:
+                monday = current_monday + timedelta(weeks=offset)
+                cached = cache.get_week(monday) if cache is not None else None
+                if cached is not None:
+                    self.logger.log(f"  💾 Minggu {monday.isoformat()} dari cache")
+                    existing.update(cached)
+                    unread.discard(offset)
+                    continue
+
+                from_api = use_api
+                while position != offset:
+                    if offset < position:
+                        self.logger.log("⏪ Navigasi ke minggu sebelumnya...")
+                        moved, step = self._click_week_button("button.vuecal__arrow--prev"), -1
+                    else:
+                        self.logger.log("⏩ Navigasi ke minggu berikutnya...")
+                        moved, step = self._click_week_button("button.vuecal__arrow--next"), 1
+                    if not moved:
+                        break
+                    position += step
+                    from_api = use_api and self.week_from_api
+                if position != offset:
+                    # The week on screen is not the target: scanning it would cache a wrong (empty) week
+                    self.logger.log(f"⚠️ Minggu {monday.isoformat()} tidak terbuka, pemindaian dihentikan.")
+                    break
+                week_data = self.get_existing_entries(silent=True, use_api=from_api)
+                existing.update(week_data)
+                if self.last_scan_ok:
+                    unread.discard(offset)
+                    if cache is not None:
+                        cache.put_week(monday, week_data)
         except Exception as e:
-            self.logger.log(f"⚠️ Gagal scan minggu sebelumnya: {e}")
-        
+            self.logger.log(f"⚠️ Gagal scan minggu lain: {e}")
+
+        # Remaining weeks: fresh cache entries still count, everything else is unknown
+        self.unscanned_dates = set()
+        for offset in sorted(unread):
+            monday = current_monday + timedelta(weeks=offset)
+            cached = cache.get_week(monday) if cache is not None else None
+            if cached is not None:
+                existing.update(cached)
+            else:
+                self.unscanned_dates.update((monday + timedelta(days=i)).isoformat() for i in range(7))
+
+        if position != 0:
+            self.logger.log("⏩ Kembali ke minggu ini...")
+            try:
+                self._click_week_button("button.vuecal__today-btn")
+            except Exception as e:
+                self.logger.log(f"⚠️ Gagal kembali ke minggu ini: {e}")
+
         return existing
 
+    def scan_day(self, date_str: str):
+        """
+        Re-reads a single day of the displayed week in one round-trip.
+        Returns its list of ExistingSlot, or None if the day is not on screen.
+        """
+        try:
+            snapshot = self.page.evaluate(DAY_SNAPSHOT_JS, date.fromisoformat(date_str).day)
+        except Exception as e:
+            self.logger.log(f"⚠️ Gagal memindai hari {date_str}: {e}")
+            return None
+        if not snapshot:
+            return None
+        data = build_existing_entries(snapshot)
+        if data and date_str not in data:
+            return None  # Same day number, but a different month is displayed
+        return data.get(date_str, [])
+
+    def verify_entry(self, entry, cache=None) -> bool:
+        """
+        Confirms a submitted entry by re-scanning only its day once the calendar has re-rendered,
+        polling for up to VERIFY_TIMEOUT_MS; a confirmed day is refreshed in the cache.
+        """
+        deadline = time.monotonic() + VERIFY_TIMEOUT_MS / 1000
+        self._wait_cells_settled()
+        slots = self.scan_day(entry.date)
+        while (slots is not None and not any(slot.start_min == entry.start_min for slot in slots)
+               and time.monotonic() < deadline):
+            self.page.wait_for_timeout(VERIFY_POLL_MS)
+            slots = self.scan_day(entry.date)
+        if slots is None:
+            return False
+        if any(slot.start_min == entry.start_min for slot in slots):
+            if cache is not None:
+                cache.set_day(entry.date, slots)
+            self.logger.log(f"  ✓ Terverifikasi di kalender: {entry.date} {entry.start_time}")
+            return True
+        # The calendar may not have re-rendered yet; the write-through slot stays in the cache
+        self.logger.log(f"  ⚠️ Entri belum tampil di kalender: {entry.date} {entry.start_time}")
+        return False
+
+    def find_entry(self, entry) -> bool:
+        """
+        Re-reads the week holding the entry from the DOM (bypassing the cache and the captured
+        responses, which predate the save) and reports whether it was saved.
+        """
+        slots = self.scan_range(entry.date, entry.date, use_api=False).get(entry.date, [])
+        return any(slot.start_min == entry.start_min for slot in slots)
+
+    def confirm_entries(self, entries, cache=None) -> list:
+        """
+        Confirms entries saved outside the calendar page (direct HTTP mode): reloads the
+        page and re-scans only the weeks holding them from the DOM, bypassing the cache
+        and the captured responses. Returns the entries that are not on the calendar.
+        """
+        dates = sorted(entry.date for entry in entries)
+        try:
+            self.page.reload(wait_until='domcontentloaded')
+            self.page.wait_for_selector('.vuecal__body .vuecal__cell', timeout=15000)
+            self._wait_cells_settled()
+            found = self.scan_range(dates[0], dates[-1], use_api=False)
+        except Exception as e:
+            self.logger.log(f"⚠️ Gagal memuat ulang kalender: {e}")
+            return list(entries)
+
+        missing = []
+        for entry in entries:
+            slots = found.get(entry.date, [])
+            if cache is not None:
+                cache.set_day(entry.date, slots)
+            if any(slot.start_min == entry.start_min for slot in slots):
+                self.logger.log(f"  ✓ Terverifikasi di kalender: {entry.date} {entry.start_time}")
+            else:
+                self.logger.log(f"  ⚠️ Entri belum tampil di kalender: {entry.date} {entry.start_time}")
+                missing.append(entry)
+        return missing
+
     def _parse_month_year(self, text):
         # text: "Minggu 6 (Februari 2026)" or "Februari 2026" or "Januari 2024"
         # Return (month_int, year_int)
-        
-        # Mapping
-        indo_months = {
-            'januari': 1, 'februari': 2, 'maret': 3, 'april': 4,
-            'mei': 5, 'juni': 6, 'juli': 7, 'agustus': 8,
-            'september': 9, 'oktober': 10, 'november': 11, 'desember': 12
-        }
-        
-        text = text.lower()
-        found_month = 0
-        found_year = datetime.now().year  # Use current year as default
-        
-        for m_name, m_val in indo_months.items():
-            if m_name in text:
-                found_month = m_val
-                break
-        
-        # Find year (4 digits)
-        y_match = re.search(r'\d{4}', text)
-        if y_match:
-            found_year = int(y_match.group(0))
-            
-        # Fallback to current system date if fail?
-        if found_month == 0:
-            now = datetime.now()
-            found_month = now.month
-            
-        return found_month, found_year
+        return parse_month_year(text)
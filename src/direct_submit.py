@@ -0,0 +1,124 @@
+"""
+Direct HTTP submission mode.
+The save request sent by the first UI submit (endpoint, headers, payload shape) is recorded
+as a template; later entries are replayed through the browser context's request API,
+which shares the session cookies. Fields are located by matching the first entry's values
+in the payload, so the portal's field names do not need to be known.
+"""
+
+import copy
+import json
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+from entry import Entry
+
+# Set by the request API itself, or tied to the original connection
+_DROP_HEADERS = {'cookie', 'content-length', 'host', 'connection', 'accept-encoding'}
+_FAILED_STATUS = {'error', 'fail', 'failed'}
+
+
+def _renderings(entry: Entry, doc_url: str) -> List[Tuple[str, str]]:
+    """(name, text) for every way the form may submit an entry value; the name prefix is the field."""
+    iso = entry.date
+    year, month, day = iso.split('-')
+    values = [('date', iso), ('date_dmy', f"{day}-{month}-{year}"), ('date_dmy_slash', f"{day}/{month}/{year}")]
+    for field, hm in (('start', entry.start_time), ('end', entry.end_time)):
+        values += [(field, hm), (f"{field}_s", f"{hm}:00"),
+                   (f"{field}_dt", f"{iso} {hm}"), (f"{field}_dt_s", f"{iso} {hm}:00"), (f"{field}_dt_t", f"{iso}T{hm}")]
+    values += [('kegiatan', entry.category), ('bukti', doc_url)]
+    return [(name, text) for name, text in values if text]
+
+
+def _json_leaves(node, path=()):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            yield from _json_leaves(value, path + (key,))
+    elif isinstance(node, list):
+        for i, value in enumerate(node):
+            yield from _json_leaves(value, path + (i,))
+    else:
+        yield path, node
+
+
+def is_save_success(status: int, body: str) -> bool:
+    """2xx and, for JSON bodies, no explicit failure flag ('success': false, 'status': 'error', 'errors')."""
+    if not 200 <= status < 300:
+        return False
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return True
+    if isinstance(data, dict):
+        if data.get('success') is False or data.get('errors'):
+            return False
+        if str(data.get('status', '')).lower() in _FAILED_STATUS:
+            return False
+    return True
+
+
+class SubmitTemplate:
+    """A recorded save request whose entry fields can be re-rendered for another entry."""
+
+    def __init__(self, url: str, method: str, headers: Dict[str, str], kind: str, payload, slots, action_plan: str):
+        self.url = url
+        self.method = method
+        self.headers = headers
+        self.kind = kind            # 'json' or 'form' (x-www-form-urlencoded)
+        self.payload = payload      # parsed JSON body, or list of (key, value) pairs
+        self.slots = slots          # [(JSON path or pair index, rendering name)]
+        self.action_plan = action_plan
+
+    @classmethod
+    def record(cls, url: str, method: str, headers: Dict[str, str], post_data: str,
+               entry: Entry, doc_url: str) -> Optional['SubmitTemplate']:
+        """
+        Builds a template from the captured request of `entry`. Returns None for bodies
+        that cannot be replayed (multipart, unparsable, or date/start/end not found).
+        """
+        lowered = {k.lower(): v for k, v in headers.items()}
+        content_type = lowered.get('content-type', '')
+        try:
+            if 'json' in content_type:
+                kind, payload = 'json', json.loads(post_data)
+                leaves = list(_json_leaves(payload))
+            elif 'x-www-form-urlencoded' in content_type:
+                kind, payload = 'form', parse_qsl(post_data, keep_blank_values=True)
+                leaves = [(i, value) for i, (_, value) in enumerate(payload)]
+            else:
+                return None
+        except ValueError:
+            return None
+
+        names = {}
+        for name, text in _renderings(entry, doc_url):
+            names.setdefault(text, name)  # first rendering wins on equal texts
+        slots = [(path, names[leaf]) for path, leaf in leaves if isinstance(leaf, str) and leaf in names]
+        fields = {name for _, name in slots}
+        has_date = any(n.startswith('date') or '_dt' in n for n in fields)
+        if not (has_date and any(n.startswith('start') for n in fields) and any(n.startswith('end') for n in fields)):
+            return None
+
+        kept = {k: v for k, v in headers.items() if not k.startswith(':') and k.lower() not in _DROP_HEADERS}
+        return cls(url, method, kept, kind, payload, slots, entry.action_plan or '')
+
+    def accepts(self, entry: Entry) -> bool:
+        """The Rencana Aksi value is not re-rendered, so only entries with the recorded one can be replayed."""
+        return (entry.action_plan or '') == self.action_plan
+
+    def build_request(self, entry: Entry, doc_url: str) -> Tuple[str, str, Dict[str, str], str]:
+        """(url, method, headers, body) for `entry`."""
+        values = dict(_renderings(entry, doc_url))
+        if self.kind == 'json':
+            payload = copy.deepcopy(self.payload)
+            for path, name in self.slots:
+                node = payload
+                for key in path[:-1]:
+                    node = node[key]
+                node[path[-1]] = values.get(name, '')
+            body = json.dumps(payload)
+        else:
+            pairs = list(self.payload)
+            for index, name in self.slots:
+                pairs[index] = (pairs[index][0], values.get(name, ''))
+            body = urlencode(pairs)
+        return self.url, self.method, dict(self.headers), body
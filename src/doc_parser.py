@@ -1,153 +1,325 @@
 import re
-from typing import List, Dict
-from utils import normalize_time
+from bisect import bisect_left, bisect_right
+from typing import List, Iterable, Iterator, Optional, Tuple
+from utils import normalize_time, normalize_date, normalize_dates
+from entry import Entry, date_to_ordinal, time_to_minutes
 
-def parse_google_doc_text(text: str) -> List[Dict]:
+# --- DATE DETECTION ---
+# Multiple patterns to match date headers in the document
+_DATE_PATTERNS = [
+    r'(\d{1,2}\s+[a-zA-Z]+\s+\d{4})',       # "2 Februari 2026", "1 January 2026"
+    r'(\d{4}[-/]\d{1,2}[-/]\d{1,2})',         # "2026-02-01", "2026/02/01"
+    r'(\d{1,2}[-/]\d{1,2}[-/]\d{4})',         # "01/02/2026", "1-2-2026"
+    r'(\d{1,2}\s+\d{1,2}\s+\d{4})',           # "1 1 2026"
+]
+_DATE_RE = re.compile('|'.join(_DATE_PATTERNS))
+
+# --- TIME DETECTION ---
+# Flexible: handles 0730, 07:30, 07.30, 7:30 with dash/en-dash separator
+# Trailing colon is optional
+_TIME_RE = re.compile(r'(\d{1,2}[:\.]?\d{2})\s*[-–—]\s*(\d{1,2}[:\.]?\d{2})\s*:?')
+
+_URL_RE = re.compile(r'https?://[^\s]+')
+_LINE_RE = re.compile(r'[^\n]+')
+
+# Rencana Aksi (Drop Down Text): "Rencana Aksi: 3"
+_ACTION_PLAN_RE = re.compile(r'^Rencana\s+Aksi\s*[:\-\.]\s*', re.IGNORECASE)
+_ACTION_PLAN_SPLIT_RE = re.compile(r'[:\-\.]')
+
+# Trailing action plan digit (e.g. "Activity 3")
+_TRAILING_DIGIT_RE = re.compile(r'^(.*)\s+(\d{1,2})$')
+
+# UI Noise (Google Docs footer text), matched as one alternation.
+# Extra patterns can be added via config.json 'doc_noise_patterns' (see set_extra_noise_patterns).
+_NOISE_PATTERNS = [
+    r'aktifkan dukungan pembaca',
+    r'untuk mengaktifkan dukungan',
+    r'banner disembunyikan',
+    r'minta akses edit',
+    r'bagikan',
+    r'fileedittampilan',
+    r'tab dokumen',
+]
+
+
+def _compile_noise(patterns: List[str]):
+    return re.compile('^(?:' + '|'.join(f'(?:{p})' for p in patterns) + ')', re.IGNORECASE)
+
+
+_NOISE_RE = _compile_noise(_NOISE_PATTERNS)
+
+# Google Docs editor chrome around the document body (render mode only).
+# The last prefix marker near the top ends the UI header; the screen-reader
+# footer starts the UI suffix.
+_CHROME_HEAD_LIMIT = 4096
+_CHROME_PREFIX_RE = re.compile(
+    r'^(?:tab dokumen|document tabs|fileedittampilan\w*|fileeditview\w*)[ \t]*$',
+    re.IGNORECASE | re.MULTILINE
+)
+_CHROME_SUFFIX_MARKERS = ('Aktifkan dukungan pembaca layar', 'Turn on screen reader support')
+
+
+def set_extra_noise_patterns(patterns: Iterable[str]):
+    """
+    Extends the built-in noise filter with user regexes, matched case-insensitively
+    at the start of each line. Raises re.error for an invalid pattern.
+    """
+    global _NOISE_RE
+    _NOISE_RE = _compile_noise(_NOISE_PATTERNS + [p for p in patterns if p])
+
+
+def noise_signature() -> str:
+    """Identifies the active noise filter (parse cache entries depend on it)."""
+    return _NOISE_RE.pattern
+
+
+def find_content_bounds(text: str) -> Tuple[int, int]:
+    """
+    Returns (pos, endpos) of the document body inside text extracted from the
+    Docs editor, excluding the UI prefix (share/menu bar) and the screen-reader
+    footer. Text without editor chrome yields (0, len(text)).
+    """
+    # Prefix: last UI marker line near the top, but never past the first date header
+    head_end = min(len(text), _CHROME_HEAD_LIMIT)
+    first_date = _DATE_RE.search(text, 0, head_end)
+    if first_date:
+        head_end = first_date.start()
+
+    pos = 0
+    for match in _CHROME_PREFIX_RE.finditer(text, 0, head_end):
+        pos = match.end()
+
+    # Suffix: the footer line, as long as no time block follows it
+    endpos = len(text)
+    for marker in _CHROME_SUFFIX_MARKERS:
+        idx = text.rfind(marker, pos)
+        if idx >= 0 and (idx == 0 or text[idx - 1] == '\n') and not _TIME_RE.search(text, idx):
+            endpos = min(endpos, idx)
+    return pos, endpos
+
+
+def parse_google_doc_text(text: str, cache=None, date_from: Optional[str] = None,
+                          date_to: Optional[str] = None) -> List[Entry]:
     """
     Parse Google Doc text into structured entries.
-    
+
     Supports flexible formats:
     Date Headers: "2 Februari 2026", "2026-02-01", "01/02/2026", "1-2-2026", "1 1 2026", etc.
     Time Blocks: "0730 - 1300:", "07:30 - 13:00:", "07.30-13.00:", "0730 1300:", etc.
+
+    The text is scanned once: each date block and time block is addressed by
+    (pos, endpos) offsets into the original string instead of slice copies.
+    Docs editor chrome before and after the document body is skipped.
+
+    cache: optional DocParseCache. Date blocks whose raw text is unchanged
+    since a previous run reuse their cached entries instead of being re-parsed.
+
+    date_from / date_to: optional inclusive ISO (YYYY-MM-DD) window. Only date
+    blocks whose header normalizes into the window are parsed; every other
+    block is skipped before any time-block or line processing.
     """
     entries = []
-    
-    # --- DATE DETECTION ---
-    # Multiple patterns to match date headers in the document
-    date_patterns = [
-        r'(\d{1,2}\s+[a-zA-Z]+\s+\d{4})',       # "2 Februari 2026", "1 January 2026"
-        r'(\d{4}[-/]\d{1,2}[-/]\d{1,2})',         # "2026-02-01", "2026/02/01"
-        r'(\d{1,2}[-/]\d{1,2}[-/]\d{4})',         # "01/02/2026", "1-2-2026"
-        r'(\d{1,2}\s+\d{1,2}\s+\d{4})',           # "1 1 2026"
-    ]
-    combined_date_pattern = '|'.join(date_patterns)
-    
-    # --- TIME DETECTION ---
-    # Flexible: handles 0730, 07:30, 07.30, 7:30 with dash/en-dash separator
-    # Trailing colon is optional
-    time_pattern = r'(\d{1,2}[:\.]?\d{2})\s*[-–—]\s*(\d{1,2}[:\.]?\d{2})\s*:?'
-    
-    url_pattern = r'https?://[^\s]+'
-    
-    # Find all date header matches
-    matches = list(re.finditer(combined_date_pattern, text))
-    
-    if not matches:
-        return entries
-    
-    # Iterate date matches
-    for i in range(len(matches)):
-        # The matched group could be in any of the alternation groups
-        current_date_str = matches[i].group(0).strip()
-        
-        # Content is everything until next date match or end of string
-        start_idx = matches[i].end()
-        end_idx = matches[i+1].start() if i + 1 < len(matches) else len(text)
-        content_block = text[start_idx:end_idx]
-        
-        # Find Time Blocks in this content block
-        time_matches = list(re.finditer(time_pattern, content_block))
-        
-        for j in range(len(time_matches)):
-            raw_start = time_matches[j].group(1)
-            raw_end = time_matches[j].group(2)
-            
-            # Normalize times immediately to HH:MM
-            start_time = normalize_time(raw_start)
-            end_time = normalize_time(raw_end)
-            
-            # Content for this time block
-            t_start = time_matches[j].end()
-            t_end = time_matches[j+1].start() if j + 1 < len(time_matches) else len(content_block)
-            raw_entry_text = content_block[t_start:t_end].strip()
-            
-            # Parse the entry text
-            lines = [l.strip() for l in raw_entry_text.split('\n') if l.strip()]
-            
-            if not lines:
-                continue
-
-            # Extract Proof Link
-            proof_link = ''
-            clean_lines = []
-            for line in lines:
-                url_match = re.search(url_pattern, line)
-                if url_match:
-                    proof_link = url_match.group(0)
-                    line = line.replace(proof_link, '').strip()
-                if line:
-                    clean_lines.append(line)
-                    
-            # Extract Rencana Aksi (Drop Down Text)
-            action_plan = ""
-            final_lines = []
-            for line in clean_lines:
-                if re.match(r'^Rencana\s+Aksi\s*[:\-\.]\s*', line, re.IGNORECASE):
-                    parts = re.split(r'[:\-\.]', line, 1)
-                    if len(parts) > 1:
-                        action_plan = parts[1].strip()
-                else:
-                    final_lines.append(line)
-            
-            # Clean UI Noise (Google Docs footer text)
-            noise_patterns = [
-                r'^aktifkan dukungan pembaca',
-                r'^untuk mengaktifkan dukungan',
-                r'^banner disembunyikan',
-                r'^minta akses edit',
-                r'^bagikan',
-                r'^fileedittampilan',
-                r'^tab dokumen'
-            ]
-            
-            filtered_lines = []
-            for line in final_lines:
-                is_noise = False
-                for p in noise_patterns:
-                    if re.match(p, line, re.IGNORECASE):
-                        is_noise = True
-                        break
-                if not is_noise:
-                    filtered_lines.append(line)
-            
-            final_lines = filtered_lines
-
-            # Find Action Plan Index (Trailing Digit or Standalone Digit)
-            if not action_plan:
-                for line_idx in range(len(final_lines) - 1, -1, -1):
-                    line = final_lines[line_idx]
-                    
-                    # Case A: Standalone Digit line (e.g. "3")
-                    if line.strip().isdigit() and len(line.strip()) < 3:
-                        action_plan = line.strip()
-                        final_lines.pop(line_idx)
-                        break
-                    
-                    # Case B: Trailing Digit (e.g. "Activity 3")
-                    match = re.search(r'^(.*)\s+(\d{1,2})$', line)
-                    if match:
-                        text_part = match.group(1).strip()
-                        digit_part = match.group(2)
-                        
-                        if text_part:
-                            action_plan = digit_part
-                            final_lines[line_idx] = text_part
-                            break
-            
-            # Determine Category & Description
-            category = final_lines[0] if final_lines else "Kegiatan Harian"
-            description = '\n'.join(final_lines[1:]) if len(final_lines) > 1 else ""
-            
-            entry = {
-                'date_raw': current_date_str,
-                'start_time': start_time,
-                'end_time': end_time,
-                'category': category,
-                'description': description,
-                'proof_link': proof_link,
-                'action_plan': action_plan
-            }
-            entries.append(entry)
+    # Skip the Docs UI prefix/suffix once instead of filtering it line by line
+    pos, endpos = find_content_bounds(text)
+    headers = list(_DATE_RE.finditer(text, pos, endpos))
+
+    if date_from or date_to:
+        selected = _select_headers_in_window(headers, date_from, date_to)
+    else:
+        selected = range(len(headers))
+
+    # Content of a date block is everything until the next date match or end of string
+    for i in selected:
+        block_end = headers[i + 1].start() if i + 1 < len(headers) else endpos
+        header = headers[i]
+        _parse_block(header.group(0).strip(), text, header.start(), header.end(), block_end, entries, cache)
 
     return entries
 
+
+def _select_headers_in_window(headers, date_from: Optional[str], date_to: Optional[str]) -> List[int]:
+    """
+    Returns the indices (in document order) of the date headers inside the window.
+    Headers are indexed by their normalized date and the window is found by bisection.
+    """
+    iso_dates = normalize_dates(match.group(0).strip() for match in headers)
+    index: List[Tuple[str, int]] = [(iso_date, i) for i, iso_date in enumerate(iso_dates) if iso_date]
+    index.sort()
+
+    lo = bisect_left(index, (date_from, -1)) if date_from else 0
+    hi = bisect_right(index, (date_to, len(headers))) if date_to else len(index)
+    return sorted(i for _, i in index[lo:hi])
+
+
+def iter_google_doc_entries(chunks: Iterable[str], cache=None, date_from: Optional[str] = None,
+                            date_to: Optional[str] = None) -> Iterator[Entry]:
+    """
+    Incrementally parse Google Doc text that arrives in chunks.
+
+    Yields the same entries as parse_google_doc_text, but each date block
+    is emitted as soon as the next date header closes it, so callers can start
+    working before the whole document has been extracted. Only the currently
+    open date block is kept in memory. cache, date_from and date_to behave as
+    in parse_google_doc_text.
+
+    Date headers are only confirmed once the line they sit on is complete,
+    so a header split across two chunks is still detected correctly.
+    """
+    buffer = ''
+    date_raw = None     # Header of the currently open date block
+    header_pos = 0      # Offset where the open block's header starts
+    content_pos = 0     # Offset where the open block's content starts
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buffer += chunk
+
+        # Only search complete lines; the trailing partial line may still grow
+        line_end = buffer.rfind('\n', content_pos)
+        if line_end < 0:
+            continue
+
+        for match in _DATE_RE.finditer(buffer, content_pos, line_end):
+            if date_raw is not None:
+                yield from _parse_streamed_block(date_raw, buffer, header_pos, content_pos, match.start(),
+                                                 cache, date_from, date_to)
+            date_raw = match.group(0).strip()
+            header_pos, content_pos = match.start(), match.end()
+
+        # Drop closed blocks; only the open one can still produce entries
+        keep = header_pos if date_raw is not None else content_pos
+        if keep:
+            buffer = buffer[keep:]
+            header_pos -= keep
+            content_pos -= keep
+
+    # End of input: the remaining tail closes the last block
+    for match in _DATE_RE.finditer(buffer, content_pos):
+        if date_raw is not None:
+            yield from _parse_streamed_block(date_raw, buffer, header_pos, content_pos, match.start(),
+                                             cache, date_from, date_to)
+        date_raw = match.group(0).strip()
+        header_pos, content_pos = match.start(), match.end()
+
+    if date_raw is not None:
+        yield from _parse_streamed_block(date_raw, buffer, header_pos, content_pos, len(buffer),
+                                         cache, date_from, date_to)
+
+
+def _parse_streamed_block(date_raw: str, text: str, header_pos: int, content_pos: int, endpos: int,
+                          cache, date_from: Optional[str], date_to: Optional[str]) -> List[Entry]:
+    """Parse one closed block of a chunked document, unless it falls outside the date window."""
+    if date_from or date_to:
+        iso_date = normalize_date(date_raw)
+        if not iso_date or (date_from and iso_date < date_from) or (date_to and iso_date > date_to):
+            return []
+    entries = []
+    _parse_block(date_raw, text, header_pos, content_pos, endpos, entries, cache)
+    return entries
+
+
+def _parse_block(date_raw: str, text: str, header_pos: int, content_pos: int, endpos: int,
+                 entries: List[Entry], cache=None):
+    """Parse the date block text[header_pos:endpos], consulting the cache if given."""
+    if cache is None:
+        _parse_date_block(date_raw, text, content_pos, endpos, entries)
+        return
+
+    key = cache.block_key(text[header_pos:endpos])
+    cached = cache.get(key)
+    if cached is not None:
+        entries.extend(cached)
+        return
+
+    block_entries = []
+    _parse_date_block(date_raw, text, content_pos, endpos, block_entries)
+    cache.put(key, block_entries)
+    entries.extend(block_entries)
+
+
+def _parse_date_block(date_raw: str, text: str, pos: int, endpos: int, entries: List[Entry]):
+    """Parse the time blocks in text[pos:endpos] and append them to entries."""
+    date_ord = date_to_ordinal(normalize_date(date_raw))
+    prev = None
+    for match in _TIME_RE.finditer(text, pos, endpos):
+        if prev is not None:
+            entry = _build_entry(date_raw, date_ord, prev, text, prev.end(), match.start())
+            if entry:
+                entries.append(entry)
+        prev = match
+
+    if prev is not None:
+        entry = _build_entry(date_raw, date_ord, prev, text, prev.end(), endpos)
+        if entry:
+            entries.append(entry)
+
+
+def _build_entry(date_raw: str, date_ord: int, time_match, text: str, pos: int, endpos: int) -> Optional[Entry]:
+    """Build one Entry from the text following a time block, or None if it is empty."""
+    lines = []
+    for line_match in _LINE_RE.finditer(text, pos, endpos):
+        line = line_match.group(0).strip()
+        if line:
+            lines.append(line)
+
+    if not lines:
+        return None
+
+    # Normalize times immediately to minutes since midnight
+    start_min = time_to_minutes(normalize_time(time_match.group(1)))
+    end_min = time_to_minutes(normalize_time(time_match.group(2)))
+
+    proof_link = ''
+    action_plan = ''
+    final_lines = []
+    for line in lines:
+        # Extract Proof Link
+        if 'http' in line:
+            url_match = _URL_RE.search(line)
+            if url_match:
+                proof_link = url_match.group(0)
+                line = line.replace(proof_link, '').strip()
+                if not line:
+                    continue
+
+        # Extract Rencana Aksi (Drop Down Text)
+        if _ACTION_PLAN_RE.match(line):
+            parts = _ACTION_PLAN_SPLIT_RE.split(line, 1)
+            if len(parts) > 1:
+                action_plan = parts[1].strip()
+            continue
+
+        # Clean UI Noise (Google Docs footer text)
+        if _NOISE_RE.match(line):
+            continue
+
+        final_lines.append(line)
+
+    # Find Action Plan Index (Trailing Digit or Standalone Digit)
+    if not action_plan:
+        for line_idx in range(len(final_lines) - 1, -1, -1):
+            line = final_lines[line_idx]
+
+            # Case A: Standalone Digit line (e.g. "3")
+            if line.isdigit() and len(line) < 3:
+                action_plan = line
+                final_lines.pop(line_idx)
+                break
+
+            # Case B: Trailing Digit (e.g. "Activity 3")
+            match = _TRAILING_DIGIT_RE.search(line)
+            if match:
+                text_part = match.group(1).strip()
+
+                if text_part:
+                    action_plan = match.group(2)
+                    final_lines[line_idx] = text_part
+                    break
+
+    # Determine Category & Description
+    category = final_lines[0] if final_lines else "Kegiatan Harian"
+    description = '\n'.join(final_lines[1:]) if len(final_lines) > 1 else ""
+
+    return Entry(date_raw, date_ord, start_min, end_min,
+                 category, description, proof_link, action_plan)
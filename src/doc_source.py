@@ -0,0 +1,132 @@
+"""
+Document sources for the doc parser.
+Reads the daily log without rendering the Docs editor: Google Doc export helpers,
+plus browserless readers for local .txt/.md/.docx files and public export URLs.
+"""
+
+import os
+import re
+import codecs
+import zipfile
+import urllib.request
+from typing import Iterator
+from xml.etree import ElementTree
+
+_DOC_ID_RE = re.compile(r'/document/(?:u/\d+/)?d/([a-zA-Z0-9_-]+)')
+
+
+def build_export_url(doc_url: str, fmt: str = 'txt') -> str:
+    """
+    Turns any Google Doc link (/edit, /view, ?usp=sharing...) into its export URL:
+    https://docs.google.com/document/d/<id>/export?format=txt
+    Returns "" if the link is not a Google Doc link.
+    """
+    match = _DOC_ID_RE.search(doc_url or '')
+    if not match:
+        return ""
+    return f"https://docs.google.com/document/d/{match.group(1)}/export?format={fmt}"
+
+
+def clean_export_text(text: str) -> str:
+    """Normalizes exported text: drops the UTF-8 BOM and converts CRLF line endings."""
+    return text.lstrip('\ufeff').replace('\r\n', '\n')
+
+
+# --- Browserless sources ---
+# These feed iter_google_doc_entries directly, so reading the log never needs Chromium.
+
+CHUNK_SIZE = 64 * 1024
+LOCAL_EXTENSIONS = ('.txt', '.md', '.markdown', '.docx')
+
+_WORD_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_MD_PREFIX_RE = re.compile(r'^\s*(?:#{1,6}\s+|[-*+]\s+|>\s?)')
+_MD_EMPHASIS_RE = re.compile(r'(\*\*|__|`)')
+
+
+def is_local_source(source: str) -> bool:
+    """True if the source is an existing local file with a supported extension."""
+    return os.path.isfile(source) and source.lower().endswith(LOCAL_EXTENSIONS)
+
+
+def open_doc_source(source: str, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """
+    Returns an iterator of text chunks for a local .txt/.md/.docx file or a
+    public Google Doc link (read via its export URL).
+    Raises ValueError for unsupported sources and OSError on read failures.
+    """
+    if source.startswith(('http://', 'https://')):
+        return iter_url_chunks(source, chunk_size)
+
+    lower = source.lower()
+    if lower.endswith('.docx'):
+        return iter_docx_chunks(source)
+    if lower.endswith(('.md', '.markdown')):
+        return iter_markdown_chunks(source)
+    if lower.endswith('.txt'):
+        return iter_text_chunks(source, chunk_size)
+    raise ValueError(f"Unsupported document source: {source}")
+
+
+def iter_text_chunks(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Reads a plain text file in fixed-size chunks."""
+    with open(path, 'r', encoding='utf-8-sig', newline=None) as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+def iter_markdown_chunks(path: str) -> Iterator[str]:
+    """Reads a Markdown file line by line, stripping heading/list/quote markers and emphasis."""
+    with open(path, 'r', encoding='utf-8-sig', newline=None) as f:
+        for line in f:
+            line = _MD_PREFIX_RE.sub('', line, count=1)
+            yield _MD_EMPHASIS_RE.sub('', line)
+
+
+def iter_docx_chunks(path: str) -> Iterator[str]:
+    """Streams the paragraphs of a .docx file (one chunk per paragraph) without python-docx."""
+    with zipfile.ZipFile(path) as archive:
+        with archive.open('word/document.xml') as xml_stream:
+            parts = []
+            for event, elem in ElementTree.iterparse(xml_stream, events=('end',)):
+                tag = elem.tag
+                if tag == _WORD_NS + 't':
+                    parts.append(elem.text or '')
+                elif tag == _WORD_NS + 'tab':
+                    parts.append('\t')
+                elif tag in (_WORD_NS + 'br', _WORD_NS + 'cr'):
+                    parts.append('\n')
+                elif tag == _WORD_NS + 'p':
+                    parts.append('\n')
+                    yield ''.join(parts)
+                    parts = []
+                    elem.clear()
+
+
+def iter_url_chunks(doc_url: str, chunk_size: int = CHUNK_SIZE, timeout: int = 30) -> Iterator[str]:
+    """
+    Downloads a publicly shared Google Doc as plain text via urllib.
+    Non-Google URLs are fetched as-is. Raises ValueError if the server does
+    not answer with text (e.g. the doc is private and a login page is returned).
+    """
+    url = build_export_url(doc_url) or doc_url
+    req = urllib.request.Request(url, headers={'User-Agent': 'DailyReporter-DocReader'})
+
+    with urllib.request.urlopen(req, timeout=timeout) as response:
+        content_type = response.headers.get('Content-Type', '')
+        if 'text/plain' not in content_type:
+            raise ValueError(f"Document is not public (received {content_type or 'unknown content'})")
+
+        decoder = codecs.getincrementaldecoder('utf-8-sig')()
+        while True:
+            data = response.read(chunk_size)
+            if not data:
+                break
+            text = decoder.decode(data)
+            if text:
+                yield text.replace('\r\n', '\n')
+        tail = decoder.decode(b'', final=True)
+        if tail:
+            yield tail
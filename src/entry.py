@@ -0,0 +1,196 @@
+"""
+Compact entry types shared by the doc parser, calendar scanner and form filler.
+Dates are stored as date ordinals and times as minutes since midnight, so
+comparisons are plain integer operations; strings are only formatted on access.
+Both types also answer dict-style lookups (entry['start_time']) for older callers.
+"""
+
+from datetime import date
+from typing import Dict, Tuple
+
+
+def date_to_ordinal(iso_date: str) -> int:
+    """'2026-02-06' -> date ordinal. Returns 0 for empty or invalid dates."""
+    try:
+        return date.fromisoformat(iso_date).toordinal()
+    except (TypeError, ValueError):
+        return 0
+
+
+def ordinal_to_date(ordinal: int) -> str:
+    """Date ordinal -> '2026-02-06'. Returns '' for 0."""
+    return date.fromordinal(ordinal).isoformat() if ordinal > 0 else ''
+
+
+def time_to_minutes(time_str: str) -> int:
+    """'07:30' -> 450. Returns -1 if the string is not H:MM / HH:MM."""
+    hours, sep, minutes = time_str.strip().replace('.', ':').partition(':')
+    if sep and hours.isdigit() and minutes.isdigit():
+        return int(hours) * 60 + int(minutes)
+    return -1
+
+
+def minutes_to_time(minutes: int) -> str:
+    """450 -> '07:30'. Returns '' for -1."""
+    if minutes < 0:
+        return ''
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+class Entry:
+    """One time block parsed from the Google Doc."""
+
+    __slots__ = ('date_raw', 'date_ord', 'start_min', 'end_min',
+                 'category', 'description', 'proof_link', 'action_plan')
+
+    # Keys exposed through the dict-compat interface
+    KEYS = ('date_raw', 'date', 'start_time', 'end_time',
+            'category', 'description', 'proof_link', 'action_plan')
+
+    def __init__(self, date_raw: str, date_ord: int, start_min: int, end_min: int,
+                 category: str, description: str = '', proof_link: str = '', action_plan: str = ''):
+        self.date_raw = date_raw
+        self.date_ord = date_ord
+        self.start_min = start_min
+        self.end_min = end_min
+        self.category = category
+        self.description = description
+        self.proof_link = proof_link
+        self.action_plan = action_plan
+
+    @property
+    def date(self) -> str:
+        return ordinal_to_date(self.date_ord)
+
+    @property
+    def start_time(self) -> str:
+        return minutes_to_time(self.start_min)
+
+    @property
+    def end_time(self) -> str:
+        return minutes_to_time(self.end_min)
+
+    # --- Serialization (used by the parse cache) ---
+    def to_row(self) -> Tuple:
+        return (self.date_raw, self.date_ord, self.start_min, self.end_min,
+                self.category, self.description, self.proof_link, self.action_plan)
+
+    @classmethod
+    def from_row(cls, row) -> 'Entry':
+        return cls(*row)
+
+    def to_dict(self) -> Dict:
+        return {key: getattr(self, key) for key in self.KEYS}
+
+    # --- Dict compatibility ---
+    def __getitem__(self, key):
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key == 'date':
+            self.date_ord = date_to_ordinal(value)
+        elif key == 'start_time':
+            self.start_min = time_to_minutes(value)
+        elif key == 'end_time':
+            self.end_min = time_to_minutes(value)
+        elif key in self.KEYS:
+            setattr(self, key, value)
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self.KEYS
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.KEYS else default
+
+    def keys(self):
+        return self.KEYS
+
+    def __eq__(self, other):
+        if isinstance(other, Entry):
+            return self.to_row() == other.to_row()
+        if isinstance(other, dict):
+            return all(self.get(key) == value for key, value in other.items())
+        return NotImplemented
+
+    def __repr__(self):
+        return (f"Entry({self.date or self.date_raw!r} {self.start_time}-{self.end_time} "
+                f"{self.category!r}, action_plan={self.action_plan!r})")
+
+
+class ExistingSlot:
+    """One event (or holiday marker) found on the portal calendar."""
+
+    __slots__ = ('start_min', 'end_min', 'kind')
+
+    EVENT = 0
+    HOLIDAY = 1
+    UNKNOWN = 2   # Event present but its time could not be read
+
+    def __init__(self, start_min: int = -1, end_min: int = -1, kind: int = EVENT):
+        self.start_min = start_min
+        self.end_min = end_min
+        self.kind = kind
+
+    @classmethod
+    def from_times(cls, start: str, end: str) -> 'ExistingSlot':
+        return cls(time_to_minutes(start), time_to_minutes(end))
+
+    @classmethod
+    def holiday(cls) -> 'ExistingSlot':
+        return cls(kind=cls.HOLIDAY)
+
+    @classmethod
+    def unknown(cls) -> 'ExistingSlot':
+        return cls(kind=cls.UNKNOWN)
+
+    # --- Serialization (used by the calendar scan cache) ---
+    def to_row(self) -> Tuple:
+        return (self.start_min, self.end_min, self.kind)
+
+    @classmethod
+    def from_row(cls, row) -> 'ExistingSlot':
+        return cls(*row)
+
+    @property
+    def is_holiday(self) -> bool:
+        return self.kind == self.HOLIDAY
+
+    def _format(self, minutes: int) -> str:
+        if self.kind == self.HOLIDAY:
+            return 'HOLIDAY'
+        if self.kind == self.UNKNOWN:
+            return '?'
+        return minutes_to_time(minutes)
+
+    @property
+    def start(self) -> str:
+        return self._format(self.start_min)
+
+    @property
+    def end(self) -> str:
+        return self._format(self.end_min)
+
+    # --- Dict compatibility ---
+    def __getitem__(self, key):
+        if key == 'start':
+            return self.start
+        if key == 'end':
+            return self.end
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        return self[key] if key in ('start', 'end') else default
+
+    def __eq__(self, other):
+        if isinstance(other, ExistingSlot):
+            return (self.start_min, self.end_min, self.kind) == (other.start_min, other.end_min, other.kind)
+        if isinstance(other, dict):
+            return other == {'start': self.start, 'end': self.end}
+        return NotImplemented
+
+    def __repr__(self):
+        return f"ExistingSlot({self.start}-{self.end})"
@@ -1,14 +1,108 @@
-from playwright.sync_api import Page
+from typing import TYPE_CHECKING
+from entry import Entry, ExistingSlot
+from utils import normalize_date, normalize_time
+from selector_registry import SelectorRegistry, FIELD_ATTR
+from action_plan_cache import resolve_action_plan
+from direct_submit import SubmitTemplate, is_save_success
+from retry import TRANSIENT, classify_error, classify_status
 import time
 
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
+# Original label-based XPaths, used when the selector registry could not resolve a field
+ACTION_PLAN_XPATH = "//div[contains(@class, 'form-group')][.//label[contains(text(), 'Rencana Aksi')]]"
+DATE_XPATH = "//div[contains(@class, 'form-group')][.//label[contains(text(), 'Tanggal Kegiatan')]]//input[@name='date']"
+START_XPATH = "//div[contains(@class, 'form-group')][.//label[contains(text(), 'Jam Mulai')]]//input[@name='date']"
+END_XPATH = "//div[contains(@class, 'form-group')][.//label[contains(text(), 'Jam Selesai')]]//input[@name='date']"
+
+# Rencana Aksi option texts, read once per session from the open dropdown
+# (the container's vue-multiselect items, else the globally rendered list)
+READ_OPTIONS_JS = """(arg) => {
+    const container = arg.css ? document.querySelector(arg.css)
+        : document.evaluate(arg.xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    let items = container ? container.querySelectorAll('li.multiselect__element') : [];
+    let source = 'container';
+    if (!items.length) {
+        items = document.querySelectorAll('.multiselect__content-wrapper .multiselect__element');
+        source = 'global';
+    }
+    return {source, options: Array.from(items, li => li.textContent.replace(/\\s+/g, ' ').trim())};
+}"""
+GLOBAL_OPTION_ITEMS = ".multiselect__content-wrapper .multiselect__element"
+
+# Upper bound for the portal's save response after clicking OK
+SAVE_REQUEST_TIMEOUT_MS = 5000
+
+
+def _is_save_request(request) -> bool:
+    """The modal's OK button sends its data as an XHR/fetch POST (or PUT/PATCH)."""
+    return request.method in ('POST', 'PUT', 'PATCH') and request.resource_type in ('xhr', 'fetch')
+
+# Fast fill: sets every input in one round-trip through the native value setter (so Vue sees
+# the change), dispatches input/change for the Vue/MX components, then reads the values back.
+FAST_FILL_JS = """async (values) => {
+    const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    const byLabel = (text) => {
+        for (const label of document.querySelectorAll('.form-group label')) {
+            if (!label.textContent.includes(text)) continue;
+            const input = label.closest('.form-group').querySelector("input[name='date']");
+            if (input) return input;
+        }
+        return null;
+    };
+    // Elements tagged by the selector registry first, label/name search otherwise
+    const tagged = (key) => document.querySelector(`[""" + FIELD_ATTR + """="${key}"]`);
+    const fields = {
+        date: tagged('date') || byLabel('Tanggal Kegiatan'),
+        start: tagged('start') || byLabel('Jam Mulai'),
+        end: tagged('end') || byLabel('Jam Selesai'),
+        kegiatan: tagged('kegiatan') || document.querySelector("input[name='kegiatan']"),
+        realisasi: tagged('realisasi') || document.querySelector("input[name='realisasi_activity']"),
+        bukti: tagged('bukti') || document.querySelector("input[name='bukti_eviden']"),
+    };
+    for (const [key, el] of Object.entries(fields)) {
+        if (!el) continue;
+        setter.call(el, values[key]);
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+        // Date/time pickers parse (and reset rejected) text on blur, like the keyboard path's Tab
+        el.dispatchEvent(new FocusEvent('blur'));
+        el.dispatchEvent(new FocusEvent('focusout', {bubbles: true}));
+    }
+    // Let Vue re-render before reading back what the components kept
+    await new Promise(resolve => requestAnimationFrame(() => requestAnimationFrame(() => resolve())));
+    const result = {};
+    for (const [key, el] of Object.entries(fields)) result[key] = el ? el.value : null;
+    return result;
+}"""
+
 class FormFiller:
-    def __init__(self, page: Page, logger):
+    def __init__(self, page: 'Page', logger, scan_cache=None, fill_mode: str = 'fast',
+                 action_plan_cache=None, period=None, submit_mode: str = 'ui'):
         self.page = page
         self.logger = logger
+        self.scan_cache = scan_cache  # CalendarScanCache updated write-through on each submit
+        self.fill_mode = fill_mode    # 'fast' (one page.evaluate, keyboard fallback) or 'keyboard'
+        self.action_plan_cache = action_plan_cache  # ActionPlanCache refreshed with this session's options
+        self.period = period                        # (year, triwulan) key for the cache
+        self.action_plan_options = None             # option texts read once per session
+        self._option_items = None                   # locator for those options
+        self.submit_mode = submit_mode  # 'ui' (modal for every entry) or 'http' (replay the first save request)
+        self.submit_template = None     # SubmitTemplate recorded from the first UI submit in 'http' mode
+        self._current_doc_url = ''
+        self.last_latency = None        # seconds from OK click / replay to the save response (None = unconfirmed)
+        self.last_failure = None        # retry.TRANSIENT / retry.PERMANENT for the last failed step
+        self.submit_clicked = False     # OK was clicked since the last open_form (the save may have happened)
+        self._filled_fast = False       # the current form was filled by the fast path
+        self._keyboard_entry = None     # entry whose fast-filled save failed; typed on the next attempt
+        self.selectors = SelectorRegistry(page)
+        self._current_entry = None
 
     def open_form(self):
         """Opens the 'Tambah Progress Harian' modal."""
         self.logger.log("Membuka Form...")
+        self.submit_clicked = False
         try:
             # Look for the green success button with the specific text
             self.page.wait_for_selector("button.btn-success:has-text('Tambah Progress Harian')", timeout=5000)
@@ -16,113 +110,231 @@ class FormFiller:
             
             # Wait for modal to appear (It is actually an h5, so use class only)
             self.page.wait_for_selector(".modal-title:has-text('Tambah Progress Harian')", state='visible', timeout=5000)
+            # Resolve all form fields once for this modal
+            self.selectors.ensure()
             self.logger.log("✓ Modal Form Dibuka")
             return True
         except Exception as e:
             self.logger.log(f"❌ Gagal membuka form: {e}")
+            self.last_failure = classify_error(e)
             return False
 
-    def fill_entry(self, entry: dict, doc_url: str):
+    def dismiss_modal(self):
+        """Recovery: closes a modal left open by a failed attempt (Escape, then its close/cancel button)."""
+        try:
+            if self.page.locator(".modal.show").count() == 0:
+                return
+            self.page.keyboard.press("Escape")
+            try:
+                self.page.wait_for_selector(".modal.show", state='hidden', timeout=2000)
+            except Exception:
+                self.page.locator(".modal.show .close, .modal.show button:has-text('Batal')").first.click(timeout=2000)
+                self.page.wait_for_selector(".modal.show", state='hidden', timeout=2000)
+            self.logger.log("  > Modal ditutup.")
+        except Exception as e:
+            self.logger.log(f"  ⚠️ Modal tidak bisa ditutup: {e}")
+
+    def fill_entry(self, entry: Entry, doc_url: str):
         """
-        Fills the form with data from the parsed entry.
-        entry: {
-            'date': '2026-02-06',
-            'start_time': '07:30',
-            'end_time': '16:00',
-            'activity': '...'
-        }
+        Fills the form with data from the parsed entry
+        (entry.date '2026-02-06', entry.start_time '07:30', entry.end_time '16:00', entry.category).
         """
-        self.logger.log(f"Mengisi entri untuk {entry.get('date')}...")
+        self.logger.log(f"Mengisi entri untuk {entry.date}...")
+        self._current_entry = entry
+        self._current_doc_url = doc_url
+        self._filled_fast = False
         
         try:
             # 1. Rencana Aksi
-            action_plan = entry.get('action_plan', '')
+            action_plan = entry.action_plan
             if action_plan:
                 self.logger.log(f"Selecting Rencana Aksi: '{action_plan}'...")
                 # Strategy: Click dropdown -> Wait for list -> Click item (Text or Index)
                 
-                # Dropdown trigger (Generic wrapper usually)
-                dropdown_container = "//div[contains(@class, 'form-group')][.//label[contains(text(), 'Rencana Aksi')]]"
-                
-                # Click to open
-                try:
-                    self.page.click(f"{dropdown_container}//div[contains(@class, 'multiselect')]", timeout=2000)
-                except:
-                    self.page.click(f"{dropdown_container}//input")
-                
-                # Wait for options visibility
-                self.page.wait_for_timeout(300) # Small buffer for animation
-
+                container_css, option_items = self._open_action_plan_dropdown()
+                options = self._read_action_plan_options(container_css)
                 try:
-                    if action_plan.isdigit():
-                        # INDEX BASED SELECTION (User Convention: "1" -> First Option)
-                        idx = int(action_plan) - 1 # 0-based
-                        self.logger.log(f"  > Memilih Opsi #{action_plan} (Indeks {idx})...")
-                        
-                        # Find all options. Usually .multiselect__element or li
-                        # We use a broad logic: find the UL inside the container -> then LIs
-                        # Or generic global LIs if the library renders them at root (common in Vue)
-                        
-                        # Attempt 1: Look inside the container (if semantic)
-                        options = self.page.locator(f"{dropdown_container}//li")
-                        if options.count() == 0:
-                            # Attempt 2: Global multiselect open list (Vue-Multiselect style)
-                            options = self.page.locator(".multiselect__content-wrapper .multiselect__element")
-                        
-                        if options.count() > idx:
-                            options.nth(idx).click()
-                            self.logger.log("  > Dipilih berdasarkan Indeks.")
+                    if options:
+                        # Direct selection: the index is resolved against the session's option list and
+                        # the click's own actionability wait replaces the fixed animation delay
+                        idx = resolve_action_plan(action_plan, options)
+                        if idx is None:
+                            self.logger.log(f"  ⚠️ Rencana Aksi '{action_plan}' tidak ada di {len(options)} opsi.")
+                            self.page.keyboard.press("Escape")
                         else:
-                            self.logger.log(f"  ⚠️ Indeks {idx} di luar batas (Ditemukan {options.count()} opsi).")
-                            
+                            self.page.locator(self._option_items).nth(idx).click()
+                            self.logger.log(f"  > Dipilih Opsi #{idx + 1}: {options[idx]}")
                     else:
-                        # TEXT BASED SELECTION
-                        option_selector = f"li:has-text('{action_plan}')"
-                        if self.page.is_visible(option_selector):
-                            self.page.click(option_selector)
-                            self.logger.log("  > Dipilih berdasarkan Teks.")
-                        else:
-                            self.page.locator(f"span:text('{action_plan}')").first.click()
-                            self.logger.log("  > Dipilih via span match.")
+                        self._select_action_plan_legacy(action_plan, option_items)
                         
                 except Exception as ex:
                     self.logger.log(f"  ⚠️ Tidak dapat memilih rencana: {ex}")
                     self.page.keyboard.press("Escape")
             else:
                 self.logger.log("No Rencana Aksi specified in Doc. Skipping (Default).")
+
+            if self.fill_mode == 'fast' and entry is not self._keyboard_entry and self._fast_fill(entry, doc_url):
+                self._filled_fast = True
+                self.logger.log("✓ Entri Terisi")
+                return True
+
             # 2. Tanggal Kegiatan
-            # Selector strategy: Find div with label "Tanggal Kegiatan" -> input[name="date"]
-            date_selector = "//div[contains(@class, 'form-group')][.//label[contains(text(), 'Tanggal Kegiatan')]]//input[@name='date']"
-            self._fill_date_time(date_selector, entry['date'], "Date")
+            # Selector strategy: registry tag, else div with label "Tanggal Kegiatan" -> input[name="date"]
+            self._fill_date_time(self.selectors.css('date') or DATE_XPATH, entry.date, "Date")
 
             # 3. Jam Mulai
-            start_selector = "//div[contains(@class, 'form-group')][.//label[contains(text(), 'Jam Mulai')]]//input[@name='date']"
-            self._fill_date_time(start_selector, entry['start_time'], "Start Time")
+            self._fill_date_time(self.selectors.css('start') or START_XPATH, entry.start_time, "Start Time")
 
             # 4. Jam Selesai
-            end_selector = "//div[contains(@class, 'form-group')][.//label[contains(text(), 'Jam Selesai')]]//input[@name='date']"
-            self._fill_date_time(end_selector, entry['end_time'], "End Time")
+            self._fill_date_time(self.selectors.css('end') or END_XPATH, entry.end_time, "End Time")
 
             # 5. Kegiatan Harian
-            self.logger.log(f"Mengisi Kegiatan: '{entry.get('category', 'N/A')}'")
-            self.page.fill('input[name="kegiatan"]', entry['category'])
+            self.logger.log(f"Mengisi Kegiatan: '{entry.category or 'N/A'}'")
+            self.page.fill(self.selectors.css('kegiatan') or 'input[name="kegiatan"]', entry.category)
 
             # 6. Realisasi (Volume = 1, Satuan via config/default?)
             # Logic: User said "Fill left field with 1, keep right field blank"
             self.logger.log("Filling Realisasi (1)...")
-            self.page.fill('input[name="realisasi_activity"]', "1")
+            self.page.fill(self.selectors.css('realisasi') or 'input[name="realisasi_activity"]', "1")
             
             # 7. Bukti Dukung
             self.logger.log("Mengisi URL Bukti...")
-            self.page.fill('input[name="bukti_eviden"]', doc_url)
+            self.page.fill(self.selectors.css('bukti') or 'input[name="bukti_eviden"]', doc_url)
 
             self.logger.log("✓ Entri Terisi")
             return True
 
         except Exception as e:
             self.logger.log(f"❌ Error mengisi form: {e}")
+            self.last_failure = classify_error(e)
             return False
             
+    def _open_action_plan_dropdown(self):
+        """Clicks the Rencana Aksi dropdown open. Returns (container css or None, legacy option selector)."""
+        # Dropdown trigger (Generic wrapper usually)
+        container_css = self.selectors.css('action_plan')
+        if container_css:
+            trigger, trigger_input, option_items = (f"{container_css} .multiselect", f"{container_css} input",
+                                                    f"{container_css} li")
+        else:
+            trigger, trigger_input, option_items = (f"{ACTION_PLAN_XPATH}//div[contains(@class, 'multiselect')]",
+                                                    f"{ACTION_PLAN_XPATH}//input", f"{ACTION_PLAN_XPATH}//li")
+
+        # Click to open
+        try:
+            self.page.click(trigger, timeout=2000)
+        except:
+            self.page.click(trigger_input)
+        return container_css, option_items
+
+    def load_action_plan_options(self):
+        """
+        Reads this session's Rencana Aksi options before planning: opens the form and the
+        dropdown, reads the list and closes the modal. Returns [] if it could not be read.
+        """
+        if self.action_plan_options is not None:
+            return self.action_plan_options
+        if not self.open_form():
+            return []
+        try:
+            container_css, _ = self._open_action_plan_dropdown()
+            return self._read_action_plan_options(container_css)
+        except Exception as e:
+            self.logger.log(f"  ⚠️ Daftar Rencana Aksi tidak terbaca: {e}")
+            return []
+        finally:
+            self.dismiss_modal()
+
+    def _read_action_plan_options(self, container_css):
+        """Option texts of the open Rencana Aksi dropdown; read on first use, then reused this session."""
+        if self.action_plan_options is not None:
+            return self.action_plan_options
+        try:
+            found = self.page.evaluate(READ_OPTIONS_JS, {'css': container_css, 'xpath': ACTION_PLAN_XPATH})
+        except Exception as e:
+            self.logger.log(f"  ⚠️ Daftar Rencana Aksi tidak terbaca: {e}")
+            return []
+        options = found.get('options') or []
+        if not options:
+            return []
+        if found.get('source') == 'global':
+            self._option_items = GLOBAL_OPTION_ITEMS
+        elif container_css:
+            self._option_items = f"{container_css} li.multiselect__element"
+        else:
+            self._option_items = f"{ACTION_PLAN_XPATH}//li[contains(@class, 'multiselect__element')]"
+        self.action_plan_options = options
+        self.logger.log(f"  > {len(options)} opsi Rencana Aksi terbaca.")
+        if self.action_plan_cache is not None and self.period:
+            self.action_plan_cache.put(self.period, options)
+            self.action_plan_cache.save()
+        return options
+
+    def _select_action_plan_legacy(self, action_plan, option_items):
+        """Original selection, used when the option list could not be read."""
+        # Wait for options visibility
+        self.page.wait_for_timeout(300) # Small buffer for animation
+        if action_plan.isdigit():
+            # INDEX BASED SELECTION (User Convention: "1" -> First Option)
+            idx = int(action_plan) - 1 # 0-based
+            self.logger.log(f"  > Memilih Opsi #{action_plan} (Indeks {idx})...")
+            
+            # Attempt 1: Look inside the container (if semantic)
+            options = self.page.locator(option_items)
+            if options.count() == 0:
+                # Attempt 2: Global multiselect open list (Vue-Multiselect style)
+                options = self.page.locator(GLOBAL_OPTION_ITEMS)
+            
+            if options.count() > idx:
+                options.nth(idx).click()
+                self.logger.log("  > Dipilih berdasarkan Indeks.")
+            else:
+                self.logger.log(f"  ⚠️ Indeks {idx} di luar batas (Ditemukan {options.count()} opsi).")
+                
+        else:
+            # TEXT BASED SELECTION
+            option_selector = f"li:has-text('{action_plan}')"
+            if self.page.is_visible(option_selector):
+                self.page.click(option_selector)
+                self.logger.log("  > Dipilih berdasarkan Teks.")
+            else:
+                self.page.locator(f"span:text('{action_plan}')").first.click()
+                self.logger.log("  > Dipilih via span match.")
+
+    def _fast_fill(self, entry: Entry, doc_url: str) -> bool:
+        """
+        Fills date, times, kegiatan, realisasi and bukti in a single page.evaluate.
+        Returns False (keyboard path takes over) if any field did not keep its value.
+        """
+        values = {
+            'date': entry.date,
+            'start': entry.start_time,
+            'end': entry.end_time,
+            'kegiatan': entry.category,
+            'realisasi': "1",
+            'bukti': doc_url,
+        }
+        try:
+            result = self.page.evaluate(FAST_FILL_JS, values)
+        except Exception as e:
+            self.logger.log(f"  ⚠️ Isian cepat gagal, memakai keyboard: {e}")
+            return False
+
+        # Date/time pickers may reformat the text; compare normalized values
+        kept = {
+            'date': normalize_date(result.get('date') or '') == values['date'],
+            'start': normalize_time(result.get('start') or '') == values['start'],
+            'end': normalize_time(result.get('end') or '') == values['end'],
+        }
+        for key in ('kegiatan', 'realisasi', 'bukti'):
+            kept[key] = result.get(key) == values[key]
+        missing = [key for key, ok in kept.items() if not ok]
+        if missing:
+            self.logger.log(f"  ⚠️ Isian cepat tidak tersimpan ({', '.join(missing)}), memakai keyboard")
+            return False
+        self.logger.log("  > Isian cepat terverifikasi (1 round-trip).")
+        return True
+
     def _fill_date_time(self, selector, value, label):
         """Helper to fill date/time inputs which are Vue/MX components."""
         try:
@@ -160,8 +372,23 @@ class FormFiller:
             self.logger.log(f"  ⚠️ Error mengatur {label}: {e}")
 
     def submit_form(self):
-        """Submits the form."""
+        """
+        Submits the form and waits for the portal's save response (latency in last_latency).
+        A failed save of a fast-filled form is marked transient so the retry types the fields:
+        the read-back only proves the DOM kept the text, not that the picker accepted it.
+        """
+        if self._submit_form():
+            return True
+        if self._filled_fast and self._current_entry is not None and not self.page.is_closed():
+            self.logger.log("  ↩️ Isian cepat gagal disimpan, percobaan berikutnya memakai keyboard.")
+            self._keyboard_entry = self._current_entry
+            self.last_failure = TRANSIENT
+        return False
+
+    def _submit_form(self):
         self.logger.log("Mengirim form...")
+        self.last_latency = None
+        self.last_failure = TRANSIENT
         try:
             # Find the OK button in modal footer
             # Logic: Valid OK button is usually 'btn-primary' and has text 'OK' and is VISIBLE
@@ -171,25 +398,115 @@ class FormFiller:
             submit_btn = self.page.locator("button.btn.btn-primary:has-text('OK'):visible")
             
             if submit_btn.count() > 0:
-                submit_btn.first.click()
+                confirmed = self._click_and_confirm(submit_btn.first)
                 self.logger.log("  > Klik OK.")
-                
-                # Wait for modal to close (smarter than fixed delay)
-                try:
-                    self.page.wait_for_selector(".modal[style*='display: none'], .modal:not(.show)", timeout=3000)
-                except:
-                    time.sleep(0.5)  # Fallback short wait
+                if confirmed is False:
+                    return False
+                if confirmed is None:
+                    # No save response seen: wait for modal to close (smarter than fixed delay)
+                    try:
+                        self.page.wait_for_selector(".modal[style*='display: none'], .modal:not(.show)", timeout=3000)
+                    except:
+                        time.sleep(0.5)  # Fallback short wait
+                self._record_submitted()
                 return True
             else:
                 self.logger.log("  ❌ Tidak dapat menemukan tombol SUBMIT (OK)!")
                 # Fallback: Try generic footer selector
                 try:
                     self.page.click("//div[contains(@class, 'modal-footer')]//button[contains(text(), 'OK')]")
+                    self.submit_clicked = True
                     self.logger.log("  > Klik OK (Fallback).")
+                    self._record_submitted()
                     return True
                 except:
                     return False
 
         except Exception as e:
             self.logger.log(f"❌ Error mengirim: {e}")
+            self.last_failure = classify_error(e)
+            return False
+
+    def _click_and_confirm(self, button):
+        """
+        Clicks OK and waits for the portal's save response.
+        Returns True/False from its status and body, or None when no save request was seen.
+        In 'http' mode the first confirmed request is recorded as the replay template.
+        """
+        started = time.perf_counter()
+        clicked = False
+        try:
+            with self.page.expect_response(lambda r: _is_save_request(r.request),
+                                           timeout=SAVE_REQUEST_TIMEOUT_MS) as info:
+                button.click()
+                clicked = True
+                self.submit_clicked = True
+            response = info.value
+            body = response.text()
+        except Exception as e:
+            if not clicked:
+                raise
+            self.logger.log(f"  ⚠️ Respons simpan tidak tertangkap: {e}")
+            return None
+        self.last_latency = time.perf_counter() - started
+        if not is_save_success(response.status, body):
+            self.logger.log(f"  ❌ Portal menolak data (status {response.status}): {body[:200]}")
+            self.last_failure = classify_status(response.status)
             return False
+        self.logger.log(f"  ✓ Disimpan portal (status {response.status}, {self.last_latency * 1000:.0f} ms)")
+        if self.submit_mode == 'http' and self.submit_template is None:
+            self._record_template(response.request)
+        return True
+
+    def _record_template(self, request):
+        """Keeps the confirmed save request as the template for later entries."""
+        try:
+            template = SubmitTemplate.record(request.url, request.method, request.all_headers(),
+                                             request.post_data or '', self._current_entry, self._current_doc_url)
+        except Exception as e:
+            self.logger.log(f"  ⚠️ Request simpan tidak bisa direkam, tetap via form: {e}")
+            return
+        if template is None:
+            self.logger.log("  ⚠️ Format request simpan tidak dikenali, tetap via form.")
+            return
+        self.submit_template = template
+        self.logger.log(f"  📡 Request simpan direkam: {template.method} {template.url}")
+
+    def can_submit_direct(self, entry: Entry) -> bool:
+        return self.submit_template is not None and self.submit_template.accepts(entry)
+
+    def submit_direct(self, entry: Entry, doc_url: str) -> bool:
+        """
+        Replays the recorded save request for `entry` through the context's request API
+        (same cookies as the page). On failure the template is dropped so the next UI
+        submit records a fresh one.
+        """
+        url, method, headers, body = self.submit_template.build_request(entry, doc_url)
+        self.last_latency = None
+        started = time.perf_counter()
+        try:
+            # Redirects are not followed: a redirect to the login page is a failed save
+            response = self.page.context.request.fetch(url, method=method, headers=headers,
+                                                       data=body, max_redirects=0)
+            ok = is_save_success(response.status, response.text())
+        except Exception as e:
+            self.logger.log(f"  ❌ Kirim HTTP gagal: {e}")
+            self.submit_template = None
+            return False
+        self.last_latency = time.perf_counter() - started
+        if not ok:
+            self.logger.log(f"  ❌ Portal menolak kiriman HTTP (status {response.status}).")
+            self.submit_template = None
+            return False
+        self.logger.log(f"  ✓ Disimpan portal (status {response.status}, {self.last_latency * 1000:.0f} ms)")
+        self._current_entry = entry
+        self._record_submitted()
+        return True
+
+    def _record_submitted(self):
+        """Writes the submitted entry through to the calendar scan cache."""
+        entry, self._current_entry = self._current_entry, None
+        if self.scan_cache is None or entry is None:
+            return
+        self.scan_cache.add_slot(entry.date, ExistingSlot(entry.start_min, entry.end_min))
+        self.scan_cache.save()
@@ -0,0 +1,77 @@
+"""
+Local year-indexed store of holidays / disabled days.
+Every holiday seen on the portal calendar is remembered in holidays.json; an optional
+user list (config `national_holidays`) is merged in. Planning drops these dates before
+any calendar navigation.
+"""
+
+from datetime import date
+from typing import Dict, Iterable, Set
+from utils import normalize_date
+from json_store import load_json, save_json
+
+HOLIDAY_FILE = 'holidays.json'
+HOLIDAY_STORE_VERSION = 1
+
+
+class HolidayStore:
+    def __init__(self, path: str = HOLIDAY_FILE):
+        self.path = path
+        self.observed: Dict[str, Set[str]] = {}  # year -> ISO dates seen disabled on the calendar
+        self.user: Dict[str, Set[str]] = {}      # year -> ISO dates from the user list (not persisted)
+        self._dirty = False
+
+    @staticmethod
+    def _add(store: Dict[str, Set[str]], iso_dates: Iterable[str]) -> int:
+        added = 0
+        for value in iso_dates:
+            iso_date = normalize_date(str(value))
+            try:
+                date.fromisoformat(iso_date)
+            except ValueError:
+                continue
+            year_dates = store.setdefault(iso_date[:4], set())
+            if iso_date not in year_dates:
+                year_dates.add(iso_date)
+                added += 1
+        return added
+
+    def add_observed(self, iso_dates: Iterable[str]) -> int:
+        """Remembers holidays seen on the calendar. Returns the number of new dates."""
+        added = self._add(self.observed, iso_dates)
+        if added:
+            self._dirty = True
+        return added
+
+    def add_user(self, dates: Iterable[str]) -> int:
+        """Merges a user-supplied holiday list (any format normalize_date understands)."""
+        return self._add(self.user, dates)
+
+    def is_holiday(self, iso_date: str) -> bool:
+        year = iso_date[:4]
+        return iso_date in self.observed.get(year, ()) or iso_date in self.user.get(year, ())
+
+    def __contains__(self, iso_date: str) -> bool:
+        return self.is_holiday(iso_date)
+
+    def dates_between(self, start: str, end: str) -> Set[str]:
+        """All known holidays in the inclusive ISO range; only the years involved are read."""
+        found = set()
+        for year in range(int(start[:4]), int(end[:4]) + 1):
+            for store in (self.observed, self.user):
+                found.update(d for d in store.get(str(year), ()) if start <= d <= end)
+        return found
+
+    def load(self):
+        """Loads observed holidays. A missing or corrupt file yields an empty store."""
+        observed = load_json(self.path, HOLIDAY_STORE_VERSION, "Holiday store",
+                             lambda data: {year: set(dates) for year, dates in data.get('observed', {}).items()})
+        self.observed = observed or {}
+
+    def save(self):
+        """Writes observed holidays to disk if new ones were added."""
+        if not self._dirty:
+            return
+        observed = {year: sorted(dates) for year, dates in sorted(self.observed.items())}
+        if save_json(self.path, HOLIDAY_STORE_VERSION, "Holiday store", {'observed': observed}, indent=2):
+            self._dirty = False
@@ -0,0 +1,90 @@
+"""
+Per-date interval index for collision checks between doc entries and the calendar.
+Intervals are minute ranges [start, end); each date keeps them sorted by start with
+a running maximum of end times, so an overlap query is one bisect.
+"""
+
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+from entry import ExistingSlot
+
+NEW = 'new'
+DUPLICATE = 'duplicate'
+OVERLAP = 'overlapping'
+HOLIDAY = 'holiday'
+
+
+class _DayIntervals:
+    __slots__ = ('intervals', 'starts', 'max_end')
+
+    def __init__(self):
+        self.intervals = []  # sorted (start_min, end_min)
+        self.starts = []
+        self.max_end = []    # max_end[i] = (end, index) of the longest-reaching interval in intervals[:i + 1]
+
+    def add(self, start: int, end: int):
+        insort(self.intervals, (start, end))
+        self.starts = [s for s, _ in self.intervals]
+        self.max_end = []
+        best = (-1, -1)
+        for i, (_, e) in enumerate(self.intervals):
+            if e > best[0]:
+                best = (e, i)
+            self.max_end.append(best)
+
+    def find_overlap(self, start: int, end: int) -> Optional[Tuple[int, int]]:
+        # Only intervals starting before `end` can overlap; the one reaching furthest decides
+        i = bisect_left(self.starts, end)
+        if i == 0:
+            return None
+        reach, idx = self.max_end[i - 1]
+        return self.intervals[idx] if reach > start else None
+
+    def contains(self, start: int, end: int) -> bool:
+        i = bisect_left(self.intervals, (start, end))
+        return i < len(self.intervals) and self.intervals[i] == (start, end)
+
+
+class IntervalIndex:
+    """Sorted intervals and holiday flags per ISO date."""
+
+    def __init__(self):
+        self._days: Dict[str, _DayIntervals] = {}
+        self._holidays = set()
+
+    @classmethod
+    def from_existing(cls, existing: Dict[str, List[ExistingSlot]]) -> 'IntervalIndex':
+        """Builds the index from CalendarScanner output. Events with unreadable times are not indexed."""
+        index = cls()
+        for iso_date, slots in existing.items():
+            for slot in slots:
+                if slot.is_holiday:
+                    index._holidays.add(iso_date)
+                elif slot.kind == ExistingSlot.EVENT:
+                    index.add(iso_date, slot.start_min, slot.end_min)
+        return index
+
+    def add(self, iso_date: str, start_min: int, end_min: int):
+        if 0 <= start_min < end_min:
+            self._days.setdefault(iso_date, _DayIntervals()).add(start_min, end_min)
+
+    def is_holiday(self, iso_date: str) -> bool:
+        return iso_date in self._holidays
+
+    def classify(self, iso_date: str, start_min: int, end_min: int) -> Tuple[str, Optional[Tuple[int, int]]]:
+        """
+        Returns (status, conflicting interval): HOLIDAY, DUPLICATE (same start and end),
+        OVERLAP (any other intersection) or NEW.
+        """
+        if iso_date in self._holidays:
+            return HOLIDAY, None
+        day = self._days.get(iso_date)
+        if day is None:
+            return NEW, None
+        if day.contains(start_min, end_min):
+            return DUPLICATE, (start_min, end_min)
+        other = day.find_overlap(start_min, end_min)
+        if other is not None:
+            return OVERLAP, other
+        return NEW, None
+
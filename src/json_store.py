@@ -0,0 +1,40 @@
+"""
+Versioned JSON files for the local caches and stores.
+Loading tolerates a missing, corrupt or outdated file; saving writes a temporary file
+and swaps it in, so an interrupted run never leaves a half-written file behind.
+"""
+
+import os
+import json
+from typing import Any, Callable, Optional
+
+
+def load_json(path: str, version: int, label: str, read: Callable[[dict], Any] = None) -> Optional[Any]:
+    """
+    read(data) for the file's JSON object (the data itself without `read`), or None if the
+    file is missing, unreadable or written with another version. Errors are printed with `label`.
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != version:
+            return None
+        return read(data) if read else data
+    except Exception as e:
+        print(f"{label} load error: {e}")
+        return None
+
+
+def save_json(path: str, version: int, label: str, data: dict, **dump_options) -> bool:
+    """Writes {'version': version, **data} atomically. Returns False (error printed) if it failed."""
+    try:
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': version, **data}, f, **dump_options)
+        os.replace(tmp_path, path)
+        return True
+    except Exception as e:
+        print(f"{label} save error: {e}")
+        return False
@@ -1,12 +1,21 @@
 
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
+from tkinter import ttk, messagebox, scrolledtext, simpledialog
 import json
 import os
 import threading
 from browser_controller import BrowserController
-from utils import Logger, normalize_date, normalize_time
-from doc_parser import parse_google_doc_text
+from utils import Logger, get_fill_window, get_skp_period
+from doc_parser import parse_google_doc_text, iter_google_doc_entries, set_extra_noise_patterns, noise_signature
+from doc_source import is_local_source, open_doc_source, build_export_url
+from parse_cache import DocParseCache
+from scan_cache import CalendarScanCache
+from holiday_store import HolidayStore
+from action_plan_cache import ActionPlanCache, resolve_action_plan
+from planner import plan_sync, summarize, CREATE, SKIP, CONFLICT
+from pacing import PacingController
+from retry import RetryPolicy, run_with_retries
+from session_store import SESSION_FILE
 from updater import get_current_version, check_for_update, download_update, apply_update, check_pending_update
 
 CONFIG_FILE = 'config.json'
@@ -829,6 +838,10 @@ class DailyReporterApp:
             "username": "",
             "password": "",
             "max_backtrack_days": 3,
+            "doc_fetch_mode": "public",
+            "proof_url": "",
+            "parse_cache_max_blocks": 1000,
+            "doc_noise_patterns": [],
             "browser_headless": False,
             "keep_browser": False
         }
@@ -868,13 +881,28 @@ class DailyReporterApp:
             messagebox.showerror("Informasi Kurang", "Mohon masukkan Link Google Doc Anda")
             return
 
+        # A local file path is no valid Bukti Dukung; entries need a proof link
+        if is_local_source(self.doc_url_var.get().strip()) and not self.config.get('proof_url'):
+            proof_url = simpledialog.askstring(
+                "Link Bukti Dukung",
+                "Dokumen lokal tidak bisa dipakai sebagai Bukti Dukung.\n"
+                "Masukkan link bukti (mis. Google Drive) untuk semua entri:",
+                parent=self.root)
+            proof_url = (proof_url or '').strip()
+            if not proof_url.lower().startswith(('http://', 'https://')):
+                messagebox.showerror("Informasi Kurang", "Dokumen lokal memerlukan link Bukti Dukung (proof_url).")
+                return
+            self.config['proof_url'] = proof_url
+
         # Headless Safety Check
         if self.browser_mode.get() == 2:
             # Check if any critical field is missing
             missing_fields = []
             if not self.username_var.get().strip(): missing_fields.append("Username")
             if not self.password_var.get().strip(): missing_fields.append("Password")
-            if not self.auth_code_var.get().strip(): missing_fields.append("Kode OTP")
+            # A saved session usually makes the OTP unnecessary
+            if not self.auth_code_var.get().strip() and not os.path.exists(SESSION_FILE):
+                missing_fields.append("Kode OTP")
             
             if missing_fields:
                 proceed = messagebox.askyesno(
@@ -901,17 +929,76 @@ class DailyReporterApp:
         try:
             self.logger.log("🚀 Memulai otomatisasi...", 'info')
             
+            doc_source = self.doc_url_var.get().strip()
+            # Bukti Dukung: the Doc link, unless a separate proof URL is configured;
+            # a local file path is never submitted as proof
+            doc_url = self.config.get('proof_url') or ('' if is_local_source(doc_source) else doc_source)
+            if not doc_url:
+                self.logger.log("❌ Dokumen lokal memerlukan proof_url sebagai link Bukti Dukung.", 'error')
+                self.finish_process(None)
+                return
+            try:
+                set_extra_noise_patterns(self.config.get('doc_noise_patterns', []))
+            except Exception as e:
+                self.logger.log(f"⚠️ doc_noise_patterns tidak valid, diabaikan: {e}", 'warning')
+                set_extra_noise_patterns([])
+            parse_cache = DocParseCache(max_blocks=self.config.get('parse_cache_max_blocks', 1000),
+                                        salt=noise_signature())
+            parse_cache.load()
+            # Only the fillable window is parsed; older blocks are skipped by the parser
+            window_start, window_end = get_fill_window()
+            # Known holidays: observed on the portal before, plus the optional user list
+            holiday_store = HolidayStore()
+            holiday_store.load()
+            holiday_store.add_user(self.config.get('national_holidays', []))
+            # Rencana Aksi options seen in an earlier run of this SKP period (None = not read yet);
+            # only a warning source, entries are rejected against the list read in this session
+            skp_period = get_skp_period()
+            action_plan_cache = ActionPlanCache()
+            action_plan_cache.load()
+            cached_action_plans = action_plan_cache.get(skp_period)
+            fill_window = (window_start, window_end)
+            known_holidays = holiday_store.dates_between(window_start, window_end)
+            
+            # Local files and public docs are read before the browser is started
+            pre_plan = None
+            entries = self.read_doc_browserless(doc_source, parse_cache, window_start, window_end)
+            if entries is not None:
+                valid_entries = self.collect_valid_entries(entries, parse_cache, window_start, window_end)
+                if not valid_entries:
+                    self.finish_process(None)
+                    return
+                # Browserless pre-plan: nothing to create, or a dry run, needs no Chromium/SSO at all
+                pre_plan = plan_sync(valid_entries, {}, fill_window, known_holidays)
+                dry_run = self.config.get('dry_run', False)
+                if dry_run or not any(op.action == CREATE for op in pre_plan):
+                    self.log_plan(pre_plan)
+                    self.warn_unknown_action_plans(pre_plan, cached_action_plans)
+                    if dry_run:
+                        self.logger.log("🧪 Dry run: rencana dibuat tanpa membuka browser; kalender portal "
+                                        "belum diperiksa.", 'info')
+                    else:
+                        self.logger.log("✅ Tidak ada yang perlu diisi!", 'success')
+                    self.finish_process(None)
+                    return
+            
             # Initialize Browser
             browser = BrowserController(self.logger, self.config)
             if not browser.launch_browser():
                 self.finish_process(browser)
                 return
 
-            # Navigate to Doc
-            browser.navigate_to_doc(self.doc_url_var.get())
+            doc_text = ""
+            if entries is None:
+                # Fetch Doc text via the export endpoint; render the editor only if that fails
+                if self.config.get('doc_fetch_mode', 'public') != 'render':
+                    doc_text = browser.fetch_doc_export(doc_source)
+                if not doc_text:
+                    browser.navigate_to_doc(doc_source)
             
-            # Navigate to App and Login
-            browser.login(auth_code=self.auth_code_var.get())
+            # Navigate to App and Login (a still-valid saved session skips SSO and OTP)
+            if not browser.probe_session():
+                browser.login(auth_code=self.auth_code_var.get())
             
             # Post-Login Navigation
             if not browser.navigate_to_dashboard():
@@ -919,6 +1006,13 @@ class DailyReporterApp:
                 self.finish_process(browser)
                 return
             
+            # In 'xhr' scan mode the calendar data responses are captured during navigation
+            from calendar_scanner import CalendarScanner
+            scanner = CalendarScanner(browser.page_app, self.logger,
+                                      scan_mode=self.config.get('calendar_scan_mode', 'dom'),
+                                      api_url_pattern=self.config.get('calendar_api_pattern'))
+            scanner.start_response_capture()
+            
             # Smart Calendar Navigation
             if not browser.navigate_to_calendar():
                 self.logger.log("❌ Gagal mencapai halaman Kalender.", 'error')
@@ -930,78 +1024,75 @@ class DailyReporterApp:
             self.logger.log("⏱️ Waiting for page to stabilize...", 'info')
             time.sleep(1)
             
-            self.logger.log("📄 Switching to Google Doc tab...", 'info')
-            if browser.page_doc:
-                browser.page_doc.bring_to_front()
-                
-            doc_text = browser.get_doc_text()
-            if not doc_text:
-                self.logger.log("❌ Gagal mendapatkan teks dokumen.", 'error')
-                self.finish_process(browser)
-                return
-
-            # Debug Dump
-            with open("doc_dump.txt", "w", encoding="utf-8") as f:
-                f.write(doc_text)
-            self.logger.log("💾 Saved raw doc text to 'doc_dump.txt'", 'info')
+            if entries is None:
+                if not doc_text:
+                    self.logger.log("📄 Switching to Google Doc tab...", 'info')
+                    if browser.page_doc:
+                        browser.page_doc.bring_to_front()
+                        
+                    doc_text = browser.get_doc_text()
+                if not doc_text:
+                    self.logger.log("❌ Gagal mendapatkan teks dokumen.", 'error')
+                    self.finish_process(browser)
+                    return
 
-            entries = parse_google_doc_text(doc_text)
-            self.logger.log(f"✓ Parsed {len(entries)} raw entries.", 'success')
-            
-            valid_entries = []
-            for entry in entries:
-                norm_date = normalize_date(entry['date_raw'])
-                if norm_date:
-                    entry['date'] = norm_date
-                    valid_entries.append(entry)
-
-            if not valid_entries:
-                self.logger.log("⚠️ No valid entries found.", 'warning')
-                with open("doc_dump_fail.txt", "w", encoding="utf-8") as f:
+                # Debug Dump
+                with open("doc_dump.txt", "w", encoding="utf-8") as f:
                     f.write(doc_text)
-                self.finish_process(browser)
-                return
-
-            self.logger.log(f"✓ {len(valid_entries)} valid entries ready.", 'success')
+                self.logger.log("💾 Saved raw doc text to 'doc_dump.txt'", 'info')
+
+                entries = parse_google_doc_text(doc_text, cache=parse_cache,
+                                                date_from=window_start, date_to=window_end)
+                valid_entries = self.collect_valid_entries(entries, parse_cache, window_start, window_end)
+                if not valid_entries:
+                    with open("doc_dump_fail.txt", "w", encoding="utf-8") as f:
+                        f.write(doc_text)
+                    self.finish_process(browser)
+                    return
             
             # --- SMART FILLING LOGIC ---
-            from calendar_scanner import CalendarScanner
-            from utils import is_date_fillable
-            
-            scanner = CalendarScanner(browser.page_app, self.logger)
-            existing_entries = scanner.scan_with_previous_week()
+            # Browserless pre-plan: only weeks holding creatable dates are visited
+            if pre_plan is None:
+                pre_plan = plan_sync(valid_entries, {}, fill_window, known_holidays)
+            candidate_dates = sorted({op.entry.date for op in pre_plan if op.action == CREATE})
+            # Recently scanned weeks are reused from calendar_cache.json
+            scan_cache = CalendarScanCache(ttl_hours=self.config.get('calendar_cache_ttl_hours', 6))
+            scan_cache.load()
+            existing_entries = {}
+            if candidate_dates:
+                existing_entries = scanner.scan_range(candidate_dates[0], candidate_dates[-1], cache=scan_cache)
+                scan_cache.save()
+            scanner.stop_response_capture()
             self.logger.log(f"ℹ️ Found entries on {len(existing_entries)} dates.", 'info')
+            # Remember disabled days so later runs never navigate to them
+            if holiday_store.add_observed(d for d, slots in existing_entries.items()
+                                          if any(slot.is_holiday for slot in slots)):
+                holiday_store.save()
 
-            entries_to_fill = []
-            for entry in valid_entries:
-                date = entry['date']
-                
-                if not is_date_fillable(date):
-                    self.logger.log(f"  ⊗ Skipping {date} (Outside window/Weekend)", 'warning')
-                    continue
-                    
-                is_collision = False
-                if date in existing_entries:
-                    # Check for holiday/disabled day first
-                    if any(e['start'] == 'HOLIDAY' for e in existing_entries[date]):
-                        self.logger.log(f"  🔴 Skipping {date} (Hari Libur/Disabled)", 'warning')
-                        is_collision = True
-                    else:
-                        doc_start = normalize_time(entry['start_time'])
-                        
-                        for existing in existing_entries[date]:
-                            if existing['start'] == doc_start:
-                                self.logger.log(f"  ⊗ Skipping {date} [{doc_start}] (Time Collision)", 'warning')
-                                is_collision = True
-                                break
-                        
-                        if not is_collision:
-                            self.logger.log(f"  ✓ Gap found on {date} at {doc_start}", 'success')
-                
-                if is_collision:
-                    continue
-                    
-                entries_to_fill.append(entry)
+            from form_filler import FormFiller
+            filler = FormFiller(browser.page_app, self.logger, scan_cache=scan_cache,
+                                fill_mode=self.config.get('fill_mode', 'fast'),
+                                action_plan_cache=action_plan_cache, period=skp_period,
+                                submit_mode=self.config.get('submit_mode', 'ui'))
+            ops = plan_sync(valid_entries, existing_entries, fill_window, known_holidays,
+                            unscanned=scanner.unscanned_dates)
+            # Rencana Aksi values are checked against the dropdown as the portal shows it now
+            if any(op.action == CREATE and op.entry.action_plan for op in ops):
+                if browser.page_app:
+                    browser.page_app.bring_to_front()
+                session_action_plans = filler.load_action_plan_options()
+                if session_action_plans:
+                    ops = plan_sync(valid_entries, existing_entries, fill_window, known_holidays,
+                                    session_action_plans, unscanned=scanner.unscanned_dates)
+                else:
+                    self.warn_unknown_action_plans(ops, cached_action_plans)
+            self.log_plan(ops)
+            entries_to_fill = [op.entry for op in ops if op.action == CREATE]
+            
+            if entries_to_fill and self.config.get('dry_run', False):
+                self.logger.log("🧪 Dry run: rencana di atas tidak dikirim ke portal.", 'info')
+                self.finish_process(browser)
+                return
                 
             self.logger.log(f"✓ {len(entries_to_fill)} entries identified for filling.", 'success')
 
@@ -1017,31 +1108,58 @@ class DailyReporterApp:
                 self.finish_process(browser, keep_open=keep_open, close_app=(mode==3))
                 return
 
-            from form_filler import FormFiller
-            filler = FormFiller(browser.page_app, self.logger)
-            doc_url = self.config.get('last_doc_url', '')
-
             self.logger.log("📝 Switching to App tab...", 'info')
             time.sleep(1)
             if browser.page_app:
                 browser.page_app.bring_to_front()
 
+            direct_submitted = []  # saved via the recorded request; confirmed by one re-scan at the end
+            # Delay between entries follows the portal's save latency instead of a fixed sleep
+            pacing = PacingController(max_delay=self.config.get('pacing_max_delay', 5.0))
+            # A failed entry is retried in place (modal dismissed, calendar re-checked) instead of aborting the batch
+            retry_policy = RetryPolicy(max_attempts=self.config.get('entry_retries', 2) + 1)
+            failed_entries = []
             for i, entry in enumerate(entries_to_fill):
-                self.logger.log(f"▶ Entry {i+1}/{len(entries_to_fill)}: {entry['date']}", 'info')
-                
-                if not filler.open_form():
-                    break
-                
-                if not filler.fill_entry(entry, doc_url):
-                    break
+                self.logger.log(f"▶ Entry {i+1}/{len(entries_to_fill)}: {entry.date}", 'info')
+
+                if filler.can_submit_direct(entry):
+                    if filler.submit_direct(entry, doc_url):
+                        self.logger.log("✓ Entri Dikirim (HTTP).", 'success')
+                        direct_submitted.append(entry)
+                        pacing.observe(filler.last_latency)
+                        pacing.wait()
+                        continue
+                    self.logger.log("↩️ Kembali ke pengisian form.", 'warning')
                 
-                if filler.submit_form():
+                ok, attempts, failure = self.fill_entry_with_retries(browser, filler, scanner, entry, doc_url,
+                                                                     retry_policy)
+                if ok:
                     self.logger.log("✓ Entri Dikirim.", 'success')
-                    time.sleep(1)  # Reduced from 3s
+                    pacing.observe(filler.last_latency)
+                    pacing.wait()
+                    # Only the affected day is re-read, once the calendar has refreshed, to confirm the submit
+                    if scanner.verify_entry(entry, scan_cache):
+                        scan_cache.save()
                 else:
-                    self.logger.log("❌ Pengiriman gagal. Menghentikan loop.", 'error')
-                    break
+                    self.logger.log(f"❌ Entri gagal setelah {attempts} percobaan ({failure}).", 'error')
+                    failed_entries.append(entry)
+                    if not browser.page_app or browser.page_app.is_closed():
+                        self.logger.log("❌ Browser tertutup. Menghentikan loop.", 'error')
+                        break
             
+            if direct_submitted:
+                missing = scanner.confirm_entries(direct_submitted, scan_cache)
+                scan_cache.save()
+                self.logger.log(f"ℹ️ Kiriman HTTP: {len(direct_submitted) - len(missing)}/{len(direct_submitted)} "
+                                f"terverifikasi di kalender.", 'success' if not missing else 'warning')
+
+            if failed_entries:
+                self.logger.log(f"⚠️ {len(failed_entries)} entri tidak terkirim:", 'warning')
+                for entry in failed_entries:
+                    self.logger.log(f"  - {entry.date} [{entry.start_time}-{entry.end_time}] {entry.category}", 'warning')
+
+            self.logger.log(f"ℹ️ Latensi simpan: {pacing.summary()}.", 'info')
+            self.logger.log(f"ℹ️ Selector cache: {filler.selectors.stats()}.", 'info')
             self.logger.log("=" * 60, 'info')
             self.logger.log("🎉 Fase 2 Selesai.", 'success')
             
@@ -1071,6 +1189,101 @@ class DailyReporterApp:
             # Don't close on error
             self.logger.log("Proses dijeda karena error.", 'warning')
 
+    def read_doc_browserless(self, source, parse_cache, date_from, date_to):
+        """
+        Parses entries from a local .txt/.md/.docx file or, in 'public' fetch mode,
+        from a publicly shared Google Doc via urllib, without starting the browser.
+        Returns None when the document has to be read through the browser instead.
+        """
+        is_local = is_local_source(source)
+        if is_local:
+            self.logger.log(f"📄 Membaca dokumen lokal: {os.path.basename(source)}", 'info')
+        elif self.config.get('doc_fetch_mode', 'public') == 'public' and build_export_url(source):
+            self.logger.log("📄 Mengunduh Google Doc publik (tanpa browser)...", 'info')
+        else:
+            return None
+        
+        try:
+            chunks = open_doc_source(source)
+            return list(iter_google_doc_entries(chunks, cache=parse_cache,
+                                                date_from=date_from, date_to=date_to))
+        except Exception as e:
+            if is_local:
+                self.logger.log(f"❌ Gagal membaca dokumen lokal: {e}", 'error')
+                return []
+            self.logger.log(f"⚠️ Doc tidak dapat diunduh tanpa browser ({e}). Memakai browser...", 'warning')
+            return None
+
+    def collect_valid_entries(self, entries, parse_cache, window_start, window_end):
+        """Saves the parse cache, logs parse stats and returns entries with a valid date."""
+        parse_cache.save()
+        self.logger.log(f"✓ Parsed {len(entries)} raw entries ({window_start} s/d {window_end}).", 'success')
+        self.logger.log(f"ℹ️ Parse cache: {parse_cache.hits} blocks reused, {parse_cache.misses} re-parsed.", 'info')
+        
+        # Entries carry their normalized date; 0 means the header was not a valid date
+        # Overlaps within the doc itself are reported by plan_sync (duplicate_in_doc / overlaps_doc)
+        valid_entries = [entry for entry in entries if entry.date_ord]
+        if valid_entries:
+            self.logger.log(f"✓ {len(valid_entries)} valid entries ready.", 'success')
+        else:
+            self.logger.log(f"⚠️ No valid entries found ({window_start} s/d {window_end}).", 'warning')
+        return valid_entries
+
+    def fill_entry_with_retries(self, browser, filler, scanner, entry, doc_url, policy):
+        """
+        Opens, fills and submits one entry, retrying transient failures after a recovery
+        (modal dismissed, calendar page re-checked). Returns (ok, attempts, failure kind).
+        """
+        submitted = False  # OK was clicked in any attempt; open_form resets filler.submit_clicked
+
+        def attempt(number):
+            nonlocal submitted
+            # Any earlier submit may have been saved late; never submit the entry twice
+            if submitted and scanner.find_entry(entry):
+                self.logger.log("  ✓ Entri ternyata sudah tersimpan.", 'info')
+                return True, None
+            ok = filler.open_form() and filler.fill_entry(entry, doc_url) and filler.submit_form()
+            submitted = submitted or filler.submit_clicked
+            if ok:
+                return True, None
+            return False, filler.last_failure
+
+        def recover():
+            filler.dismiss_modal()
+            return browser.ensure_calendar_page()
+
+        def on_retry(number, kind, delay):
+            self.logger.log(f"🔁 Gagal ({kind}), mencoba lagi ({number}/{policy.max_attempts}) "
+                            f"dalam {delay:.0f} detik...", 'warning')
+
+        ok, attempts, failure = run_with_retries(attempt, policy, recover, on_retry)
+        if not ok:
+            filler.dismiss_modal()
+        return ok, attempts, failure
+
+    def log_plan(self, ops):
+        """Logs every planned operation and the plan totals."""
+        for op in ops:
+            if op.action == CREATE:
+                self.logger.log(f"  ✓ Gap found: {op.describe()}", 'success')
+            elif op.action == SKIP:
+                self.logger.log(f"  ⊗ Skipping {op.describe()}", 'warning')
+            else:
+                self.logger.log(f"  ⚠️ Konflik: {op.describe()}", 'warning')
+        counts = summarize(ops)
+        self.logger.log(f"ℹ️ Rencana: {counts[CREATE]} dibuat, {counts[SKIP]} dilewati, "
+                        f"{counts[CONFLICT]} konflik.", 'info')
+
+    def warn_unknown_action_plans(self, ops, action_plans):
+        """Warns about planned entries whose Rencana Aksi is not in a cached option list."""
+        if not action_plans:
+            return
+        for op in ops:
+            if (op.action == CREATE and op.entry.action_plan
+                    and resolve_action_plan(op.entry.action_plan, action_plans) is None):
+                self.logger.log(f"  ⚠️ Rencana Aksi '{op.entry.action_plan}' ({op.entry.date}) tidak ada di "
+                                f"daftar Rencana Aksi tersimpan.", 'warning')
+
     def finish_process(self, browser, keep_open=False, close_app=False):
         if browser and not keep_open:
             browser.close_browser()
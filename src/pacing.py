@@ -0,0 +1,57 @@
+"""
+Adaptive pacing between submits.
+The delay before the next entry follows the portal's save latency: it halves toward
+min_delay while responses stay close to the best latency seen, and grows to at least
+the current average (doubling, up to max_delay) when the portal slows down or a
+save could not be confirmed.
+"""
+
+import time
+from typing import List, Optional
+
+# Delay used after an unconfirmed save; matches the old fixed inter-entry sleep
+UNCONFIRMED_DELAY = 1.0
+
+
+class PacingController:
+    def __init__(self, min_delay: float = 0.0, max_delay: float = 5.0,
+                 slow_factor: float = 2.0, smoothing: float = 0.3):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.slow_factor = slow_factor  # average above slow_factor x best latency counts as slow
+        self.smoothing = smoothing      # weight of the newest latency in the moving average
+        self.delay = min_delay
+        self.average = None
+        self.best = None
+        self.latencies: List[float] = []
+
+    def _grow(self, floor: float):
+        self.delay = min(self.max_delay, max(self.delay * 2, floor, self.min_delay))
+
+    def observe(self, latency: Optional[float], ok: bool = True) -> float:
+        """Feeds one save latency in seconds (None = not confirmed). Returns the next delay."""
+        if latency is None or not ok:
+            self._grow(UNCONFIRMED_DELAY)
+            return self.delay
+        self.latencies.append(latency)
+        self.best = latency if self.best is None else min(self.best, latency)
+        if self.average is None:
+            self.average = latency
+        else:
+            self.average = self.smoothing * latency + (1 - self.smoothing) * self.average
+        if self.average > self.slow_factor * self.best:
+            self._grow(self.average)
+        else:
+            self.delay = self.delay / 2 if self.delay / 2 > self.min_delay + 0.05 else self.min_delay
+        return self.delay
+
+    def wait(self, sleep=time.sleep):
+        if self.delay > 0:
+            sleep(self.delay)
+
+    def summary(self) -> str:
+        if not self.latencies:
+            return "belum ada kiriman terkonfirmasi"
+        mean = sum(self.latencies) / len(self.latencies)
+        return (f"{len(self.latencies)} kiriman, rata-rata {mean * 1000:.0f} ms, "
+                f"maks {max(self.latencies) * 1000:.0f} ms")
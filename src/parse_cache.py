@@ -0,0 +1,64 @@
+"""
+Persistent cache of parsed Google Doc date blocks.
+Blocks are keyed by a hash of their raw text, so only edited days are re-parsed.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import List, Optional
+from entry import Entry
+from json_store import load_json, save_json
+
+PARSE_CACHE_FILE = 'parse_cache.json'
+# Bump when the parser output changes so stale cached entries are discarded
+PARSE_CACHE_VERSION = 2
+
+
+class DocParseCache:
+    def __init__(self, path: str = PARSE_CACHE_FILE, max_blocks: int = 1000, salt: str = ''):
+        self.path = path
+        self.max_blocks = max_blocks
+        self.salt = salt  # Parser settings the cached entries depend on (e.g. noise filter)
+        self.blocks = OrderedDict()  # block hash -> list of Entry rows (oldest first)
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+
+    @staticmethod
+    def block_key(block_text: str) -> str:
+        """Hash of a date block's raw text (header included)."""
+        return hashlib.sha1(block_text.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[List[Entry]]:
+        """Returns fresh Entry objects for a cached block, or None on a miss."""
+        cached = self.blocks.get(key)
+        if cached is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.blocks.move_to_end(key)
+        return [Entry.from_row(row) for row in cached]
+
+    def put(self, key: str, entries: List[Entry]):
+        self.blocks[key] = [e.to_row() for e in entries]
+        self.blocks.move_to_end(key)
+        while len(self.blocks) > self.max_blocks:
+            self.blocks.popitem(last=False)
+        self._dirty = True
+
+    def load(self):
+        """Loads the cache from disk. A missing, corrupt or outdated file yields an empty cache."""
+        # Entries parsed with other noise settings are stale
+        blocks = load_json(self.path, PARSE_CACHE_VERSION, "Parse cache",
+                           lambda data: OrderedDict(data.get('blocks', [])) if data.get('salt', '') == self.salt else None)
+        self.blocks = blocks or OrderedDict()
+        while len(self.blocks) > self.max_blocks:
+            self.blocks.popitem(last=False)
+
+    def save(self):
+        """Writes the cache to disk if it changed since loading."""
+        if not self._dirty:
+            return
+        if save_json(self.path, PARSE_CACHE_VERSION, "Parse cache",
+                     {'salt': self.salt, 'blocks': list(self.blocks.items())}):
+            self._dirty = False
@@ -0,0 +1,137 @@
+"""
+Browserless sync planner: decides which doc entries must be created on the portal.
+Takes parsed entries, the scanned calendar slots, known holidays and the fill window
+and returns an ordered list of operations; only CREATE operations need the browser.
+"""
+
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+from entry import Entry, ExistingSlot, minutes_to_time
+from interval_index import IntervalIndex, NEW
+from action_plan_cache import resolve_action_plan
+
+CREATE = 'create'
+SKIP = 'skip'
+CONFLICT = 'conflict'
+
+# Skip reasons
+OUTSIDE_WINDOW = 'outside_window'
+WEEKEND = 'weekend'
+HOLIDAY_DATE = 'holiday'
+ON_CALENDAR = 'on_calendar'
+DUPLICATE_IN_DOC = 'duplicate_in_doc'
+INVALID_ACTION_PLAN = 'invalid_action_plan'
+NOT_SCANNED = 'not_scanned'
+
+# Conflict reasons
+OVERLAPS_CALENDAR = 'overlaps_calendar'
+OVERLAPS_DOC = 'overlaps_doc'
+
+_MESSAGES = {
+    OUTSIDE_WINDOW: "Outside window",
+    WEEKEND: "Weekend",
+    HOLIDAY_DATE: "Hari Libur/Disabled",
+    ON_CALENDAR: "Sudah ada di kalender",
+    DUPLICATE_IN_DOC: "Duplikat di dokumen",
+    INVALID_ACTION_PLAN: "Rencana Aksi tidak ada di daftar",
+    NOT_SCANNED: "Kalender minggu ini tidak terbaca",
+    OVERLAPS_CALENDAR: "Bentrok dengan kalender",
+    OVERLAPS_DOC: "Bentrok di dokumen",
+}
+
+
+class SyncOp:
+    """One planned operation for a doc entry."""
+
+    __slots__ = ('action', 'entry', 'reason', 'other')
+
+    def __init__(self, action: str, entry: Entry, reason: str = '', other: Optional[Tuple[int, int]] = None):
+        self.action = action
+        self.entry = entry
+        self.reason = reason
+        self.other = other  # (start_min, end_min) of the interval it collides with
+
+    def describe(self) -> str:
+        entry = self.entry
+        text = f"{entry.date} [{entry.start_time}-{entry.end_time}] {entry.category}"
+        if self.action == CREATE:
+            return text
+        text += f" ({_MESSAGES.get(self.reason, self.reason)}"
+        if self.other:
+            text += f" {minutes_to_time(self.other[0])}-{minutes_to_time(self.other[1])}"
+        return text + ")"
+
+    def __repr__(self):
+        return f"SyncOp({self.action}, {self.describe()})"
+
+
+def entry_key(entry: Entry) -> Tuple[int, int, int, str]:
+    return (entry.date_ord, entry.start_min, entry.end_min, entry.category)
+
+
+def plan_sync(entries: Iterable[Entry], existing: Dict[str, List[ExistingSlot]],
+              window: Tuple[str, str], holidays: Iterable[str] = (),
+              action_plans: Optional[List[str]] = None, unscanned: Iterable[str] = ()) -> List[SyncOp]:
+    """
+    Returns operations ordered by (date, start time):
+      SKIP      outside the window, weekend, holiday, calendar week not read, unknown Rencana Aksi,
+                already on the calendar, repeated in the doc
+      CONFLICT  overlaps a calendar event or an earlier doc entry
+      CREATE    everything else
+    The window is the inclusive (start, end) ISO date pair from utils.get_fill_window.
+    action_plans is the Rencana Aksi option list read from the portal in this session; None skips that check.
+    unscanned holds ISO dates whose calendar week could not be read (their existing entries are unknown).
+    """
+    window_start = date.fromisoformat(window[0]).toordinal()
+    window_end = date.fromisoformat(window[1]).toordinal()
+    holiday_dates = set(holidays)
+    unscanned_dates = set(unscanned)
+    calendar = IntervalIndex.from_existing(existing)
+    # Exact calendar slots as hash keys: (date, start, end)
+    calendar_keys = {(iso_date, slot.start_min, slot.end_min)
+                     for iso_date, slots in existing.items() for slot in slots
+                     if slot.kind == ExistingSlot.EVENT}
+
+    planned = IntervalIndex()
+    seen = set()
+    ops = []
+    for entry in sorted(entries, key=lambda e: (e.date_ord, e.start_min)):
+        iso_date = entry.date
+        key = entry_key(entry)
+
+        if not window_start <= entry.date_ord <= window_end:
+            ops.append(SyncOp(SKIP, entry, OUTSIDE_WINDOW))
+        elif date.fromordinal(entry.date_ord).weekday() >= 5:
+            ops.append(SyncOp(SKIP, entry, WEEKEND))
+        elif iso_date in holiday_dates or calendar.is_holiday(iso_date):
+            ops.append(SyncOp(SKIP, entry, HOLIDAY_DATE))
+        elif iso_date in unscanned_dates:
+            ops.append(SyncOp(SKIP, entry, NOT_SCANNED))
+        elif (action_plans is not None and entry.action_plan
+              and resolve_action_plan(entry.action_plan, action_plans) is None):
+            ops.append(SyncOp(SKIP, entry, INVALID_ACTION_PLAN))
+        elif key in seen:
+            ops.append(SyncOp(SKIP, entry, DUPLICATE_IN_DOC))
+        elif (iso_date, entry.start_min, entry.end_min) in calendar_keys:
+            ops.append(SyncOp(SKIP, entry, ON_CALENDAR))
+        else:
+            status, other = calendar.classify(iso_date, entry.start_min, entry.end_min)
+            if status != NEW:
+                ops.append(SyncOp(CONFLICT, entry, OVERLAPS_CALENDAR, other))
+            else:
+                status, other = planned.classify(iso_date, entry.start_min, entry.end_min)
+                if status != NEW:
+                    ops.append(SyncOp(CONFLICT, entry, OVERLAPS_DOC, other))
+                else:
+                    planned.add(iso_date, entry.start_min, entry.end_min)
+                    ops.append(SyncOp(CREATE, entry))
+        seen.add(key)
+    return ops
+
+
+def summarize(ops: Iterable[SyncOp]) -> Dict[str, int]:
+    """{'create': n, 'skip': n, 'conflict': n}"""
+    counts = {CREATE: 0, SKIP: 0, CONFLICT: 0}
+    for op in ops:
+        counts[op.action] += 1
+    return counts
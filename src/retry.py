@@ -0,0 +1,67 @@
+"""
+Per-entry retries for the form filling loop.
+Failures are classified as transient (timeouts, missing elements, busy portal) or
+permanent (validation rejects, closed browser); only transient ones are retried,
+with a recovery step and a bounded exponential backoff between attempts.
+"""
+
+import time
+from typing import Callable, Optional, Tuple
+
+TRANSIENT = 'transient'
+PERMANENT = 'permanent'
+
+# Save responses worth another try: timeout, too early, rate limited
+_RETRYABLE_STATUS = {408, 425, 429}
+
+
+def classify_status(status: int) -> str:
+    """Kind of a rejected save response. 5xx and throttling are transient; other rejects are validation errors."""
+    if status in _RETRYABLE_STATUS or status >= 500:
+        return TRANSIENT
+    return PERMANENT
+
+
+def classify_error(error: Exception) -> str:
+    """Kind of an exception raised while filling. Only a closed page/browser is permanent."""
+    if 'has been closed' in str(error) or 'Target closed' in str(error):
+        return PERMANENT
+    return TRANSIENT
+
+
+class RetryPolicy:
+    def __init__(self, max_attempts: int = 3, base_delay: float = 1.0, max_delay: float = 8.0):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int) -> float:
+        """Backoff after the given (1-based) failed attempt."""
+        return min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+
+
+def run_with_retries(action: Callable[[int], Tuple[bool, Optional[str]]], policy: RetryPolicy,
+                     recover: Callable[[], bool] = None,
+                     on_retry: Callable[[int, str, float], None] = None,
+                     sleep=time.sleep) -> Tuple[bool, int, Optional[str]]:
+    """
+    Calls action(attempt) -> (ok, failure kind) until it succeeds, fails permanently or
+    runs out of attempts. Before each retry: on_retry(next attempt, kind, delay), the
+    backoff sleep, then recover(); a False from recover stops the retries.
+    Returns (ok, attempts used, kind of the last failure).
+    """
+    kind = None
+    for attempt in range(1, policy.max_attempts + 1):
+        ok, kind = action(attempt)
+        if ok:
+            return True, attempt, None
+        kind = kind or TRANSIENT
+        if kind == PERMANENT or attempt == policy.max_attempts:
+            return False, attempt, kind
+        delay = policy.delay(attempt)
+        if on_retry:
+            on_retry(attempt + 1, kind, delay)
+        sleep(delay)
+        if recover and not recover():
+            return False, attempt, kind
+    return False, policy.max_attempts, kind
@@ -0,0 +1,80 @@
+"""
+Persistent cache of scanned calendar weeks, keyed by ISO week ('2026-W06').
+Weeks younger than the TTL are not navigated to or scanned again; submitted
+entries are written through so back-to-back runs see them without a rescan.
+"""
+
+import time
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+from entry import ExistingSlot
+from json_store import load_json, save_json
+
+CALENDAR_CACHE_FILE = 'calendar_cache.json'
+CALENDAR_CACHE_VERSION = 1
+
+
+def week_key(day: date) -> str:
+    """date(2026, 2, 6) -> '2026-W06'."""
+    year, week, _ = day.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+class CalendarScanCache:
+    def __init__(self, path: str = CALENDAR_CACHE_FILE, ttl_hours: float = 6):
+        self.path = path
+        self.ttl = ttl_hours * 3600
+        self.weeks = {}  # week key -> {'scanned_at': epoch seconds, 'dates': {ISO date: [slot rows]}}
+        self._dirty = False
+
+    def _fresh(self, week: Optional[Dict]) -> bool:
+        return week is not None and self.ttl > 0 and time.time() - week['scanned_at'] < self.ttl
+
+    def get_week(self, monday: date) -> Optional[Dict[str, List[ExistingSlot]]]:
+        """Returns {ISO date: [ExistingSlot, ...]} for a fresh cached week, or None."""
+        week = self.weeks.get(week_key(monday))
+        if not self._fresh(week):
+            return None
+        return {day: [ExistingSlot.from_row(row) for row in rows] for day, rows in week['dates'].items()}
+
+    def put_week(self, monday: date, existing: Dict[str, List[ExistingSlot]]):
+        """Stores a complete scan of the week starting at monday (dates outside it are ignored)."""
+        first, last = monday.isoformat(), (monday + timedelta(days=6)).isoformat()
+        self.weeks[week_key(monday)] = {
+            'scanned_at': time.time(),
+            'dates': {day: [slot.to_row() for slot in slots]
+                      for day, slots in existing.items() if first <= day <= last},
+        }
+        self._dirty = True
+
+    def add_slot(self, iso_date: str, slot: ExistingSlot):
+        """Write-through after a successful submit. Weeks that were never scanned stay uncached."""
+        week = self.weeks.get(week_key(date.fromisoformat(iso_date)))
+        if not self._fresh(week):
+            return
+        week['dates'].setdefault(iso_date, []).append(slot.to_row())
+        self._dirty = True
+
+    def set_day(self, iso_date: str, slots: List[ExistingSlot]):
+        """Replaces one day's slots with a fresh single-day scan."""
+        week = self.weeks.get(week_key(date.fromisoformat(iso_date)))
+        if not self._fresh(week):
+            return
+        if slots:
+            week['dates'][iso_date] = [slot.to_row() for slot in slots]
+        else:
+            week['dates'].pop(iso_date, None)
+        self._dirty = True
+
+    def load(self):
+        """Loads the cache from disk, dropping expired weeks. A missing or corrupt file yields an empty cache."""
+        weeks = load_json(self.path, CALENDAR_CACHE_VERSION, "Calendar cache",
+                          lambda data: {key: week for key, week in data.get('weeks', {}).items() if self._fresh(week)})
+        self.weeks = weeks or {}
+
+    def save(self):
+        """Writes the cache to disk if it changed."""
+        if not self._dirty:
+            return
+        if save_json(self.path, CALENDAR_CACHE_VERSION, "Calendar cache", {'weeks': self.weeks}):
+            self._dirty = False
@@ -0,0 +1,88 @@
+"""
+Per-session selector registry for the 'Tambah Progress Harian' form.
+Fields are resolved once per modal open by a single page.evaluate that tags each
+element with data-dr-field="<field>"; later lookups use that attribute as a plain
+CSS selector instead of document-wide XPath searches. A tag is reused while it is
+still unique and visible (hit) and re-resolved otherwise (miss).
+"""
+
+from typing import Dict, Optional
+
+FIELD_ATTR = 'data-dr-field'
+
+# label: text of the form-group label; input: element inside that group (none = the group itself)
+# css: direct selector for fields with a stable name attribute
+FIELD_RULES = {
+    'action_plan': {'label': 'Rencana Aksi'},
+    'date': {'label': 'Tanggal Kegiatan', 'input': "input[name='date']"},
+    'start': {'label': 'Jam Mulai', 'input': "input[name='date']"},
+    'end': {'label': 'Jam Selesai', 'input': "input[name='date']"},
+    'kegiatan': {'css': "input[name='kegiatan']"},
+    'realisasi': {'css': "input[name='realisasi_activity']"},
+    'bukti': {'css': "input[name='bukti_eviden']"},
+}
+
+ENSURE_JS = """(rules) => {
+    const ATTR = '""" + FIELD_ATTR + """';
+    const visible = (el) => !!el && el.isConnected && el.getClientRects().length > 0;
+    const resolve = (rule) => {
+        if (rule.css) {
+            for (const el of document.querySelectorAll(rule.css)) if (visible(el)) return el;
+            return null;
+        }
+        for (const label of document.querySelectorAll('.form-group label')) {
+            if (!label.textContent.includes(rule.label)) continue;
+            const group = label.closest('.form-group');
+            const el = rule.input ? group.querySelector(rule.input) : group;
+            if (visible(el)) return el;
+        }
+        return null;
+    };
+    const status = {};
+    for (const [key, rule] of Object.entries(rules)) {
+        const tagged = document.querySelectorAll(`[${ATTR}="${key}"]`);
+        if (tagged.length === 1 && visible(tagged[0])) { status[key] = 'hit'; continue; }
+        tagged.forEach(el => el.removeAttribute(ATTR));
+        const el = resolve(rule);
+        if (el) { el.setAttribute(ATTR, key); status[key] = 'miss'; } else { status[key] = 'missing'; }
+    }
+    return status;
+}"""
+
+
+class SelectorRegistry:
+    def __init__(self, page, rules: Dict = None):
+        self.page = page
+        self.rules = rules or FIELD_RULES
+        self.resolved = set()
+        self.hits = 0
+        self.misses = 0
+        self.missing = 0
+
+    def ensure(self) -> bool:
+        """Validates/re-resolves every field in one round-trip. Returns False if the script failed."""
+        try:
+            status = self.page.evaluate(ENSURE_JS, self.rules)
+        except Exception:
+            self.resolved = set()
+            return False
+        self.resolved = set()
+        for field, state in status.items():
+            if state == 'hit':
+                self.hits += 1
+                self.resolved.add(field)
+            elif state == 'miss':
+                self.misses += 1
+                self.resolved.add(field)
+            else:
+                self.missing += 1
+        return True
+
+    def css(self, field: str) -> Optional[str]:
+        """Stable CSS selector for a resolved field, or None (caller falls back to its XPath)."""
+        if field in self.resolved:
+            return f'[{FIELD_ATTR}="{field}"]'
+        return None
+
+    def stats(self) -> str:
+        return f"{self.hits} hit, {self.misses} miss, {self.missing} tidak ditemukan"
@@ -0,0 +1,114 @@
+"""
+Encrypted store for the browser context's storage_state (cookies + localStorage).
+Saved after a successful login and loaded on the next launch so a still-valid portal
+session skips SSO and OTP. The file is encrypted with Windows DPAPI (bound to the
+current Windows user); where DPAPI is not available no session is persisted.
+"""
+
+import os
+import json
+import time
+from typing import Callable, Optional
+
+SESSION_FILE = 'session_state.bin'
+SESSION_STORE_VERSION = 1
+_MAGIC = b'DRS1'
+_ENTROPY = b'daily-reporter-session'
+_CRYPTPROTECT_UI_FORBIDDEN = 0x1
+
+
+def _dpapi(data: bytes, protect: bool) -> bytes:
+    import ctypes
+    from ctypes import wintypes
+
+    class DATA_BLOB(ctypes.Structure):
+        _fields_ = [('cbData', wintypes.DWORD), ('pbData', ctypes.POINTER(ctypes.c_char))]
+
+    def blob(value: bytes):
+        buffer = ctypes.create_string_buffer(value, len(value))
+        return DATA_BLOB(len(value), ctypes.cast(buffer, ctypes.POINTER(ctypes.c_char))), buffer
+
+    source, _source_buffer = blob(data)
+    entropy, _entropy_buffer = blob(_ENTROPY)
+    result = DATA_BLOB()
+    if protect:
+        ok = ctypes.windll.crypt32.CryptProtectData(ctypes.byref(source), 'DailyReporter session', ctypes.byref(entropy),
+                                                    None, None, _CRYPTPROTECT_UI_FORBIDDEN, ctypes.byref(result))
+    else:
+        ok = ctypes.windll.crypt32.CryptUnprotectData(ctypes.byref(source), None, ctypes.byref(entropy),
+                                                      None, None, _CRYPTPROTECT_UI_FORBIDDEN, ctypes.byref(result))
+    if not ok:
+        raise ctypes.WinError()
+    try:
+        return ctypes.string_at(result.pbData, result.cbData)
+    finally:
+        ctypes.windll.kernel32.LocalFree(result.pbData)
+
+
+def dpapi_protect(data: bytes) -> bytes:
+    return _dpapi(data, True)
+
+
+def dpapi_unprotect(data: bytes) -> bytes:
+    return _dpapi(data, False)
+
+
+class SessionStore:
+    def __init__(self, path: str = SESSION_FILE, max_age_hours: float = 12,
+                 protect: Callable[[bytes], bytes] = None, unprotect: Callable[[bytes], bytes] = None):
+        self.path = path
+        self.max_age = max_age_hours * 3600
+        if protect is None and os.name == 'nt':
+            protect, unprotect = dpapi_protect, dpapi_unprotect
+        self.protect = protect
+        self.unprotect = unprotect
+
+    @property
+    def available(self) -> bool:
+        """False when no encryption is available (the session is then never written to disk)."""
+        return self.protect is not None and self.unprotect is not None
+
+    def load(self, user: str) -> Optional[dict]:
+        """
+        The stored storage_state for `user`, or None if missing, expired, saved for another
+        account or unreadable (e.g. copied from another Windows user).
+        """
+        if not self.available or not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, 'rb') as f:
+                raw = f.read()
+            if not raw.startswith(_MAGIC):
+                return None
+            data = json.loads(self.unprotect(raw[len(_MAGIC):]).decode('utf-8'))
+        except Exception as e:
+            print(f"Session store load error: {e}")
+            return None
+        if data.get('version') != SESSION_STORE_VERSION or data.get('user') != user:
+            return None
+        if time.time() - data.get('saved_at', 0) > self.max_age:
+            return None
+        return data.get('state')
+
+    def save(self, user: str, state: dict) -> bool:
+        """Encrypts and writes the storage_state. Returns False if it was not stored."""
+        if not self.available:
+            return False
+        try:
+            payload = json.dumps({'version': SESSION_STORE_VERSION, 'user': user,
+                                  'saved_at': time.time(), 'state': state}).encode('utf-8')
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(_MAGIC + self.protect(payload))
+            os.replace(tmp_path, self.path)
+            return True
+        except Exception as e:
+            print(f"Session store save error: {e}")
+            return False
+
+    def clear(self):
+        try:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+        except Exception as e:
+            print(f"Session store clear error: {e}")
@@ -1,5 +1,11 @@
+import re
 import tkinter as tk
 from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Iterable, List, Tuple
+
+# Entries may be filled from (Today - FILL_WINDOW_DAYS) up to Today
+FILL_WINDOW_DAYS = 3
 
 class Logger:
     def __init__(self, text_widget: tk.Text, log_file="daily_reporter.log"):
@@ -34,22 +40,29 @@ class Logger:
         except UnicodeEncodeError:
             print(full_message.encode('ascii', 'ignore').decode('ascii').strip())
 
+_TIME_HHMM_RE = re.compile(r'^(\d{1,2}):(\d{2})$')
+_NON_DIGIT_RE = re.compile(r'\D')
+
+@lru_cache(maxsize=1024)
 def normalize_time(time_str: str) -> str:
     """
     Normalize various time formats to HH:MM.
     Handles: 0730, 07:30, 07.30, 7:30, 730, etc.
     """
-    import re
     t = time_str.strip().replace('.', ':')
     
+    # Fast path: already canonical "07:30"
+    if len(t) == 5 and t[2] == ':' and t.isascii() and t[:2].isdigit() and t[3:].isdigit():
+        return t
+    
     # Already HH:MM format
-    match = re.match(r'^(\d{1,2}):(\d{2})$', t)
+    match = _TIME_HHMM_RE.match(t)
     if match:
         h, m = int(match.group(1)), int(match.group(2))
         return f"{h:02d}:{m:02d}"
     
     # Pure digits: 0730, 730, 1300, etc.
-    digits = re.sub(r'\D', '', t)
+    digits = _NON_DIGIT_RE.sub('', t)
     if len(digits) == 4:
         return f"{digits[:2]}:{digits[2:]}"
     elif len(digits) == 3:
@@ -57,6 +70,32 @@ def normalize_time(time_str: str) -> str:
     
     return time_str  # Return as-is if unparseable
 
+# Month name mapping (Indonesian + English + abbreviations), built once
+MONTH_NAMES = {
+    # Indonesian
+    'januari': 1, 'februari': 2, 'maret': 3, 'april': 4,
+    'mei': 5, 'juni': 6, 'juli': 7, 'agustus': 8,
+    'september': 9, 'oktober': 10, 'november': 11, 'desember': 12,
+    # Indonesian short
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'jun': 6, 'jul': 7,
+    'agu': 8, 'ags': 8, 'sep': 9, 'okt': 10, 'nov': 11, 'des': 12,
+    # English
+    'january': 1, 'february': 2, 'march': 3, 'may': 5,
+    'june': 6, 'july': 7, 'august': 8, 'october': 10,
+    'december': 12,
+    # English short
+    'aug': 8, 'oct': 10, 'dec': 12,
+}
+
+# The four supported shapes are mutually exclusive, so one alternation replaces four attempts
+_DATE_RE = re.compile(
+    r'(?P<nd>\d{1,2})\s+(?P<nm>[a-z]+)\s+(?P<ny>\d{4})'              # "2 februari 2026"
+    r'|(?P<iy>\d{4})[-/](?P<im>\d{1,2})[-/](?P<id>\d{1,2})$'          # "2026-02-01"
+    r'|(?P<dd>\d{1,2})[-/](?P<dm>\d{1,2})[-/](?P<dy>\d{4})$'          # "01/02/2026"
+    r'|(?P<sd>\d{1,2})\s+(?P<sm>\d{1,2})\s+(?P<sy>\d{4})$'          # "1 1 2026"
+)
+
+@lru_cache(maxsize=1024)
 def normalize_date(date_str: str) -> str:
     """
     Convert various date formats to YYYY-MM-DD.
@@ -67,76 +106,46 @@ def normalize_date(date_str: str) -> str:
         - "01/02/2026" / "1-2-2026" (DD/MM/YYYY)
         - "1 1 2026" (D M YYYY numeric)
     """
-    import re
-    
-    # Month name mapping (Indonesian + English + abbreviations)
-    month_map = {
-        # Indonesian
-        'januari': 1, 'februari': 2, 'maret': 3, 'april': 4,
-        'mei': 5, 'juni': 6, 'juli': 7, 'agustus': 8,
-        'september': 9, 'oktober': 10, 'november': 11, 'desember': 12,
-        # Indonesian short
-        'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'jun': 6, 'jul': 7,
-        'agu': 8, 'ags': 8, 'sep': 9, 'okt': 10, 'nov': 11, 'des': 12,
-        # English
-        'january': 1, 'february': 2, 'march': 3, 'may': 5,
-        'june': 6, 'july': 7, 'august': 8, 'october': 10,
-        'december': 12,
-        # English short
-        'aug': 8, 'oct': 10, 'dec': 12,
-    }
-    
     text = date_str.lower().strip()
     
-    # 1. Named month: "2 Februari 2026" or "2 February 2026" or "01 Jan 2026"
-    match = re.match(r'(\d{1,2})\s+([a-z]+)\s+(\d{4})', text)
-    if match:
-        day, month_name, year = match.groups()
-        month = month_map.get(month_name)
-        if month:
-            return f"{year}-{month:02d}-{int(day):02d}"
+    # Fast path: already ISO "2026-02-01"
+    if (len(text) == 10 and text[4] == '-' and text[7] == '-' and text.isascii()
+            and text[:4].isdigit() and text[5:7].isdigit() and text[8:].isdigit()):
+        return text
     
-    # 2. ISO: "2026-02-01" or "2026/02/01"
-    match = re.match(r'(\d{4})[-/](\d{1,2})[-/](\d{1,2})$', text)
-    if match:
-        year, month, day = match.groups()
-        return f"{year}-{int(month):02d}-{int(day):02d}"
+    match = _DATE_RE.match(text)
+    if not match:
+        return ""  # Return empty if all parsing failed
     
-    # 3. DD/MM/YYYY or DD-MM-YYYY: "01/02/2026" or "1-2-2026"
-    match = re.match(r'(\d{1,2})[-/](\d{1,2})[-/](\d{4})$', text)
-    if match:
-        day, month, year = match.groups()
-        return f"{year}-{int(month):02d}-{int(day):02d}"
+    if match.group('nm'):
+        # 1. Named month: "2 Februari 2026" or "2 February 2026" or "01 Jan 2026"
+        month = MONTH_NAMES.get(match.group('nm'))
+        if not month:
+            return ""
+        year, day = match.group('ny'), match.group('nd')
+    elif match.group('iy'):
+        # 2. ISO: "2026-02-01" or "2026/02/01"
+        year, month, day = match.group('iy', 'im', 'id')
+    elif match.group('dy'):
+        # 3. DD/MM/YYYY or DD-MM-YYYY: "01/02/2026" or "1-2-2026"
+        day, month, year = match.group('dd', 'dm', 'dy')
+    else:
+        # 4. Numeric with spaces: "1 1 2026"
+        day, month, year = match.group('sd', 'sm', 'sy')
     
-    # 4. Numeric with spaces: "1 1 2026"
-    match = re.match(r'(\d{1,2})\s+(\d{1,2})\s+(\d{4})$', text)
-    if match:
-        day, month, year = match.groups()
-        return f"{year}-{int(month):02d}-{int(day):02d}"
-        
-    return ""  # Return empty if all parsing failed
+    return f"{year}-{int(month):02d}-{int(day):02d}"
 
-def is_date_fillable(target_date_str: str) -> bool:
-    """
-    Checks if a date is valid for filling:
-    1. Not Saturday or Sunday.
-    2. Within the [Today - 3 days, Today] window.
-    """
-    try:
-        target_date = datetime.strptime(target_date_str, "%Y-%m-%d")
-        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        
-        # 1. Check Weekend (5 = Saturday, 6 = Sunday)
-        if target_date.weekday() >= 5:
-            return False
-            
-        # 2. Check Window (Today - 3 <= Target <= Today)
-        start_window = today - timedelta(days=3)
-        
-        if start_window <= target_date <= today:
-            return True
-            
-        return False
-        
-    except ValueError:
-        return False
+def normalize_dates(date_strs: Iterable[str]) -> List[str]:
+    """Batch variant of normalize_date (e.g. every date header of a document)."""
+    return [normalize_date(d) for d in date_strs]
+
+def get_fill_window(days_back: int = FILL_WINDOW_DAYS) -> Tuple[str, str]:
+    """Returns the inclusive (start, end) ISO dates of the [Today - days_back, Today] window."""
+    today = datetime.now().date()
+    return (today - timedelta(days=days_back)).isoformat(), today.isoformat()
+
+def get_skp_period(today=None) -> Tuple[str, str]:
+    """Current SKP period as shown on the Penilaian page: ('2026', 'TRIWULAN I')."""
+    today = today or datetime.now().date()
+    qtr = ("TRIWULAN I", "TRIWULAN II", "TRIWULAN III", "TRIWULAN IV")[(today.month - 1) // 3]
+    return str(today.year), qtr
@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+from datetime import date
+from src.action_plan_cache import ActionPlanCache, resolve_action_plan
+from src.utils import get_skp_period
+
+OPTIONS = ['Menyusun laporan bulanan', 'Rapat koordinasi', 'Pemeliharaan aplikasi']
+
+
+class TestActionPlanCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'action_plans.json')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_resolve_index_and_text(self):
+        self.assertEqual(resolve_action_plan('1', OPTIONS), 0)
+        self.assertEqual(resolve_action_plan(' 3 ', OPTIONS), 2)
+        self.assertIsNone(resolve_action_plan('4', OPTIONS))
+        self.assertIsNone(resolve_action_plan('0', OPTIONS))
+        self.assertEqual(resolve_action_plan('rapat', OPTIONS), 1)
+        self.assertIsNone(resolve_action_plan('Apel pagi', OPTIONS))
+        self.assertIsNone(resolve_action_plan('', OPTIONS))
+
+    def test_options_persist_per_period(self):
+        cache = ActionPlanCache(self.path)
+        cache.put(('2026', 'TRIWULAN I'), OPTIONS)
+        cache.save()
+
+        loaded = ActionPlanCache(self.path)
+        loaded.load()
+        self.assertEqual(loaded.get(('2026', 'TRIWULAN I')), OPTIONS)
+        self.assertIsNone(loaded.get(('2026', 'TRIWULAN II')))
+
+    def test_corrupt_file_is_ignored(self):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('{not json')
+        cache = ActionPlanCache(self.path)
+        cache.load()
+        self.assertIsNone(cache.get(('2026', 'TRIWULAN I')))
+
+    def test_skp_period(self):
+        self.assertEqual(get_skp_period(date(2026, 3, 31)), ('2026', 'TRIWULAN I'))
+        self.assertEqual(get_skp_period(date(2026, 10, 1)), ('2026', 'TRIWULAN IV'))
+
+
+if __name__ == '__main__':
+    unittest.main()
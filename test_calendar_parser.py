@@ -0,0 +1,153 @@
+import os
+import json
+import threading
+import unittest
+import urllib.request
+from datetime import date
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from src.calendar_parser import (build_existing_entries, parse_month_year, parse_calendar_html,
+                                 existing_entries_from_html, decode_calendar_payload,
+                                 CalendarResponseCollector, week_offsets)
+
+DUMP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'calendar_dump.html')
+
+HOLIDAY_HTML = """
+<div class="vuecal__title-bar"><div class="vuecal__flex vuecal__title"><button>Maret 2026</button></div></div>
+<div class="vuecal__heading"><div class="weekday-label"><span class="full">Kamis</span><span>&nbsp;19</span></div></div>
+<div class="vuecal__heading"><div class="weekday-label"><span class="full">Jumat</span><span>&nbsp;20</span></div></div>
+<div class="vuecal__body">
+  <div class="vuecal__cell vuecal__cell--disabled"><img src="x.png"><div class="vuecal__event">Nyepi</div></div>
+  <div class="vuecal__cell"><div class="vuecal__event"><div class="vuecal__event-title">Apel</div>
+    <div class="vuecal__event-time">07.30<span>&nbsp;- 08.00</span></div></div></div>
+</div>
+"""
+
+# Recorded calendar API responses (vue-cal style and separate date/time fields)
+API_WEEK_PAYLOAD = {'success': True, 'data': [
+    {'id': 11, 'title': 'Meeting', 'start': '2026-02-02 07:30:00', 'end': '2026-02-02 13:00:00'},
+    {'id': 12, 'title': 'Coding', 'start': '2026-02-02T13:00', 'end': '2026-02-02T15:00'},
+    {'id': 13, 'title': 'Nyepi', 'start': '2026-02-03', 'end': '2026-02-03', 'class': 'libur'},
+    {'id': 14, 'title': 'Tanpa jam', 'tanggal': '2026-02-04'},
+]}
+API_FIELDS_PAYLOAD = {'data': {'events': [
+    {'tanggal': '2026-01-30', 'jam_mulai': '07.30', 'jam_selesai': '16.00'},
+]}}
+
+
+class _CalendarApiHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.startswith('/api/kinerja-harian'):
+            body, content_type = json.dumps(API_WEEK_PAYLOAD).encode('utf-8'), 'application/json'
+        else:
+            body, content_type = json.dumps({'user': 'x', 'roles': ['a']}).encode('utf-8'), 'application/json'
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+WEEK_SNAPSHOT = {
+    'title': 'Februari 2026',
+    'headers': ['Senin 2', 'Selasa 3', 'Rabu 4', 'Kamis 5', 'Jumat 6'],
+    'cells': [
+        {'disabled': False, 'events': ['Meeting dan Penyetaraan Desain\n07:30 - 13:00',
+                                       'Coding\n13.00 - 15.00']},
+        {'disabled': True, 'events': []},
+        {'disabled': False, 'events': []},
+        {'disabled': False, 'events': ['Judul tanpa waktu']},
+        {'disabled': False, 'events': ['Apel\n7:30 - 8:00']},
+    ],
+}
+
+
+class TestCalendarParser(unittest.TestCase):
+    def test_build_existing_entries(self):
+        data = build_existing_entries(WEEK_SNAPSHOT)
+        self.assertEqual(sorted(data), ['2026-02-02', '2026-02-03', '2026-02-05', '2026-02-06'])
+        self.assertEqual(data['2026-02-02'], [{'start': '07:30', 'end': '13:00'},
+                                              {'start': '13:00', 'end': '15:00'}])
+        self.assertEqual(data['2026-02-03'], [{'start': 'HOLIDAY', 'end': 'HOLIDAY'}])
+        self.assertEqual(data['2026-02-05'], [{'start': '?', 'end': '?'}])
+        self.assertEqual(data['2026-02-06'][0].start_min, 450)
+
+    def test_header_cell_mismatch_matches_prefix(self):
+        messages = []
+        snapshot = dict(WEEK_SNAPSHOT, cells=WEEK_SNAPSHOT['cells'][:1])
+        data = build_existing_entries(snapshot, messages.append)
+        self.assertEqual(list(data), ['2026-02-02'])
+        self.assertTrue(messages[0].startswith("⚠️ Mismatch"))
+
+    def test_calendar_dump_snapshot(self):
+        with open(DUMP_PATH, 'r', encoding='utf-8') as f:
+            html = f.read()
+        snapshot = parse_calendar_html(html)
+        self.assertEqual(snapshot['title'], "Minggu 6 (Februari 2026)")
+        self.assertEqual(len(snapshot['headers']), 7)
+        self.assertEqual(snapshot['cells'][0]['events'][0],
+                         "Meeting dan Penyetaraan Desain EKerjasama 07:30 - 13:00")
+
+        data = existing_entries_from_html(html)
+        self.assertEqual({d: [(s.start, s.end) for s in slots] for d, slots in data.items()}, {
+            '2026-02-02': [('07:30', '13:00'), ('13:00', '15:00'), ('15:00', '16:00')],
+            '2026-02-03': [('07:30', '13:00'), ('13:00', '16:00')],
+            '2026-02-04': [('07:30', '16:00')],
+            '2026-02-05': [('07:30', '16:00')],
+        })
+
+    def test_html_disabled_cell_is_holiday(self):
+        data = existing_entries_from_html(HOLIDAY_HTML)
+        self.assertEqual(data['2026-03-19'], [{'start': 'HOLIDAY', 'end': 'HOLIDAY'}])
+        self.assertEqual(data['2026-03-20'], [{'start': '07:30', 'end': '08:00'}])
+
+    def test_decode_calendar_payload(self):
+        data = decode_calendar_payload(API_WEEK_PAYLOAD)
+        self.assertEqual(data['2026-02-02'], [{'start': '07:30', 'end': '13:00'},
+                                              {'start': '13:00', 'end': '15:00'}])
+        self.assertTrue(data['2026-02-03'][0].is_holiday)
+        self.assertEqual(data['2026-02-04'], [{'start': '?', 'end': '?'}])
+        self.assertEqual(decode_calendar_payload(API_FIELDS_PAYLOAD),
+                         {'2026-01-30': [{'start': '07:30', 'end': '16:00'}]})
+        self.assertIsNone(decode_calendar_payload({'user': 'x', 'roles': ['a']}))
+        self.assertIsNone(decode_calendar_payload({'data': []}))
+        self.assertEqual(decode_calendar_payload({'data': []}, allow_empty=True), {})
+
+    def test_collector_with_stand_in_server(self):
+        server = HTTPServer(('127.0.0.1', 0), _CalendarApiHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{server.server_port}"
+        try:
+            collector = CalendarResponseCollector()
+            for path in ('/api/profile', '/api/kinerja-harian?start=2026-02-02&end=2026-02-08'):
+                with urllib.request.urlopen(base + path) as response:
+                    if collector.wants(base + path, response.headers.get('Content-Type')):
+                        collector.add_payload(json.loads(response.read()))
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertEqual(collector.responses, 1)
+        self.assertEqual(sorted(collector.entries), ['2026-02-02', '2026-02-03', '2026-02-04'])
+
+        restricted = CalendarResponseCollector(r'/api/kinerja-harian')
+        self.assertFalse(restricted.wants(base + '/api/profile', 'application/json'))
+        self.assertFalse(restricted.wants(base + '/api/kinerja-harian', 'text/html'))
+
+    def test_week_offsets(self):
+        wednesday, monday = date(2026, 2, 11), date(2026, 2, 9)
+        # Tuesday-Friday runs: the window stays inside the current week
+        self.assertEqual(week_offsets('2026-02-09', '2026-02-11', wednesday), [0])
+        # Monday runs reach back into last week
+        self.assertEqual(week_offsets('2026-02-06', '2026-02-09', monday), [0, -1])
+        self.assertEqual(week_offsets('2026-02-06', '2026-02-04', monday), [-1])
+        self.assertEqual(week_offsets('2026-01-26', '2026-02-16', monday), [0, -1, -2, 1])
+
+    def test_parse_month_year(self):
+        self.assertEqual(parse_month_year("Minggu 6 (Februari 2026)"), (2, 2026))
+        self.assertEqual(parse_month_year("Desember 2025"), (12, 2025))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import json
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlencode
+from src.direct_submit import SubmitTemplate, is_save_success
+from src.entry import Entry
+
+FIRST = Entry('raw', 739653, 450, 720, 'Rapat koordinasi', action_plan='2')   # 2026-02-06
+SECOND = Entry('raw', 739656, 780, 960, 'Coding', action_plan='2')            # 2026-02-09
+DOC = 'https://docs.google.com/document/d/abc/edit'
+
+
+class _StandInPortal(BaseHTTPRequestHandler):
+    """Accepts progress saves like the portal: JSON reply, 422 for a rejected kegiatan."""
+    received = []
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length'])).decode()
+        payload = json.loads(body) if 'json' in self.headers['Content-Type'] else dict(parse_qsl(body))
+        self.received.append((dict(self.headers), payload))
+        ok = payload.get('kegiatan') != 'Ditolak'
+        reply = json.dumps({'success': ok}).encode()
+        self.send_response(200 if ok else 422)
+        self.send_header('Content-Type', 'application/json')
+        self.end_headers()
+        self.wfile.write(reply)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestDirectSubmit(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _StandInPortal)
+        cls.url = f"http://127.0.0.1:{cls.server.server_port}/api/progress-harian"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _StandInPortal.received.clear()
+
+    def send(self, template, entry):
+        url, method, headers, body = template.build_request(entry, DOC)
+        request = urllib.request.Request(url, data=body.encode(), headers=headers, method=method)
+        try:
+            with urllib.request.urlopen(request) as response:
+                return response.status, response.read().decode()
+        except urllib.error.HTTPError as e:
+            return e.code, e.read().decode()
+
+    def test_json_payload_replayed_for_next_entry(self):
+        captured = {'tanggal': '06-02-2026', 'jam_mulai': '07:30', 'jam_selesai': '12:00',
+                    'kegiatan': 'Rapat koordinasi', 'realisasi': {'volume': '1', 'bukti': DOC},
+                    'rencana_aksi_id': 42}
+        headers = {':authority': 'portal', 'content-type': 'application/json', 'x-xsrf-token': 'tok',
+                   'cookie': 'session=1', 'content-length': '200'}
+        template = SubmitTemplate.record(self.url, 'POST', headers, json.dumps(captured), FIRST, DOC)
+        self.assertIsNotNone(template)
+        self.assertTrue(template.accepts(SECOND))
+        self.assertFalse(template.accepts(Entry('raw', 739656, 780, 960, 'X', action_plan='1')))
+
+        status, body = self.send(template, SECOND)
+        self.assertTrue(is_save_success(status, body))
+        sent_headers, payload = _StandInPortal.received[0]
+        self.assertEqual(payload, {'tanggal': '09-02-2026', 'jam_mulai': '13:00', 'jam_selesai': '16:00',
+                                   'kegiatan': 'Coding', 'realisasi': {'volume': '1', 'bukti': DOC},
+                                   'rencana_aksi_id': 42})
+        self.assertEqual(sent_headers.get('X-Xsrf-Token') or sent_headers.get('x-xsrf-token'), 'tok')
+        self.assertNotIn('Cookie', sent_headers)
+
+    def test_form_payload_and_rejection(self):
+        captured = urlencode([('_token', 'csrf'), ('tanggal', '2026-02-06'), ('mulai', '2026-02-06 07:30:00'),
+                              ('selesai', '2026-02-06 12:00:00'), ('kegiatan', 'Rapat koordinasi')])
+        template = SubmitTemplate.record(self.url, 'POST', {'Content-Type': 'application/x-www-form-urlencoded'},
+                                         captured, FIRST, DOC)
+        status, body = self.send(template, SECOND)
+        self.assertTrue(is_save_success(status, body))
+        self.assertEqual(_StandInPortal.received[0][1],
+                         {'_token': 'csrf', 'tanggal': '2026-02-09', 'mulai': '2026-02-09 13:00:00',
+                          'selesai': '2026-02-09 16:00:00', 'kegiatan': 'Coding'})
+
+        status, body = self.send(template, Entry('raw', 739656, 780, 960, 'Ditolak', action_plan='2'))
+        self.assertFalse(is_save_success(status, body))
+
+    def test_unreplayable_requests(self):
+        self.assertIsNone(SubmitTemplate.record(self.url, 'POST', {'content-type': 'multipart/form-data'},
+                                                '--x', FIRST, DOC))
+        # Date shown in a format the template cannot render
+        self.assertIsNone(SubmitTemplate.record(self.url, 'POST', {'content-type': 'application/json'},
+                                                json.dumps({'tanggal': '6 Februari 2026', 'mulai': '07:30',
+                                                            'selesai': '12:00'}), FIRST, DOC))
+
+    def test_save_success_flags(self):
+        self.assertTrue(is_save_success(201, ''))
+        self.assertFalse(is_save_success(302, ''))
+        self.assertFalse(is_save_success(200, '{"status": "error"}'))
+        self.assertFalse(is_save_success(200, '{"errors": {"tanggal": ["wajib"]}}'))
+
+
+if __name__ == '__main__':
+    unittest.main()
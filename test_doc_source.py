@@ -0,0 +1,164 @@
+import os
+import tempfile
+import threading
+import unittest
+import zipfile
+from unittest import mock
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from src.doc_parser import parse_google_doc_text, iter_google_doc_entries
+from src.doc_source import build_export_url, clean_export_text, open_doc_source, is_local_source
+from src.browser_controller import BrowserController
+
+DOC_ID = "1Hghqt2kR3D9P-S_AC38_nS5kDoNVhbWDWBA72m7rbFQ"
+
+DOC_TEXT = """2 Februari 2026
+0730 - 1300 : Meeting dan Penyetaraan Desain 1
+1300 - 1600 : Coding
+3 Februari 2026
+0900 - 1200 : Research 2
+"""
+
+DOCX_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+    + ''.join(f'<w:p><w:r><w:t xml:space="preserve">{line}</w:t></w:r></w:p>' for line in DOC_TEXT.splitlines())
+    + '</w:body></w:document>'
+)
+
+
+class _DocHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == '/private':
+            body, content_type = b'<html>Login</html>', 'text/html; charset=utf-8'
+        else:
+            body, content_type = b'\xef\xbb\xbf' + DOC_TEXT.replace('\n', '\r\n').encode('utf-8'), 'text/plain; charset=utf-8'
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class TestDocSource(unittest.TestCase):
+    def test_export_url(self):
+        expected = f"https://docs.google.com/document/d/{DOC_ID}/export?format=txt"
+        self.assertEqual(build_export_url(f"https://docs.google.com/document/d/{DOC_ID}/edit?usp=sharing"), expected)
+        self.assertEqual(build_export_url(f"https://docs.google.com/document/u/0/d/{DOC_ID}/view"), expected)
+        self.assertEqual(build_export_url("https://example.com/notes.txt"), "")
+
+    def test_clean_export_text(self):
+        self.assertEqual(clean_export_text("\ufeff2 Februari 2026\r\n0730 - 1300 : Rapat\r\n"),
+                         "2 Februari 2026\n0730 - 1300 : Rapat\n")
+
+class _Logger:
+    def __init__(self):
+        self.lines = []
+
+    def log(self, message, tag=None):
+        self.lines.append(message)
+
+
+class _ExportResponse:
+    """Stand-in for a Playwright APIResponse."""
+
+    def __init__(self, status, content_type, body):
+        self.status = status
+        self.ok = 200 <= status < 300
+        self.headers = {'content-type': content_type}
+        self.body = body
+
+    def text(self):
+        return self.body
+
+
+class TestFetchDocExport(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        # The constructor points PLAYWRIGHT_BROWSERS_PATH at <cwd>/browsers; keep both out of the tree
+        with mock.patch('os.getcwd', return_value=self.tmp.name), mock.patch.dict(os.environ):
+            self.browser = BrowserController(_Logger(), {})
+        self.browser.context = mock.MagicMock()
+        self.request = self.browser.context.request
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _fetch(self):
+        return self.browser.fetch_doc_export(f"https://docs.google.com/document/d/{DOC_ID}/edit")
+
+    def test_plain_text_export(self):
+        self.request.get.return_value = _ExportResponse(200, 'text/plain; charset=utf-8',
+                                                        '\ufeff' + DOC_TEXT.replace('\n', '\r\n'))
+        self.assertEqual(self._fetch(), DOC_TEXT)
+        self.assertEqual(self.request.get.call_args[0][0],
+                         f"https://docs.google.com/document/d/{DOC_ID}/export?format=txt")
+
+    def test_login_page_falls_back_to_render(self):
+        for status, content_type in ((302, 'text/html; charset=utf-8'), (200, 'text/html; charset=utf-8')):
+            self.request.get.return_value = _ExportResponse(status, content_type, '<html>Login</html>')
+            self.assertEqual(self._fetch(), "")
+        self.assertIn("HTTP 200", self.browser.logger.lines[-1])
+
+    def test_request_error_falls_back_to_render(self):
+        self.request.get.side_effect = Exception("net::ERR_CONNECTION_RESET")
+        self.assertEqual(self._fetch(), "")
+        self.assertIn("ERR_CONNECTION_RESET", self.browser.logger.lines[-1])
+
+    def test_non_google_url_is_not_fetched(self):
+        self.assertEqual(self.browser.fetch_doc_export("https://example.com/notes.txt"), "")
+        self.request.get.assert_not_called()
+
+
+class TestBrowserlessSources(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.expected = parse_google_doc_text(DOC_TEXT)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, name, content):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def _parse(self, source, chunk_size=16):
+        return list(iter_google_doc_entries(open_doc_source(source, chunk_size)))
+
+    def test_text_file(self):
+        path = self._write('log.txt', DOC_TEXT)
+        self.assertTrue(is_local_source(path))
+        self.assertEqual(self._parse(path), self.expected)
+
+    def test_markdown_file(self):
+        markdown = DOC_TEXT.replace("2 Februari", "## 2 Februari").replace("0730", "- **0730")
+        self.assertEqual(self._parse(self._write('log.md', markdown)), self.expected)
+
+    def test_docx_file(self):
+        path = os.path.join(self.tmp.name, 'log.docx')
+        with zipfile.ZipFile(path, 'w') as archive:
+            archive.writestr('word/document.xml', DOCX_XML)
+        self.assertEqual(self._parse(path), self.expected)
+
+    def test_unsupported_file(self):
+        with self.assertRaises(ValueError):
+            open_doc_source(self._write('log.pdf', ''))
+
+    def test_public_url(self):
+        server = HTTPServer(('127.0.0.1', 0), _DocHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            base = f"http://127.0.0.1:{server.server_port}"
+            self.assertEqual(self._parse(f"{base}/export"), self.expected)
+            with self.assertRaises(ValueError):
+                self._parse(f"{base}/private")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == '__main__':
+    unittest.main()
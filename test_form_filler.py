@@ -0,0 +1,76 @@
+import unittest
+from unittest import mock
+from src.form_filler import FormFiller, FAST_FILL_JS
+from src.entry import Entry
+from src.retry import TRANSIENT, PERMANENT
+
+ENTRY = Entry('6 Februari 2026', 739653, 450, 720, 'Rapat koordinasi')   # 2026-02-06 07:30-12:00
+DOC = 'https://docs.google.com/document/d/abc/edit'
+KEPT = {'date': '06/02/2026', 'start': '07:30', 'end': '12:00', 'kegiatan': 'Rapat koordinasi',
+        'realisasi': '1', 'bukti': DOC}
+
+
+class _Logger:
+    def __init__(self):
+        self.lines = []
+
+    def log(self, message, tag=None):
+        self.lines.append(message)
+
+
+def make_page(read_back, save_status=200):
+    """Page double: answers the fast-fill read-back and the save response of the OK click."""
+    page = mock.MagicMock()
+    page.is_closed.return_value = False
+    page.evaluate.side_effect = lambda script, arg=None: read_back if script == FAST_FILL_JS else {}
+    page.locator.return_value.count.return_value = 1
+    response = page.expect_response.return_value.__enter__.return_value.value
+    response.status = save_status
+    response.text.return_value = '{"success": %s}' % ('true' if save_status < 300 else 'false')
+    return page
+
+
+def fast_fill_calls(page):
+    return sum(1 for c in page.evaluate.call_args_list if c.args[0] == FAST_FILL_JS)
+
+
+class TestFormFillerFallback(unittest.TestCase):
+    def test_fast_fill_verified(self):
+        page = make_page(KEPT)
+        filler = FormFiller(page, _Logger())
+        self.assertTrue(filler.fill_entry(ENTRY, DOC))
+        self.assertEqual(fast_fill_calls(page), 1)
+        page.fill.assert_not_called()
+
+    def test_value_not_kept_falls_back_to_keyboard(self):
+        page = make_page(dict(KEPT, start=''))   # picker reset the text on blur
+        filler = FormFiller(page, _Logger())
+        self.assertTrue(filler.fill_entry(ENTRY, DOC))
+        page.fill.assert_any_call('input[name="kegiatan"]', 'Rapat koordinasi')
+        page.keyboard.type.assert_any_call('07:30', delay=30)
+
+    def test_rejected_fast_save_is_retried_with_keyboard(self):
+        page = make_page(KEPT, save_status=422)
+        filler = FormFiller(page, _Logger())
+        self.assertTrue(filler.fill_entry(ENTRY, DOC))
+        self.assertFalse(filler.submit_form())
+        self.assertEqual(filler.last_failure, TRANSIENT)
+
+        # Next attempt types the fields; a second reject is then final
+        self.assertTrue(filler.fill_entry(ENTRY, DOC))
+        self.assertEqual(fast_fill_calls(page), 1)
+        page.keyboard.type.assert_any_call('07:30', delay=30)
+        self.assertFalse(filler.submit_form())
+        self.assertEqual(filler.last_failure, PERMANENT)
+
+    def test_keyboard_mode_reject_is_permanent(self):
+        page = make_page(KEPT, save_status=422)
+        filler = FormFiller(page, _Logger(), fill_mode='keyboard')
+        self.assertTrue(filler.fill_entry(ENTRY, DOC))
+        self.assertFalse(filler.submit_form())
+        self.assertEqual(filler.last_failure, PERMANENT)
+        self.assertEqual(fast_fill_calls(page), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import os
+import tempfile
+import unittest
+from src.holiday_store import HolidayStore
+
+
+class TestHolidayStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'holidays.json')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_observed_holidays_persist_by_year(self):
+        store = HolidayStore(self.path)
+        self.assertEqual(store.add_observed(['2026-03-19', '2025-12-25', '2026-03-19']), 2)
+        store.save()
+
+        loaded = HolidayStore(self.path)
+        loaded.load()
+        self.assertEqual(sorted(loaded.observed), ['2025', '2026'])
+        self.assertIn('2026-03-19', loaded)
+        self.assertNotIn('2026-03-20', loaded)
+
+    def test_user_list_is_merged_but_not_saved(self):
+        store = HolidayStore(self.path)
+        store.add_user(['17 Agustus 2026', '2026-12-25', 'bukan tanggal'])
+        store.add_observed(['2026-08-18'])
+        self.assertEqual(store.dates_between('2026-08-01', '2026-08-31'), {'2026-08-17', '2026-08-18'})
+        self.assertEqual(store.dates_between('2025-12-20', '2027-01-05'),
+                         {'2026-08-17', '2026-08-18', '2026-12-25'})
+        store.save()
+
+        loaded = HolidayStore(self.path)
+        loaded.load()
+        self.assertNotIn('2026-08-17', loaded)
+        self.assertIn('2026-08-18', loaded)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import random
+import unittest
+from src.interval_index import IntervalIndex, NEW, DUPLICATE, OVERLAP, HOLIDAY
+from src.entry import ExistingSlot
+
+DAY = '2026-02-02'
+
+
+class TestIntervalIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = IntervalIndex.from_existing({
+            DAY: [ExistingSlot.from_times('07:30', '13:00'), ExistingSlot.from_times('13:00', '15:00'),
+                  ExistingSlot.unknown()],
+            '2026-02-03': [ExistingSlot.holiday()],
+        })
+
+    def test_classify(self):
+        self.assertEqual(self.index.classify(DAY, 450, 780), (DUPLICATE, (450, 780)))
+        self.assertEqual(self.index.classify(DAY, 480, 720), (OVERLAP, (450, 780)))   # 08:00-12:00
+        self.assertEqual(self.index.classify(DAY, 840, 960), (OVERLAP, (780, 900)))   # 14:00-16:00
+        self.assertEqual(self.index.classify(DAY, 900, 960), (NEW, None))             # Touching is fine
+        self.assertEqual(self.index.classify(DAY, 400, 450), (NEW, None))
+        self.assertEqual(self.index.classify('2026-02-03', 450, 960), (HOLIDAY, None))
+        self.assertEqual(self.index.classify('2026-02-04', 450, 960), (NEW, None))
+
+    def test_overlap_matches_brute_force(self):
+        rng = random.Random(7)
+        for _ in range(200):
+            index, intervals = IntervalIndex(), []
+            for _ in range(rng.randint(0, 8)):
+                s = rng.randrange(0, 1400)
+                e = s + rng.randint(1, 300)
+                intervals.append((s, e))
+                index.add(DAY, s, e)
+            s = rng.randrange(0, 1400)
+            e = s + rng.randint(1, 300)
+            status, other = index.classify(DAY, s, e)
+            expected = any(a < e and s < b for a, b in intervals)
+            self.assertEqual(status != NEW, expected)
+            if other is not None:
+                self.assertTrue(other[0] < e and s < other[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
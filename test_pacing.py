@@ -0,0 +1,41 @@
+import unittest
+from src.pacing import PacingController, UNCONFIRMED_DELAY
+
+
+class TestPacingController(unittest.TestCase):
+    def test_healthy_portal_runs_at_full_speed(self):
+        pacing = PacingController()
+        for latency in (0.30, 0.25, 0.35, 0.28):
+            self.assertEqual(pacing.observe(latency), 0.0)
+        slept = []
+        pacing.wait(sleep=slept.append)
+        self.assertEqual(slept, [])
+
+    def test_backs_off_when_slow_and_recovers(self):
+        pacing = PacingController(max_delay=5.0)
+        pacing.observe(0.3)
+        delays = [pacing.observe(2.0) for _ in range(4)]
+        self.assertGreater(delays[0], 0)
+        self.assertEqual(delays, sorted(delays))
+        self.assertLessEqual(delays[-1], 5.0)
+
+        for _ in range(20):
+            pacing.observe(0.3)
+        self.assertEqual(pacing.delay, 0.0)
+
+    def test_unconfirmed_saves_are_paced_conservatively(self):
+        pacing = PacingController(max_delay=3.0)
+        self.assertEqual(pacing.observe(None), UNCONFIRMED_DELAY)
+        self.assertEqual(pacing.observe(0.5, ok=False), 2.0)
+        self.assertEqual(pacing.observe(None), 3.0)
+        self.assertIn("belum ada", pacing.summary())
+
+    def test_summary(self):
+        pacing = PacingController()
+        pacing.observe(0.2)
+        pacing.observe(0.4)
+        self.assertEqual(pacing.summary(), "2 kiriman, rata-rata 300 ms, maks 400 ms")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,12 @@
+import os
+import tempfile
 import unittest
-from src.doc_parser import parse_google_doc_text
-from src.utils import normalize_date
+from src.doc_parser import (parse_google_doc_text, iter_google_doc_entries, find_content_bounds,
+                            set_extra_noise_patterns)
+from src.utils import normalize_date, normalize_dates, normalize_time
+from src.parse_cache import DocParseCache
+from src.entry import ExistingSlot
+from bench_parser import generate_doc
 
 SAMPLE_TEXT = """
 2 Februari 2026
@@ -23,6 +29,19 @@ Teknologi Baru
 https://notion.so/research-notes
 """
 
+EDITOR_TEXT = """Laporan EKinerja Harian  Bulan Februari Tahun 2026
+Minta akses edit
+Bagikan
+FileEditTampilanAlatBantuan
+Tab dokumen
+2 Februari 2026
+0730 - 1300 : Meeting dan Penyetaraan Desain 1
+Dibagikan dengan tim
+Aktifkan dukungan pembaca layar
+Untuk mengaktifkan dukungan pembaca layar, tekan Ctrl+Alt+Z.
+Banner disembunyikan
+"""
+
 class TestDocParser(unittest.TestCase):
     def test_parsing(self):
         entries = parse_google_doc_text(SAMPLE_TEXT)
@@ -36,10 +55,99 @@ class TestDocParser(unittest.TestCase):
         self.assertEqual(entries[0]['description'], "Penyetaraan Desain")
         self.assertEqual(entries[0]['proof_link'], "https://link.com/proof1")
 
+    def test_streaming_matches_full_parse(self):
+        expected = parse_google_doc_text(SAMPLE_TEXT)
+        for size in (1, 7, 50, len(SAMPLE_TEXT)):
+            chunks = [SAMPLE_TEXT[i:i + size] for i in range(0, len(SAMPLE_TEXT), size)]
+            self.assertEqual(list(iter_google_doc_entries(chunks)), expected)
+
+    def test_synthetic_benchmark_doc_round_trip(self):
+        doc = generate_doc(500, seed=1)
+        entries = parse_google_doc_text(doc)
+        self.assertEqual(len(entries), 500)
+        self.assertTrue(all(e.date and e.start_min >= 0 and e.end_min > e.start_min for e in entries))
+        chunks = [doc[i:i + 997] for i in range(0, len(doc), 997)]
+        self.assertEqual(list(iter_google_doc_entries(chunks)), entries)
+
+    def test_streaming_yields_closed_blocks_early(self):
+        stream = iter_google_doc_entries(iter([SAMPLE_TEXT, "4 Februari 2026\n"]))
+        first = next(stream)
+        self.assertEqual(first['date_raw'], "2 Februari 2026")
+
+    def test_parse_cache_reuses_unchanged_blocks(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'parse_cache.json')
+            cache = DocParseCache(path)
+            expected = parse_google_doc_text(SAMPLE_TEXT)
+            self.assertEqual(parse_google_doc_text(SAMPLE_TEXT, cache=cache), expected)
+            cache.save()
+
+            cache = DocParseCache(path)
+            cache.load()
+            edited = SAMPLE_TEXT.replace("Teknologi Baru", "Teknologi Lama")
+            entries = parse_google_doc_text(edited, cache=cache)
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+            self.assertEqual(entries[:2], expected[:2])
+            self.assertEqual(entries[2]['description'], "Teknologi Lama")
+
+    def test_parse_cache_evicts_oldest_blocks(self):
+        cache = DocParseCache(os.devnull, max_blocks=1)
+        parse_google_doc_text(SAMPLE_TEXT, cache=cache)
+        self.assertEqual(len(cache.blocks), 1)
+
+    def test_date_window_skips_blocks_outside_range(self):
+        entries = parse_google_doc_text(SAMPLE_TEXT, date_from="2026-02-03", date_to="2026-02-10")
+        self.assertEqual([e['date_raw'] for e in entries], ["3 Februari 2026"])
+
+        entries = parse_google_doc_text(SAMPLE_TEXT, date_to="2026-02-02")
+        self.assertEqual(len(entries), 2)
+
+    def test_entry_integer_fields_and_dict_compat(self):
+        entry = parse_google_doc_text(SAMPLE_TEXT)[1]
+        self.assertEqual((entry.start_min, entry.end_min), (14 * 60, 17 * 60))
+        self.assertEqual(entry['date'], "2026-02-02")
+        self.assertEqual(entry.get('end_time'), "17:00")
+
+        slot = ExistingSlot.from_times("7:30", "13:00")
+        self.assertEqual(slot, {'start': '07:30', 'end': '13:00'})
+        self.assertEqual(ExistingSlot.holiday()['start'], 'HOLIDAY')
+
+    def test_editor_chrome_is_skipped(self):
+        pos, endpos = find_content_bounds(EDITOR_TEXT)
+        self.assertTrue(EDITOR_TEXT[pos:endpos].strip().startswith("2 Februari 2026"))
+        self.assertTrue(EDITOR_TEXT[pos:endpos].strip().endswith("Dibagikan dengan tim"))
+        self.assertEqual(find_content_bounds(SAMPLE_TEXT), (0, len(SAMPLE_TEXT)))
+
+        entries = parse_google_doc_text(EDITOR_TEXT)
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]['description'], "Dibagikan dengan tim")
+
+    def test_extra_noise_patterns(self):
+        try:
+            set_extra_noise_patterns([r'dibagikan dengan'])
+            entries = parse_google_doc_text(EDITOR_TEXT)
+            self.assertEqual(entries[0]['description'], "")
+        finally:
+            set_extra_noise_patterns([])
+
     def test_date_normalization(self):
         self.assertEqual(normalize_date("2 Februari 2026"), "2026-02-02")
         self.assertEqual(normalize_date("2026-02-02"), "2026-02-02")
         self.assertEqual(normalize_date("31 Januari 2026"), "2026-01-31")
+        self.assertEqual(normalize_date("1 Jan 2026"), "2026-01-01")
+        self.assertEqual(normalize_date("2026/2/1"), "2026-02-01")
+        self.assertEqual(normalize_date("1-2-2026"), "2026-02-01")
+        self.assertEqual(normalize_date("1 1 2026"), "2026-01-01")
+        self.assertEqual(normalize_date("2 Brumaire 2026"), "")
+        self.assertEqual(normalize_dates(["2 Februari 2026", "2 Februari 2026", "x"]),
+                         ["2026-02-02", "2026-02-02", ""])
+
+    def test_time_normalization(self):
+        self.assertEqual(normalize_time("0730"), "07:30")
+        self.assertEqual(normalize_time("7.30"), "07:30")
+        self.assertEqual(normalize_time("730"), "07:30")
+        self.assertEqual(normalize_time("13:00"), "13:00")
+        self.assertEqual(normalize_time("abc"), "abc")
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+from src.planner import (plan_sync, summarize, CREATE, SKIP, CONFLICT, OUTSIDE_WINDOW, WEEKEND,
+                         HOLIDAY_DATE, ON_CALENDAR, DUPLICATE_IN_DOC, INVALID_ACTION_PLAN, NOT_SCANNED,
+                         OVERLAPS_CALENDAR, OVERLAPS_DOC)
+from src.entry import Entry, ExistingSlot
+
+MON, TUE, WED, SAT = 739649, 739650, 739651, 739654   # 2026-02-02 .. 2026-02-07
+WINDOW = ('2026-02-02', '2026-02-08')
+
+
+def entry(ordinal, start, end, category='Kegiatan'):
+    return Entry('raw', ordinal, start, end, category)
+
+
+class TestPlanner(unittest.TestCase):
+    def test_plan_operations(self):
+        existing = {
+            '2026-02-02': [ExistingSlot.from_times('07:30', '13:00')],
+            '2026-02-03': [ExistingSlot.holiday()],
+        }
+        entries = [
+            entry(MON, 780, 960, 'Coding'),            # create
+            entry(MON, 450, 780, 'Meeting'),           # already on the calendar
+            entry(MON, 480, 720, 'Rapat'),             # partial overlap with the calendar
+            entry(TUE, 450, 960),                      # holiday
+            entry(WED, 450, 780, 'Apel'),              # create
+            entry(WED, 450, 780, 'Apel'),              # repeated in the doc
+            entry(WED, 720, 840, 'Coding'),            # overlaps the doc entry above
+            entry(SAT, 450, 960),                      # weekend
+            entry(MON - 7, 450, 960),                  # outside the window
+        ]
+        ops = plan_sync(entries, existing, WINDOW)
+        got = [(op.entry.date_ord, op.entry.start_min, op.action, op.reason) for op in ops]
+        self.assertEqual(got, [
+            (MON - 7, 450, SKIP, OUTSIDE_WINDOW),
+            (MON, 450, SKIP, ON_CALENDAR),
+            (MON, 480, CONFLICT, OVERLAPS_CALENDAR),
+            (MON, 780, CREATE, ''),
+            (TUE, 450, SKIP, HOLIDAY_DATE),
+            (WED, 450, CREATE, ''),
+            (WED, 450, SKIP, DUPLICATE_IN_DOC),
+            (WED, 720, CONFLICT, OVERLAPS_DOC),
+            (SAT, 450, SKIP, WEEKEND),
+        ])
+        self.assertEqual(summarize(ops), {CREATE: 2, SKIP: 5, CONFLICT: 2})
+        self.assertIn("Bentrok dengan kalender 07:30-13:00", ops[2].describe())
+
+    def test_known_holidays(self):
+        ops = plan_sync([entry(WED, 450, 960)], {}, WINDOW, holidays={'2026-02-04'})
+        self.assertEqual((ops[0].action, ops[0].reason), (SKIP, HOLIDAY_DATE))
+
+    def test_unscanned_week_is_not_created(self):
+        ops = plan_sync([entry(MON, 450, 960), entry(WED, 450, 960)], {}, WINDOW,
+                        unscanned={'2026-02-04'})
+        self.assertEqual([(op.action, op.reason) for op in ops], [(CREATE, ''), (SKIP, NOT_SCANNED)])
+
+    def test_action_plans_resolved_while_planning(self):
+        entries = [Entry('raw', MON, 450, 600, 'A', action_plan='2'),
+                   Entry('raw', TUE, 450, 600, 'B', action_plan='5'),
+                   Entry('raw', WED, 450, 600, 'C', action_plan='Rapat')]
+        options = ['Laporan', 'Rapat koordinasi']
+        ops = plan_sync(entries, {}, WINDOW, action_plans=options)
+        self.assertEqual([(op.action, op.reason) for op in ops],
+                         [(CREATE, ''), (SKIP, INVALID_ACTION_PLAN), (CREATE, '')])
+        # Unknown option list: nothing is rejected
+        self.assertEqual(summarize(plan_sync(entries, {}, WINDOW))[CREATE], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
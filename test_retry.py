@@ -0,0 +1,43 @@
+import unittest
+from src.retry import (RetryPolicy, run_with_retries, classify_error, classify_status,
+                       TRANSIENT, PERMANENT)
+
+
+class TestRetry(unittest.TestCase):
+    def test_classification(self):
+        self.assertEqual(classify_status(503), TRANSIENT)
+        self.assertEqual(classify_status(429), TRANSIENT)
+        self.assertEqual(classify_status(422), PERMANENT)
+        self.assertEqual(classify_status(200), PERMANENT)  # 2xx with an error body
+        self.assertEqual(classify_error(TimeoutError("Timeout 5000ms exceeded.")), TRANSIENT)
+        self.assertEqual(classify_error(RuntimeError("Target page, context or browser has been closed")), PERMANENT)
+
+    def test_backoff_is_bounded(self):
+        policy = RetryPolicy(max_attempts=6, base_delay=1.0, max_delay=5.0)
+        self.assertEqual([policy.delay(n) for n in range(1, 6)], [1.0, 2.0, 4.0, 5.0, 5.0])
+
+    def test_transient_failure_recovers(self):
+        results = iter([(False, TRANSIENT), (False, None), (True, None)])
+        calls, slept = [], []
+        ok, attempts, kind = run_with_retries(lambda n: next(results), RetryPolicy(max_attempts=3),
+                                              recover=lambda: calls.append('recover') or True,
+                                              sleep=slept.append)
+        self.assertEqual((ok, attempts, kind), (True, 3, None))
+        self.assertEqual(calls, ['recover', 'recover'])
+        self.assertEqual(slept, [1.0, 2.0])
+
+    def test_permanent_failure_and_exhaustion(self):
+        ok, attempts, kind = run_with_retries(lambda n: (False, PERMANENT), RetryPolicy(3), sleep=lambda s: None)
+        self.assertEqual((ok, attempts, kind), (False, 1, PERMANENT))
+
+        ok, attempts, kind = run_with_retries(lambda n: (False, TRANSIENT), RetryPolicy(2), sleep=lambda s: None)
+        self.assertEqual((ok, attempts, kind), (False, 2, TRANSIENT))
+
+    def test_failed_recovery_stops(self):
+        ok, attempts, _ = run_with_retries(lambda n: (False, TRANSIENT), RetryPolicy(3),
+                                           recover=lambda: False, sleep=lambda s: None)
+        self.assertEqual((ok, attempts), (False, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
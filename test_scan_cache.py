@@ -0,0 +1,56 @@
+import os
+import time
+import tempfile
+import unittest
+from datetime import date
+from src.scan_cache import CalendarScanCache, week_key
+from src.entry import ExistingSlot
+
+MONDAY = date(2026, 2, 2)
+
+
+class TestCalendarScanCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'calendar_cache.json')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_week_key(self):
+        self.assertEqual(week_key(date(2026, 2, 6)), '2026-W06')
+        self.assertEqual(week_key(date(2027, 1, 1)), '2026-W53')
+
+    def test_round_trip_and_write_through(self):
+        cache = CalendarScanCache(self.path)
+        cache.put_week(MONDAY, {
+            '2026-02-02': [ExistingSlot.from_times('07:30', '13:00')],
+            '2026-02-03': [ExistingSlot.holiday()],
+            '2026-02-09': [ExistingSlot.from_times('07:30', '16:00')],  # Next week, ignored
+        })
+        cache.add_slot('2026-02-04', ExistingSlot.from_times('07:30', '16:00'))
+        cache.add_slot('2026-03-02', ExistingSlot.from_times('07:30', '16:00'))  # Never scanned
+        cache.save()
+
+        loaded = CalendarScanCache(self.path)
+        loaded.load()
+        week = loaded.get_week(MONDAY)
+        self.assertEqual(sorted(week), ['2026-02-02', '2026-02-03', '2026-02-04'])
+        self.assertEqual(week['2026-02-04'], [{'start': '07:30', 'end': '16:00'}])
+        self.assertTrue(week['2026-02-03'][0].is_holiday)
+        self.assertIsNone(loaded.get_week(date(2026, 3, 2)))
+
+        loaded.set_day('2026-02-02', [])
+        self.assertNotIn('2026-02-02', loaded.get_week(MONDAY))
+
+    def test_expired_weeks_are_ignored(self):
+        cache = CalendarScanCache(self.path, ttl_hours=1)
+        cache.put_week(MONDAY, {})
+        self.assertEqual(cache.get_week(MONDAY), {})
+        cache.weeks[week_key(MONDAY)]['scanned_at'] = time.time() - 7200
+        self.assertIsNone(cache.get_week(MONDAY))
+        self.assertIsNone(CalendarScanCache(self.path, ttl_hours=0).get_week(MONDAY))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from src.selector_registry import SelectorRegistry, FIELD_RULES
+
+
+class _StatusPage:
+    """Answers the registry's single evaluate call with canned field states."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def evaluate(self, script, rules):
+        self.calls += 1
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class TestSelectorRegistry(unittest.TestCase):
+    def test_counters_and_css(self):
+        first = {field: 'miss' for field in FIELD_RULES}
+        first['action_plan'] = 'missing'
+        second = {field: 'hit' for field in FIELD_RULES}
+        page = _StatusPage(first, second, RuntimeError("page closed"))
+        registry = SelectorRegistry(page)
+
+        self.assertTrue(registry.ensure())
+        self.assertEqual(registry.css('start'), '[data-dr-field="start"]')
+        self.assertIsNone(registry.css('action_plan'))
+
+        self.assertTrue(registry.ensure())
+        self.assertEqual((registry.hits, registry.misses, registry.missing), (7, 6, 1))
+
+        # A failed evaluate drops all tags so callers use their XPath fallbacks
+        self.assertFalse(registry.ensure())
+        self.assertIsNone(registry.css('start'))
+        self.assertEqual(page.calls, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import tempfile
+import unittest
+from src.session_store import SessionStore
+
+STATE = {'cookies': [{'name': 'SESSION', 'value': 'rahasia-123', 'domain': 'asndigital.bkn.go.id'}],
+         'origins': []}
+
+
+def _xor(data: bytes) -> bytes:
+    # Stand-in cipher for the tests; the app uses DPAPI
+    return bytes(b ^ 0x5A for b in data)
+
+
+class TestSessionStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'session_state.bin')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def store(self, **kwargs):
+        return SessionStore(self.path, protect=_xor, unprotect=_xor, **kwargs)
+
+    def test_round_trip_is_encrypted_at_rest(self):
+        self.assertTrue(self.store().save('199001012020011001', STATE))
+        with open(self.path, 'rb') as f:
+            self.assertNotIn(b'rahasia-123', f.read())
+        self.assertEqual(self.store().load('199001012020011001'), STATE)
+
+    def test_other_user_and_expired_sessions_are_ignored(self):
+        self.store().save('199001012020011001', STATE)
+        self.assertIsNone(self.store().load('198512312010121002'))
+        self.assertIsNone(self.store(max_age_hours=0).load('199001012020011001'))
+
+    def test_corrupt_file_and_clear(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'DRS1not-a-session')
+        self.assertIsNone(self.store().load('u'))
+        self.store().clear()
+        self.assertFalse(os.path.exists(self.path))
+
+    @unittest.skipIf(os.name == 'nt', "DPAPI is available on Windows")
+    def test_nothing_persisted_without_encryption(self):
+        store = SessionStore(self.path)
+        self.assertFalse(store.available)
+        self.assertFalse(store.save('u', STATE))
+        self.assertFalse(os.path.exists(self.path))
+
+    @unittest.skipUnless(os.name == 'nt', "DPAPI requires Windows")
+    def test_dpapi_round_trip(self):
+        store = SessionStore(self.path)
+        store.save('u', STATE)
+        self.assertEqual(store.load('u'), STATE)
+
+
+if __name__ == '__main__':
+    unittest.main()